@@ -0,0 +1,69 @@
+"""
+MySqlStorage 저장 경로 벤치마크
+- ORM merge 경로와 Core 벌크 Upsert 경로를 같은 데이터(최초 저장, 변경 재저장, 동일 재저장)로 비교합니다.
+- 기본은 임시 SQLite 파일 DB이며, --db-url 로 MySQL을 지정할 수 있습니다. (테이블 내용이 덮어써짐)
+
+실행: python -m benchmarks.bench_bulk_upsert --notices 2000
+"""
+import os
+import sys
+import time
+import json
+import argparse
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.models.bid_notice import BidNotice, BidDetail, BidAttachment
+from src.storage.mysql_storage import MySqlStorage
+from src.storage.entities import Base
+
+
+def build_notices(n: int, revision: int = 0):
+    return [
+        BidNotice(
+            notice_code=f"BENCH{i:08d}", degree="000", title=f"벤치마크 공고 {i} r{revision}", status="게시",
+            category="공사", process_type="등록공고",
+            detail_info=BidDetail(client_name=f"단지 {i}", budget_amt=1000 * i, base_price=900 * i),
+            attachments=[BidAttachment(file_name=f"file{j}.pdf", file_size=f"{j + revision}KB") for j in range(3)],
+        )
+        for i in range(n)
+    ]
+
+
+def measure(db_url: str, bulk: bool, notices: int, chunk_size: int) -> dict:
+    storage = MySqlStorage(db_url, bulk_upsert=bulk, chunk_size=chunk_size)
+    storage.connect()
+    Base.metadata.drop_all(bind=storage.engine)
+    Base.metadata.create_all(bind=storage.engine)
+    try:
+        timings = {}
+        for label, revision in (('insert', 0), ('update', 1), ('unchanged', 1)):
+            data = build_notices(notices, revision)
+            start = time.perf_counter()
+            storage.save(data)
+            elapsed = time.perf_counter() - start
+            timings[f'{label}_per_sec'] = round(notices / elapsed, 1)
+        return timings
+    finally:
+        storage.close()
+
+
+def run(db_url: str, notices: int, chunk_size: int) -> dict:
+    return {
+        'notices': notices,
+        'orm_merge': measure(db_url, False, notices, chunk_size),
+        'bulk_upsert': measure(db_url, True, notices, chunk_size),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Storage upsert benchmark")
+    parser.add_argument("--notices", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--db-url", type=str, default="")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.db_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        print(json.dumps(run(url, args.notices, args.chunk_size), indent=2))
@@ -0,0 +1,62 @@
+"""
+NuriDetailExtractor 마이크로 벤치마크
+- 라벨별 Locator 방식(extract_all_by_locators)과 evaluate 1회 방식(extract_all)을 같은 페이지에서 비교합니다.
+- 네트워크 없이 page.set_content 로 만든 상세 페이지를 사용합니다.
+
+실행: python -m benchmarks.bench_detail_extractor --pages 20
+"""
+import os
+import sys
+import time
+import json
+import logging
+import argparse
+
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from playwright.sync_api import sync_playwright
+from src.crawlers.components.nuri_detail_extractor import NuriDetailExtractor
+from benchmarks.fixtures import build_detail_html
+
+LIST_DATA = {'title': '목록 제목', 'notice_code_full': 'R26BK00000001-000', 'date_posted': '2026-02-03'}
+
+
+def run(pages: int) -> dict:
+    extractor = NuriDetailExtractor(logging.getLogger("bench"))
+    timings = {'locators': 0.0, 'snapshot': 0.0}
+
+    with sync_playwright() as pw:
+        browser = pw.chromium.launch(headless=True)
+        page = browser.new_page()
+        try:
+            for n in range(1, pages + 1):
+                page.set_content(build_detail_html(n))
+
+                start = time.perf_counter()
+                expected = extractor.extract_all_by_locators(page, LIST_DATA)
+                timings['locators'] += time.perf_counter() - start
+
+                start = time.perf_counter()
+                actual = extractor.extract_all(page, LIST_DATA)
+                timings['snapshot'] += time.perf_counter() - start
+
+                if actual != expected:
+                    diff = {k: (expected.get(k), actual.get(k)) for k in expected.keys() | actual.keys()
+                            if expected.get(k) != actual.get(k)}
+                    raise AssertionError(f"Output mismatch on page {n}: {diff}")
+        finally:
+            browser.close()
+
+    return {
+        'pages': pages,
+        'locators_ms_per_page': round(timings['locators'] / pages * 1000, 2),
+        'snapshot_ms_per_page': round(timings['snapshot'] / pages * 1000, 2),
+        'speedup': round(timings['locators'] / timings['snapshot'], 1) if timings['snapshot'] else None,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NuriDetailExtractor micro-benchmark")
+    parser.add_argument("--pages", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(run(args.pages), indent=2))
@@ -0,0 +1,175 @@
+"""
+NuriCrawler 종단 간 벤치마크 (로컬 누리장터 유사 사이트 대상, 네트워크/DB 불필요)
+- 유사 사이트(benchmarks.standin_site)를 띄우고 config/ 설정에서 접속 주소와 상태 파일 경로만 바꾸어 전체 수집을 실행합니다.
+- 초당 수집 건수, 구간별 소요 시간(src.utils.metrics), 최대 RSS를 JSON으로 저장합니다.
+- --baseline 으로 이전 결과를 지정하면 비교표를 출력하고, 처리량이 --max-regression 비율 이상 떨어지면 종료 코드 1을 반환합니다.
+
+실행: python -m benchmarks.bench_end_to_end --notices 300 --latency-ms 80 --jitter-ms 40 \\
+        --output benchmarks/results/e2e.json --baseline benchmarks/results/baseline.json
+"""
+import os
+import sys
+import time
+import json
+import logging
+import argparse
+import platform
+import subprocess
+import tempfile
+from typing import Dict, Any, Optional
+
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.utils.config_loader import load_app_config
+from src.crawlers.nuri_crawler import NuriCrawler
+from src.utils.metrics import METRICS
+from benchmarks.standin_site import StandInSite
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+
+
+def peak_rss_mb() -> Dict[str, Optional[float]]:
+    """최대 RSS (python: 현재 프로세스, children: 종료된 하위 프로세스 중 최대 - 브라우저/드라이버)"""
+    if resource is None:
+        return {'python': None, 'children': None}
+    # Linux는 KB, macOS는 byte 단위
+    unit = 1 if sys.platform == "darwin" else 1024
+    return {
+        'python': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit / 2 ** 20, 1),
+        'children': round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit / 2 ** 20, 1),
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip()
+    except Exception:
+        return ""
+
+
+def build_config(args, base_url: str, work_dir: str) -> Dict[str, Any]:
+    """config/ 설정을 유사 사이트 실행용으로 변경 (수집 방식 관련 설정은 그대로 사용)"""
+    config = load_app_config(args.config_dir)
+    crawler = config['system']['crawler']
+    crawler['base_url'] = base_url
+    crawler['state_file'] = os.path.join(work_dir, "crawling_state.json")
+    crawler['spool'] = {**crawler.get('spool', {}), 'path': ""}
+    crawler['sharding'] = {**crawler.get('sharding', {}), 'enabled': False}
+    crawler['detail_workers'] = args.detail_workers
+    crawler.setdefault('grid_capture', {})['enabled'] = args.grid_capture
+    replay = crawler.setdefault('detail_replay', {})
+    replay.update(enabled=args.replay, attachments_key="fileList", attachment_name="fileNm", attachment_url="fileUrl")
+    attachments = crawler.setdefault('attachments', {})
+    attachments.update(enabled=args.attachments, dir=os.path.join(work_dir, "attachments"))
+
+    config['system'].setdefault('playwright', {})['headless'] = not args.headed
+    if args.no_rate_control:
+        config['system'].setdefault('waits', {}).setdefault('rate_control', {})['enabled'] = False
+
+    config['search'] = {**config.get('search', {}), 'keyword': "", 'rows_per_page': args.rows_per_page}
+    return config
+
+
+def run(args) -> Dict[str, Any]:
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    METRICS.enabled = True
+    METRICS.reset()
+
+    with tempfile.TemporaryDirectory() as work_dir, \
+            StandInSite(args.notices, args.latency_ms, args.jitter_ms, args.popups, seed=args.seed) as site:
+        crawler = NuriCrawler(build_config(args, site.url, work_dir))
+
+        start = time.perf_counter()
+        rows = sum(1 for _ in crawler.run())
+        elapsed = time.perf_counter() - start
+        requests = dict(site.counts)
+
+    summary = METRICS.summary()
+    return {
+        'benchmark': 'end_to_end',
+        'commit': git_commit(),
+        'created_at': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': platform.python_version(),
+        'params': {
+            'notices': args.notices, 'latency_ms': args.latency_ms, 'jitter_ms': args.jitter_ms,
+            'popups': args.popups, 'rows_per_page': args.rows_per_page, 'detail_workers': args.detail_workers,
+            'grid_capture': args.grid_capture, 'replay': args.replay, 'attachments': args.attachments,
+            'rate_control': not args.no_rate_control,
+        },
+        'rows': rows,
+        'elapsed_seconds': round(elapsed, 3),
+        'rows_per_sec': round(rows / elapsed, 3) if elapsed else 0.0,
+        'site_requests': requests,
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': summary['stages'],
+        'counters': summary['counters'],
+    }
+
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> bool:
+    """기준 결과와 비교표 출력 (처리량 하락이 max_regression 이내면 True)"""
+    print(f"{'metric':<40}{'baseline':>12}{'current':>12}{'change':>10}")
+
+    def line(name: str, before: Optional[float], after: Optional[float]):
+        change = f"{(after - before) / before:+.1%}" if before and after is not None else "-"
+        print(f"{name:<40}{before if before is not None else '-':>12}{after if after is not None else '-':>12}{change:>10}")
+
+    line("rows_per_sec", baseline.get('rows_per_sec'), result['rows_per_sec'])
+    line("elapsed_seconds", baseline.get('elapsed_seconds'), result['elapsed_seconds'])
+    for key in ('python', 'children'):
+        line(f"peak_rss_mb.{key}", baseline.get('peak_rss_mb', {}).get(key), result['peak_rss_mb'][key])
+    for name in sorted(result['stages'].keys() | baseline.get('stages', {}).keys()):
+        before = baseline.get('stages', {}).get(name, {}).get('avg')
+        after = result['stages'].get(name, {}).get('avg')
+        line(f"{name}.avg", before, after)
+
+    if baseline.get('params') != result['params']:
+        print("WARNING: benchmark parameters differ from the baseline.")
+    before = baseline.get('rows_per_sec') or 0.0
+    return not before or result['rows_per_sec'] >= before * (1 - max_regression)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NuriCrawler end-to-end benchmark against a local stand-in site")
+    parser.add_argument("--config-dir", type=str, default=os.path.join(ROOT, "config"))
+    parser.add_argument("--notices", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--popups", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rows-per-page", type=str, default="max")
+    parser.add_argument("--detail-workers", type=int, default=1)
+    parser.add_argument("--grid-capture", action="store_true")
+    parser.add_argument("--replay", action="store_true")
+    parser.add_argument("--attachments", action="store_true")
+    parser.add_argument("--no-rate-control", action="store_true")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--quiet", action="store_true")
+    parser.add_argument("--output", type=str, default="",
+                        help="결과 JSON 경로 (기본: benchmarks/results/e2e_<시각>.json)")
+    parser.add_argument("--baseline", type=str, default="", help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.1,
+                        help="허용 처리량 하락 비율 (기준 대비)")
+    args = parser.parse_args()
+
+    result = run(args)
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"e2e_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(json.dumps({k: result[k] for k in ('rows', 'elapsed_seconds', 'rows_per_sec', 'peak_rss_mb')}, indent=2))
+    print(f"Saved: {output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            ok = compare(result, json.load(f), args.max_regression)
+        if not ok:
+            print(f"FAIL: rows_per_sec regressed more than {args.max_regression:.0%}.")
+            sys.exit(1)
@@ -0,0 +1,67 @@
+"""
+상세 HTML 파서 벤치마크 (브라우저 없음)
+- 백엔드별(stdlib / lxml) 페이지당 파싱 시간을 같은 변형 묶음으로 비교합니다.
+- 스냅샷 저장소에 묶음을 저장한 뒤 DetailBatchParser 프로세스 수별 처리량(페이지/초)을 측정합니다.
+
+실행: python -m benchmarks.bench_html_parser --pages 2000 --workers 1 2 4
+"""
+import os
+import sys
+import time
+import json
+import logging
+import argparse
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.crawlers.components.detail_html import parse_detail_html, available_backends
+from src.crawlers.components.detail_batch_parser import DetailBatchParser
+from src.crawlers.components.snapshot_store import DetailSnapshotStore
+from benchmarks.fixtures import build_detail_corpus
+
+BASE_URL = "https://nuri.g2b.go.kr/"
+
+
+def bench_backends(corpus) -> dict:
+    result = {}
+    for backend in available_backends():
+        start = time.perf_counter()
+        for html in corpus:
+            parse_detail_html(html, BASE_URL, backend=backend)
+        result[f"{backend}_ms_per_page"] = round((time.perf_counter() - start) / len(corpus) * 1000, 3)
+    return result
+
+
+def bench_batch(corpus, workers_list, chunk_size: int, backend: str) -> dict:
+    logger = logging.getLogger("bench")
+    result = {}
+    with tempfile.TemporaryDirectory() as root:
+        store = DetailSnapshotStore(root, logger)
+        for n, html in enumerate(corpus, 1):
+            store.put({'notice_code_full': f'R26BK{n:08d}-000', 'title': f'공고 {n}'}, html, BASE_URL)
+        snapshots = store.latest()
+        store.close()
+
+        for workers in workers_list:
+            parser = DetailBatchParser(logger, workers=workers, chunk_size=chunk_size, backend=backend)
+            start = time.perf_counter()
+            parsed = sum(1 for _, raw in parser.parse(root, snapshots) if raw)
+            elapsed = time.perf_counter() - start
+            result[f"workers_{workers}_pages_per_sec"] = round(parsed / elapsed, 1) if elapsed else None
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detail HTML parser benchmark")
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--chunk", type=int, default=200)
+    parser.add_argument("--backend", default="auto")
+    args = parser.parse_args()
+
+    corpus = build_detail_corpus(args.pages)
+    report = {'pages': args.pages, 'cpu_count': os.cpu_count()}
+    report.update(bench_backends(corpus))
+    report.update(bench_batch(corpus, args.workers, args.chunk, args.backend))
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,91 @@
+"""
+BidNotice 생성 / 저장 행 변환 비용 벤치마크 (브라우저/DB 없음)
+- 생성: 검증 경로(BidFactory.create_bid_notice)와 검증 생략(model_construct)의 객체당 비용을 비교합니다.
+- 저장 행: 내용 해시를 json.dumps(sort_keys)로 직렬화하던 이전 방식과 현재 방식(pydantic_core.to_json)을 비교하고,
+  두 방식의 해시가 같은지 확인합니다.
+- Raw Data 는 변형 상세 페이지 묶음을 extract_from_html 로 파싱해 만듭니다.
+
+실행: python -m benchmarks.bench_model_construction --notices 5000 --repeat 5
+"""
+import os
+import sys
+import time
+import json
+import hashlib
+import logging
+import argparse
+
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.models.bid_notice import BidNotice, BidDetail, BidAttachment
+from src.crawlers.components.bid_factory import BidFactory
+from src.crawlers.components.nuri_detail_extractor import NuriDetailExtractor
+from src.storage.mysql_mapper import MySqlBidMapper, HASH_EXCLUDE
+from benchmarks.fixtures import build_detail_corpus
+
+
+def build_raw_data(notices: int):
+    extractor = NuriDetailExtractor(logging.getLogger("bench"))
+    raws = []
+    for n, html in enumerate(build_detail_corpus(notices), 1):
+        list_data = {'title': f'공고 {n}', 'notice_code_full': f'R26BK{n:08d}-000', 'date_posted': '2026/02/03',
+                     'category': '공사', 'process_type': '등록공고'}
+        raws.append(extractor.extract_from_html(html, list_data, "https://nuri.g2b.go.kr/"))
+    return raws
+
+
+def legacy_content_hash(dto: BidNotice) -> str:
+    """이전 내용 해시 (json.dumps 직렬화)"""
+    data = dto.model_dump(mode="json", exclude=HASH_EXCLUDE)
+    data['attachments'] = sorted(data['attachments'], key=lambda a: (a['file_name'], a.get('file_size') or ''))
+    text = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def construct(bid: BidNotice) -> BidNotice:
+    """검증 없이 같은 모델 생성 (model_construct)"""
+    values = dict(bid)
+    values['detail_info'] = BidDetail.model_construct(**dict(bid.detail_info))
+    values['attachments'] = [BidAttachment.model_construct(**dict(a)) for a in bid.attachments]
+    return BidNotice.model_construct(**values)
+
+
+def per_object_us(func, items, repeat: int) -> float:
+    """항목당 최소 시간 (repeat회 반복)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return round(best / len(items) * 1e6, 1)
+
+
+def run(notices: int, repeat: int = 5) -> dict:
+    raws = build_raw_data(notices)
+    mapper = MySqlBidMapper()
+    bids = [BidFactory.create_bid_notice(raw) for raw in raws]
+
+    # 해시가 바뀌면 저장된 공고가 모두 변경으로 판정되므로 먼저 확인
+    if [legacy_content_hash(b) for b in bids] != [mapper.content_hash(b) for b in bids]:
+        raise AssertionError("content_hash differs from the legacy json.dumps hash")
+
+    result = {
+        'notices': notices,
+        'construct_validated_us': per_object_us(BidFactory.create_bid_notice, raws, repeat),
+        'construct_model_construct_us': per_object_us(construct, bids, repeat),
+        'content_hash_legacy_us': per_object_us(legacy_content_hash, bids, repeat),
+        'content_hash_us': per_object_us(mapper.content_hash, bids, repeat),
+        'to_rows_us': per_object_us(mapper.to_rows, bids, repeat),
+    }
+    result['to_rows_legacy_us'] = round(
+        result['to_rows_us'] - result['content_hash_us'] + result['content_hash_legacy_us'], 1)
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BidNotice construction / row mapping benchmark")
+    parser.add_argument("--notices", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(args.notices, args.repeat), indent=2))
@@ -0,0 +1,98 @@
+"""벤치마크/테스트용 누리장터 유사 HTML 생성기"""
+from typing import List, Tuple
+
+# 상세 페이지 표 (라벨, 값) - 실제 화면처럼 FIELD_CONFIG 외 라벨과 줄바꿈 노이즈를 포함
+DETAIL_ROWS: List[Tuple[str, str]] = [
+    ("입찰공고번호", "R26BK{n:08d}-000"),
+    ("공고구분", "등록공고"),
+    ("공고종류", "실공고"),
+    ("문서번호", "제2026-{n}호"),
+    ("공고기관", "누리아파트 입주자대표회의"),
+    ("수요기관", "누리아파트 관리사무소"),
+    ("담당부서", "관리사무소"),
+    ("담당자", "홍길동\n(02-000-0000)"),
+    ("게시일시", "2026/02/03 10:00"),
+    ("입찰서접수개시일시", "2026/02/04 09:00"),
+    ("입찰서접수마감일시", "2026/02/10 18:00"),
+    ("개찰일시", "2026/02/11 11:00"),
+    ("계약방법", "제한경쟁"),
+    ("입찰방식", "전자입찰"),
+    ("낙찰자결정방법", "적격심사제"),
+    ("재입찰허용여부", "허용"),
+    ("배정예산", "{budget:,}원"),
+    ("기초금액", "{base:,}원"),
+    ("현장설명회대상여부", "예"),
+    ("현장설명회장소", "관리사무소 회의실"),
+    ("납품장소", "서울특별시 중구 세종대로 {n}"),
+    ("지역제한", "서울특별시"),
+    ("업종제한", "실내건축공사업"),
+    ("비고", "-"),
+]
+
+
+def detail_rows(n: int) -> List[Tuple[str, str]]:
+    """n번째 공고의 상세 표 (라벨, 값)"""
+    return [(label, value.format(n=n, budget=100_000_000 + n, base=90_000_000 + n)) for label, value in DETAIL_ROWS]
+
+
+def build_detail_html(n: int = 1, attachments: int = 3) -> str:
+    """상세 페이지 HTML (헤더 제목, th/td 표, 첨부파일 링크 포함)"""
+    cells = []
+    for label, value in detail_rows(n):
+        text = value.replace("\n", "<br>")
+        cells.append(f"<th scope='row'>{label}</th><td>{text}</td>")
+
+    # 한 행에 th/td 두 쌍씩 배치
+    rows = ["<tr>" + "".join(cells[i:i + 2]) + "</tr>" for i in range(0, len(cells), 2)]
+
+    links = "".join(
+        f"<a href='#' onclick='return false;'>첨부{i}_규격서_{n}.pdf</a><br>" for i in range(attachments)
+    )
+    rows.append(f"<tr><th>첨부파일</th><td colspan='3'>{links}</td></tr>")
+
+    return f"""<!DOCTYPE html><html><head><meta charset="utf-8"><title>누리장터</title></head>
+<body>
+<div id="mf_wfm_cntsHeader"><h2 id="mf_wfm_cntsHeader_spnHeaderTitle">[테스트] 승강기 교체 공사 {n}입찰공고진행상세</h2></div>
+<div id="mf_wfm_container">
+  <table class="w2tb"><tbody>{''.join(rows)}</tbody></table>
+</div>
+</body></html>"""
+
+
+# 파서 백엔드 비교용 변형 (실제 화면에서 본 마크업 차이를 하나씩 섞음)
+VARIANTS = ("nested", "hidden", "entities", "comment", "orphan_th", "multi_attach", "hrefs", "whitespace", "no_title")
+
+
+def build_variant_html(n: int) -> str:
+    """n번째 변형 상세 페이지 HTML (VARIANTS[n % len(VARIANTS)] 규칙을 build_detail_html 에 적용)"""
+    variant = VARIANTS[n % len(VARIANTS)]
+    html = build_detail_html(n, attachments=2)
+    if variant == "nested":
+        html = html.replace("<td>홍길동<br>(02-000-0000)</td>",
+                            "<td><div><span>홍길동</span><div>(02-000-0000)</div></div></td>")
+    elif variant == "hidden":
+        html = html.replace("<td>실내건축공사업</td>",
+                            "<td>실내건축공사업<span style='display: none'>숨김 업종</span><script>var x=1;</script></td>")
+    elif variant == "entities":
+        html = html.replace("<td>관리사무소 회의실</td>", "<td>관리사무소&nbsp;회의실 &amp; 로비 &lt;1층&gt;</td>")
+    elif variant == "comment":
+        html = html.replace("<th scope='row'>계약방법</th>", "<th scope='row'>계약방법</th><!-- 계약방법 값 -->")
+    elif variant == "orphan_th":
+        html = html.replace("</tbody>", "<tr><th>안내</th></tr></tbody>")
+    elif variant == "multi_attach":
+        html = html.replace("</tbody>", f"<tr><th>첨부파일</th><td><a href='/files/{n}/extra.hwp'>추가_{n}.hwp</a></td>"
+                                        f"<td><a href='files/{n}/rel.zip'>상대경로_{n}.zip</a></td></tr></tbody>")
+    elif variant == "hrefs":
+        html = (html.replace("href='#' onclick='return false;'>첨부0", f"href='https://example.com/a/{n}.pdf'>첨부0")
+                .replace("href='#' onclick='return false;'>첨부1", "href='javascript:fnDown(1)'>첨부1"))
+    elif variant == "whitespace":
+        html = html.replace("<td>제한경쟁</td>", "<td>\n    제한경쟁\t \n  </td>").replace(
+            "<th scope='row'>입찰방식</th>", "<th scope='row'>\n  입찰방식  </th>")
+    elif variant == "no_title":
+        html = html.replace(" id=\"mf_wfm_cntsHeader_spnHeaderTitle\"", "")
+    return html
+
+
+def build_detail_corpus(count: int) -> List[str]:
+    """변형이 고르게 섞인 상세 페이지 HTML 묶음"""
+    return [build_variant_html(n) for n in range(1, count + 1)]
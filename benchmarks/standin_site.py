@@ -0,0 +1,442 @@
+"""
+누리장터 유사 로컬 사이트 (오프라인 벤치마크용)
+- 크롤러가 의존하는 구조만 재현합니다: 시작 팝업, 상단 메뉴, 상세조건 검색, grdBidPbancList 그리드,
+  w2pageList 페이지 목록(그룹 화살표, pageList 컴포넌트 API), 로딩 마스크, 상세 화면(th/td 표, 첨부파일 링크).
+- 화면은 한 문서 안에서 전환되고(상세 진입 시 pushState), 데이터는 /ws/ 아래 JSON API로 받습니다.
+  API 응답마다 latency ± jitter 만큼 지연합니다.
+- API 컬럼명은 system.yaml 의 grid_capture / detail_replay 기본 템플릿과 같으므로 두 모드도 그대로 측정할 수 있습니다.
+
+단독 실행: python -m benchmarks.standin_site --notices 300 --port 8080
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit, unquote
+
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from benchmarks.fixtures import detail_rows
+
+LIST_PATH = "/ws/selectBidPbancList.do"
+DETAIL_PATH = "/ws/selectBidPbancDtl.do"
+FILE_PATH = "/files/"
+
+# 페이지 목록 그룹 크기 (번호 10개씩 표시)
+PAGE_GROUP_SIZE = 10
+ROWS_PER_PAGE_OPTIONS = (10, 30, 50, 100)
+CATEGORIES = ("공사", "용역", "물품")
+
+# 상세 응답 컬럼 : 상세 표 라벨 (detail_replay.fields 기본 템플릿 기준)
+REPLAY_COLUMNS = {
+    "docNo": "문서번호",
+    "pbancInstNm": "담당부서",
+    "picNm": "담당자",
+    "dlvrPlcNm": "납품장소",
+    "asgnBdgtAmt": "배정예산",
+    "bssAmt": "기초금액",
+    "dmndInstNm": "수요기관",
+    "bidBgngDt": "입찰서접수개시일시",
+    "bidDdlnDt": "입찰서접수마감일시",
+    "onbsDt": "개찰일시",
+    "cntrctMthdNm": "계약방법",
+    "bidMthdNm": "입찰방식",
+    "sccbdrDcsnMthdNm": "낙찰자결정방법",
+}
+
+INDEX_HTML = """<!DOCTYPE html><html><head><meta charset="utf-8"><title>누리장터 (Stand-in)</title>
+<style>
+  .w2window { position: fixed; top: 40px; left: 40px; width: 320px; height: 160px; background: #fff; border: 1px solid #333; z-index: 10; }
+  .w2processbar { position: fixed; inset: 0; background: rgba(0, 0, 0, .1); z-index: 20; }
+  #gnbSub { display: none; }
+  .w2pageList_label { margin: 0 3px; cursor: pointer; }
+  .w2pageList_label_selected { font-weight: bold; }
+  table { border-collapse: collapse; }
+  th, td { border: 1px solid #ccc; padding: 2px 4px; }
+</style></head>
+<body>
+<div id="popups">__POPUPS__</div>
+<div id="mf_wfm___processbar" class="w2processbar" style="display:none">조회 중...</div>
+<div id="mf_wfm_gnb">
+  <button id="mf_wfm_gnb_wfm_gnbMenu_genDepth1_1_btn_menuLvl1">입찰공고</button>
+  <ul id="gnbSub"><li><a href="#" id="menuBidList">입찰공고목록</a></li></ul>
+</div>
+<div id="mf_wfm_cntsHeader"><h2 id="mf_wfm_cntsHeader_spnHeaderTitle">누리장터</h2></div>
+
+<div id="mf_wfm_container" style="display:none">
+  <div id="searchArea">
+    <button id="btnDetailCond">상세조건</button>
+    <table id="detailCond" style="display:none"><tbody>
+      <tr><td class="w2tb_th"><label for="mf_wfm_container_tbxBidPbancNm">입찰공고명</label></td>
+          <td><input id="mf_wfm_container_tbxBidPbancNm" type="text"></td></tr>
+      <tr><td class="w2tb_th">공고게시일자</td>
+          <td><input class="udcDateReadOnly" readonly title="시작 날짜" value="">
+              <input class="udcDateReadOnly" readonly title="종료 날짜" value="">
+              <button>1개월</button><button>3개월</button><button>6개월</button></td></tr>
+      __DROPDOWNS__
+      <tr><td class="w2tb_th"><label for="mf_wfm_container_selRecordCountPerPage">목록수</label></td>
+          <td><select id="mf_wfm_container_selRecordCountPerPage">__ROW_OPTIONS__</select></td></tr>
+    </tbody></table>
+    <button id="btnSearch">검색</button>
+  </div>
+  <div id="listArea">
+    <table id="mf_wfm_container_grdBidPbancList_body_table"><tbody></tbody></table>
+    <div id="mf_wfm_container_pagelist">
+      <a id="mf_wfm_container_pagelist_prev_btn" href="#" style="display:none">&lt;</a>
+      <span id="pageLabels"></span>
+      <a id="mf_wfm_container_pagelist_next_btn" href="#" style="display:none">&gt;</a>
+    </div>
+  </div>
+  <div id="detailArea" style="display:none">
+    <table class="w2tb"><tbody id="detailBody"></tbody></table>
+  </div>
+</div>
+
+<script>
+const GROUP = __GROUP__;
+const state = { page: 1, size: __DEFAULT_SIZE__, total: 0, keyword: '' };
+const $ = (id) => document.getElementById(id);
+const show = (el, on) => { el.style.display = on ? '' : 'none'; };
+
+async function api(path, body) {
+  show($('mf_wfm___processbar'), true);
+  try {
+    const resp = await fetch(path, { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify(body) });
+    if (!resp.ok) throw new Error('HTTP ' + resp.status);
+    return await resp.json();
+  } finally {
+    show($('mf_wfm___processbar'), false);
+  }
+}
+
+function esc(text) {
+  return String(text).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+}
+
+async function loadPage(page) {
+  const data = await api('__LIST_PATH__', { pageIndex: page, recordCountPerPage: state.size, bidPbancNm: state.keyword });
+  state.page = page;
+  state.total = data.totalCount;
+  const rows = data.bidPbancList.map((r) => {
+    const cells = new Array(20).fill('<td></td>');
+    cells[0] = '<td>' + r.rowNum + '</td>';
+    cells[1] = '<td>' + r.bidPbancNo + '-' + r.bidPbancOrd + '</td>';
+    cells[2] = '<td><a href="#" class="detailLink" data-no="' + r.bidPbancNo + '" data-ord="' + r.bidPbancOrd + '">' + esc(r.bidPbancNm) + '</a></td>';
+    cells[3] = '<td>' + esc(r.bidPbancPrcsSttsNm) + '</td>';
+    cells[4] = '<td>' + esc(r.bidClsfNm) + '</td>';
+    cells[19] = '<td>' + r.pbancPstgDt + '</td>';
+    return '<tr>' + cells.join('') + '</tr>';
+  });
+  document.querySelector('#mf_wfm_container_grdBidPbancList_body_table tbody').innerHTML = rows.join('');
+  renderPageList();
+}
+
+function renderPageList() {
+  const last = Math.max(1, Math.ceil(state.total / state.size));
+  const first = Math.floor((state.page - 1) / GROUP) * GROUP + 1;
+  const labels = [];
+  for (let p = first; p <= Math.min(last, first + GROUP - 1); p++) {
+    const cls = p === state.page ? 'w2pageList_label w2pageList_label_selected' : 'w2pageList_label';
+    labels.push('<a href="#" class="' + cls + '" data-page="' + p + '">' + p + '</a>');
+  }
+  $('pageLabels').innerHTML = labels.join('');
+  show($('mf_wfm_container_pagelist_prev_btn'), first > 1);
+  show($('mf_wfm_container_pagelist_next_btn'), first + GROUP <= last);
+}
+
+function showGroup(first) {
+  // 그룹 화살표: 다음/이전 그룹의 첫 페이지로 이동
+  loadPage(first);
+}
+
+// WebSquare pageList 컴포넌트 API (setSelectedIndex + onviewchange)
+window['mf_wfm_container_pagelist'] = {
+  _index: 1,
+  getSelectedIndex() { return state.page; },
+  setSelectedIndex(p) { this._index = p; },
+  trigger(name, args) { if (name === 'onviewchange') loadPage(this._index); }
+};
+
+async function openDetail(no, ord) {
+  history.pushState({ view: 'detail', no: no, ord: ord }, '', '#detail');
+  show($('listArea'), false);
+  show($('searchArea'), false);
+  $('mf_wfm_cntsHeader_spnHeaderTitle').innerText = '입찰공고';
+  const data = await api('__DETAIL_PATH__', { bidPbancNo: no, bidPbancOrd: ord });
+  const cells = data.dtlRows.map((r) => '<th scope="row">' + esc(r.label) + '</th><td>' + esc(r.value).replace(/\\n/g, '<br>') + '</td>');
+  const rows = [];
+  for (let i = 0; i < cells.length; i += 2) rows.push('<tr>' + cells.slice(i, i + 2).join('') + '</tr>');
+  const links = data.fileList.map((f) => '<a href="' + f.fileUrl + '">' + esc(f.fileNm) + '</a><br>').join('');
+  rows.push('<tr><th>첨부파일</th><td colspan="3">' + links + '</td></tr>');
+  $('detailBody').innerHTML = rows.join('');
+  show($('detailArea'), true);
+  // 제목은 표를 그린 뒤에 바꿈 (헤더의 '상세' 문구가 화면 전환 완료 신호)
+  $('mf_wfm_cntsHeader_spnHeaderTitle').innerText = data.dtlInfo.bidPbancNm + '입찰공고진행상세';
+}
+
+function showList() {
+  show($('detailArea'), false);
+  show($('listArea'), true);
+  show($('searchArea'), true);
+  $('mf_wfm_cntsHeader_spnHeaderTitle').innerText = '입찰공고목록';
+}
+
+window.addEventListener('popstate', (e) => {
+  if (!e.state || e.state.view !== 'detail') showList();
+});
+
+document.addEventListener('click', (e) => {
+  const t = e.target;
+  if (t.classList.contains('w2window_close')) {
+    t.closest('.w2window').style.display = 'none';
+  } else if (t.classList.contains('detailLink')) {
+    e.preventDefault();
+    openDetail(t.dataset.no, t.dataset.ord);
+  } else if (t.classList.contains('w2pageList_label')) {
+    e.preventDefault();
+    loadPage(parseInt(t.dataset.page, 10));
+  } else if (t.id === 'mf_wfm_container_pagelist_next_btn') {
+    e.preventDefault();
+    showGroup(Math.floor((state.page - 1) / GROUP) * GROUP + GROUP + 1);
+  } else if (t.id === 'mf_wfm_container_pagelist_prev_btn') {
+    e.preventDefault();
+    showGroup(Math.floor((state.page - 1) / GROUP) * GROUP - GROUP + 1);
+  } else if (t.id === 'menuBidList') {
+    e.preventDefault();
+    history.replaceState({ view: 'list' }, '', '#list');
+    show($('mf_wfm_container'), true);
+    showList();
+  } else if (t.id === 'btnDetailCond') {
+    show($('detailCond'), $('detailCond').style.display === 'none');
+  } else if (t.id === 'btnSearch') {
+    state.keyword = $('mf_wfm_container_tbxBidPbancNm').value;
+    state.size = parseInt($('mf_wfm_container_selRecordCountPerPage').value, 10);
+    loadPage(1);
+  }
+});
+
+$('mf_wfm_gnb_wfm_gnbMenu_genDepth1_1_btn_menuLvl1').addEventListener('mouseenter', () => show($('gnbSub'), true));
+</script>
+</body></html>"""
+
+# 검색 조건 드롭다운 (화면 라벨 : 옵션)
+# 검색 영역 라벨은 th가 아닌 td로 두어 상세 화면의 th 라벨 매칭에 섞이지 않도록 함
+DROPDOWNS = {
+    "공고분류": ["전체", "물품", "용역", "공사"],
+    "진행상태": ["전체", "입찰개시", "개찰중", "개찰완료"],
+    "공고구분": ["전체", "등록공고", "변경공고", "취소공고", "재공고"],
+    "공고종류": ["전체", "모의공고", "실공고"],
+    "계약방법": ["전체", "일반경쟁", "지명경쟁", "제한경쟁", "수의계약"],
+    "낙찰방법": ["전체", "적격심사제", "최저가낙찰제"],
+}
+
+
+class StandInSite:
+    """
+    누리장터 유사 사이트 서버 (별도 스레드에서 실행)
+    - notices: 전체 공고 수 (공고번호 R26BK00000001-000 부터)
+    - latency_ms / jitter_ms: /ws/ API 응답 지연 (균등 분포 latency ± jitter)
+    - popups: 시작 화면 팝업 수
+    """
+
+    def __init__(self, notices: int = 200, latency_ms: float = 50.0, jitter_ms: float = 20.0, popups: int = 2,
+                 attachments: int = 2, file_size: int = 16384, seed: int = 0, port: int = 0):
+        self.notices = notices
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.popups = popups
+        self.attachments = attachments
+        self.file_size = file_size
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts = {'list': 0, 'detail': 0, 'file': 0}
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self._index_html = self._render_index().encode("utf-8")
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInSite":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="standin-site", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StandInSite":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ----- 데이터 -----
+
+    @staticmethod
+    def notice_no(n: int) -> str:
+        return f"R26BK{n:08d}"
+
+    def list_page(self, page: int, size: int, keyword: str = "") -> Dict[str, Any]:
+        """목록 API 응답 (키워드가 있으면 제목 포함 공고만)"""
+        numbers = [n for n in range(1, self.notices + 1) if not keyword or keyword in self._title(n)]
+        start = (max(1, page) - 1) * size
+        return {
+            "totalCount": len(numbers),
+            "bidPbancList": [
+                {
+                    "rowNum": start + i + 1,
+                    "bidPbancNo": self.notice_no(n),
+                    "bidPbancOrd": "000",
+                    "bidPbancNm": self._title(n),
+                    "bidPbancPrcsSttsNm": "등록공고" if n % 5 else "변경공고",
+                    "bidClsfNm": CATEGORIES[n % len(CATEGORIES)],
+                    "pbancPstgDt": f"2026/02/{n % 28 + 1:02d}",
+                }
+                for i, n in enumerate(numbers[start:start + size])
+            ],
+        }
+
+    def detail(self, notice_no: str) -> Optional[Dict[str, Any]]:
+        """상세 API 응답 (표 행, replay 컬럼, 첨부파일 목록)"""
+        try:
+            n = int(notice_no[len("R26BK"):])
+        except ValueError:
+            return None
+        if not notice_no.startswith("R26BK") or not 1 <= n <= self.notices:
+            return None
+        rows = detail_rows(n)
+        by_label = dict(rows)
+        info = {column: by_label.get(label, "") for column, label in REPLAY_COLUMNS.items()}
+        info["bidPbancNm"] = f"[테스트] {self._title(n)}"
+        return {
+            "dtlInfo": info,
+            "dtlRows": [{"label": label, "value": value} for label, value in rows],
+            "fileList": [
+                {"fileNm": f"첨부{i}_규격서_{n}.pdf", "fileUrl": f"{FILE_PATH}{n}/{i}.pdf"}
+                for i in range(self.attachments)
+            ],
+        }
+
+    def file_bytes(self, path: str) -> bytes:
+        """첨부파일 내용 (경로 기준으로 항상 같은 내용)"""
+        seed = path.encode("utf-8")
+        return (seed * (self.file_size // len(seed) + 1))[:self.file_size]
+
+    @staticmethod
+    def _title(n: int) -> str:
+        return f"승강기 교체 공사 {n}"
+
+    def _count(self, name: str):
+        with self._lock:
+            self.counts[name] += 1
+
+    def _delay(self):
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        seconds = max(0.0, self.latency_ms + jitter) / 1000
+        if seconds:
+            time.sleep(seconds)
+
+    def _render_index(self) -> str:
+        popups = "".join(
+            f"<div class='w2window' style='top:{40 + i * 30}px'><p>공지사항 {i + 1}</p>"
+            f"<button class='w2window_close'>닫기</button></div>"
+            for i in range(self.popups)
+        )
+        dropdowns = "".join(
+            f"<tr><td class='w2tb_th'><label for='sel{i}'>{label}</label></td><td><select id='sel{i}'>"
+            + "".join(f"<option>{o}</option>" for o in options) + "</select></td></tr>"
+            for i, (label, options) in enumerate(DROPDOWNS.items())
+        )
+        options = "".join(f"<option>{o}</option>" for o in ROWS_PER_PAGE_OPTIONS)
+        return (INDEX_HTML
+                .replace("__POPUPS__", popups)
+                .replace("__DROPDOWNS__", dropdowns)
+                .replace("__ROW_OPTIONS__", options)
+                .replace("__GROUP__", str(PAGE_GROUP_SIZE))
+                .replace("__DEFAULT_SIZE__", str(ROWS_PER_PAGE_OPTIONS[0]))
+                .replace("__LIST_PATH__", LIST_PATH)
+                .replace("__DETAIL_PATH__", DETAIL_PATH))
+
+    # ----- HTTP -----
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                path = unquote(urlsplit(self.path).path)
+                if path in ("/", "/index.html"):
+                    self._send(200, site._index_html, "text/html; charset=utf-8")
+                elif path.startswith(FILE_PATH):
+                    site._count('file')
+                    self._send(200, site.file_bytes(path), "application/octet-stream")
+                else:
+                    self._send(404, b"not found", "text/plain")
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self._send(400, b"bad request", "text/plain")
+                    return
+
+                path = urlsplit(self.path).path
+                site._delay()
+                if path == LIST_PATH:
+                    site._count('list')
+                    payload = site.list_page(int(body.get("pageIndex", 1)), int(body.get("recordCountPerPage", 10)),
+                                             body.get("bidPbancNm", ""))
+                elif path == DETAIL_PATH:
+                    site._count('detail')
+                    payload = site.detail(str(body.get("bidPbancNo", "")))
+                    if payload is None:
+                        self._send(404, b"not found", "text/plain")
+                        return
+                else:
+                    self._send(404, b"not found", "text/plain")
+                    return
+                self._send(200, json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8")
+
+            def _send(self, status: int, data: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nuri stand-in site")
+    parser.add_argument("--notices", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--popups", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    site = StandInSite(args.notices, args.latency_ms, args.jitter_ms, args.popups, port=args.port).start()
+    print(f"Serving stand-in site on {site.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        site.close()
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator, Callable
+from playwright.async_api import async_playwright, Browser, Page, Playwright, BrowserContext
+from src.core.async_page_context import AsyncPageContext
+from src.core.request_router import RequestRouter
+
+class AsyncBaseCrawler(ABC):
+    """
+    playwright.async_api 기반 크롤러의 실행 흐름(Lifecycle)을 정의하는 추상 클래스
+    BaseCrawler와 같은 Template Method 구조이며, run()은 동기 호출을 유지하여
+    AppContainer/main 에서 BaseCrawler와 동일하게 사용할 수 있습니다.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self.ctx: Optional[AsyncPageContext] = None
+        self.router: Optional[RequestRouter] = None
+        self._teardown_hooks: List[Callable[[], None]] = []
+
+        # 동시 상세 수집 개수 제한
+        concurrency = config['system'].get('crawler', {}).get('async_concurrency', 4)
+        self.concurrency = max(1, concurrency)
+        self.semaphore: Optional[asyncio.Semaphore] = None
+
+    def add_teardown_hook(self, hook: Callable[[], None]):
+        """teardown 마지막에 실행할 정리 함수 등록 (브라우저 정리 실패와 무관하게 실행)"""
+        self._teardown_hooks.append(hook)
+
+    def run(self) -> Iterator[Any]:
+        """run_async()를 전용 이벤트 루프에서 한 건씩 진행하는 동기 제너레이터"""
+        loop = asyncio.new_event_loop()
+        agen = self.run_async()
+        try:
+            while True:
+                try:
+                    item = loop.run_until_complete(agen.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield item
+        finally:
+            # 중간에 소비를 멈춰도 teardown이 실행되도록 정리
+            loop.run_until_complete(agen.aclose())
+            loop.close()
+
+    async def run_async(self) -> AsyncIterator[Any]:
+        count = 0
+        try:
+            # Semaphore는 실행 중인 이벤트 루프에서 생성
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+
+            await self._setup_browser()
+            await self._navigate_to_target()
+
+            async for item in self._extract_data():
+                count += 1
+                yield item
+
+            self.logger.info(f"Crawling session finished. Collected {count} items.")
+
+        except Exception as e:
+            self.logger.error(f"Critical error during crawling: {e}")
+            raise e
+        finally:
+            await self._teardown_browser()
+
+    async def _setup_browser(self):
+        pw_config = self.config['system'].get('playwright', {})
+
+        self._playwright = await async_playwright().start()
+
+        self.browser = await self._playwright.chromium.launch(
+            headless=pw_config.get('headless', True)
+        )
+
+        self.context = await self.browser.new_context(
+            user_agent=pw_config.get('user_agent'),
+            viewport={'width': 1920, 'height': 1080}
+        )
+
+        self.context.set_default_timeout(pw_config.get('timeout', 30000))
+
+        # 요청 라우팅 (불필요한 리소스 차단)
+        routing_config = self.config['system'].get('routing', {})
+        if routing_config.get('enabled'):
+            self.router = RequestRouter(routing_config, self.logger)
+            await self.router.install_async(self.context)
+
+        self.page = await self.context.new_page()
+        self.ctx = AsyncPageContext(self.page)
+
+        self.logger.info("Browser launched successfully.")
+
+    async def _teardown_browser(self):
+        try:
+            if self.router:
+                self.router.log_summary()
+            if self.ctx:
+                await self.ctx.close_workers()
+            if self.page:
+                await self.page.close()
+            if self.context:
+                await self.context.close()
+            if self.browser:
+                await self.browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+            self.logger.info("Browser resources released.")
+        finally:
+            self._run_teardown_hooks()
+
+    def _run_teardown_hooks(self):
+        for hook in self._teardown_hooks:
+            try:
+                hook()
+            except Exception as e:
+                self.logger.error(f"Teardown hook failed: {e}")
+
+    @abstractmethod
+    async def _navigate_to_target(self):
+        """타겟 웹사이트 접속 및 검색 조건 설정"""
+        pass
+
+    @abstractmethod
+    async def _extract_data(self) -> AsyncIterator[Any]:
+        """현재 페이지(또는 전체 페이지) 데이터 파싱 및 추출 (수집되는 대로 yield)"""
+        pass
@@ -0,0 +1,35 @@
+from typing import List
+from playwright.async_api import Page
+
+class AsyncPageContext:
+    """
+    페이지 공유 컨텍스트 (playwright.async_api 용)
+    PageContext와 동일한 역할이며, 작업 탭 생성만 코루틴으로 제공합니다.
+    """
+    def __init__(self, page: Page):
+        self._page = page
+        self._workers: List["AsyncPageContext"] = []
+
+    @property
+    def current(self) -> Page:
+        """현재 활성화된 페이지 반환"""
+        return self._page
+
+    async def open_worker(self) -> "AsyncPageContext":
+        """같은 BrowserContext(쿠키/세션 공유)에 작업용 탭을 열어 반환"""
+        worker = AsyncPageContext(await self._page.context.new_page())
+        self._workers.append(worker)
+        return worker
+
+    @property
+    def workers(self) -> List["AsyncPageContext"]:
+        return list(self._workers)
+
+    async def close_workers(self):
+        """작업용 탭 일괄 종료 (개별 실패는 무시)"""
+        for worker in self._workers:
+            try:
+                await worker.current.close()
+            except Exception:
+                pass
+        self._workers.clear()
@@ -1,8 +1,9 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Callable
 from playwright.sync_api import sync_playwright, Browser, Page, Playwright, BrowserContext
 from src.core.page_context import PageContext
+from src.core.request_router import RequestRouter
 
 class BaseCrawler(ABC):
     """
@@ -19,18 +20,25 @@ class BaseCrawler(ABC):
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.ctx: Optional[PageContext] = None
+        self.router: Optional[RequestRouter] = None
+        self._teardown_hooks: List[Callable[[], None]] = []
 
-    def run(self) -> List[Any]:
-        results = []
+    def add_teardown_hook(self, hook: Callable[[], None]):
+        """teardown 마지막에 실행할 정리 함수 등록 (브라우저 정리 실패와 무관하게 실행)"""
+        self._teardown_hooks.append(hook)
+
+    def run(self) -> Iterator[Any]:
+        """수집 결과를 하나씩 반환하는 제너레이터 (끝까지 소비하거나 close() 해야 브라우저가 정리됨)"""
+        count = 0
         try:
             self._setup_browser()
             self._navigate_to_target()
             
-            data = self._extract_data()
-            results.extend(data)
+            for item in self._extract_data():
+                count += 1
+                yield item
             
-            self.logger.info(f"Crawling session finished. Collected {len(results)} items.")
-            return results
+            self.logger.info(f"Crawling session finished. Collected {count} items.")
             
         except Exception as e:
             self.logger.error(f"Critical error during crawling: {e}")
@@ -53,6 +61,12 @@ class BaseCrawler(ABC):
         )
         
         self.context.set_default_timeout(pw_config.get('timeout', 30000))
+
+        # 요청 라우팅 (불필요한 리소스 차단)
+        routing_config = self.config['system'].get('routing', {})
+        if routing_config.get('enabled'):
+            self.router = RequestRouter(routing_config, self.logger)
+            self.router.install(self.context)
         
         self.page = self.context.new_page()
         self.ctx = PageContext(self.page)
@@ -60,15 +74,29 @@ class BaseCrawler(ABC):
         self.logger.info("Browser launched successfully.")
 
     def _teardown_browser(self):
-        if self.page:
-            self.page.close()
-        if self.context:
-            self.context.close()
-        if self.browser:
-            self.browser.close()
-        if self._playwright:
-            self._playwright.stop()
-        self.logger.info("Browser resources released.")
+        try:
+            if self.router:
+                self.router.log_summary()
+            if self.ctx:
+                self.ctx.close_workers()
+            if self.page:
+                self.page.close()
+            if self.context:
+                self.context.close()
+            if self.browser:
+                self.browser.close()
+            if self._playwright:
+                self._playwright.stop()
+            self.logger.info("Browser resources released.")
+        finally:
+            self._run_teardown_hooks()
+
+    def _run_teardown_hooks(self):
+        for hook in self._teardown_hooks:
+            try:
+                hook()
+            except Exception as e:
+                self.logger.error(f"Teardown hook failed: {e}")
     
     @abstractmethod
     def _navigate_to_target(self):
@@ -76,6 +104,6 @@ class BaseCrawler(ABC):
         pass
 
     @abstractmethod
-    def _extract_data(self) -> List[Any]:
-        """현재 페이지(또는 전체 페이지) 데이터 파싱 및 추출"""
+    def _extract_data(self) -> Iterator[Any]:
+        """현재 페이지(또는 전체 페이지) 데이터 파싱 및 추출 (수집되는 대로 yield)"""
         pass
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 
 class BaseStorage(ABC):
     """
@@ -29,6 +29,13 @@ class BaseStorage(ABC):
         """
         pass
         
+    def load_known_index(self) -> Dict[Tuple[str, str], Optional[str]]:
+        """
+        증분 수집용 저장된 공고 인덱스
+        - return: {(공고번호, 차수): 목록 지문} (지원하지 않는 저장소는 빈 딕셔너리)
+        """
+        return {}
+
     @abstractmethod
     def close(self):
         """연결 종료 및 리소스 해제"""
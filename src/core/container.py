@@ -1,7 +1,11 @@
-from typing import Dict
+import logging
+from typing import Dict, Union
 from src.crawlers.nuri_crawler import NuriCrawler
+from src.crawlers.async_nuri_crawler import AsyncNuriCrawler
 from src.storage.mysql_storage import MySqlStorage
+from src.storage.task_ledger import CrawlTaskLedger
 from src.core.base_crawler import BaseCrawler
+from src.core.async_base_crawler import AsyncBaseCrawler
 from src.core.base_storage import BaseStorage
 
 class AppContainer:
@@ -9,8 +13,41 @@ class AppContainer:
         self.config = config
 
     def create_storage(self) -> BaseStorage:
-        db_url = self.config['system']['mysql']['db_url']
-        return MySqlStorage(db_url)
+        mysql = self.config['system']['mysql']
+        return MySqlStorage(
+            mysql['db_url'],
+            bulk_upsert=mysql.get('bulk_upsert', True),
+            chunk_size=mysql.get('chunk_size', 500)
+        )
 
-    def create_crawler(self) -> BaseCrawler:
-        return NuriCrawler(self.config)
\ No newline at end of file
+    def is_sharded(self) -> bool:
+        """공고게시일자 구간 분할 실행 여부 (직접 입력 날짜 범위에서만 가능)"""
+        sharding = self.config['system']['crawler'].get('sharding', {})
+        if not sharding.get('enabled'):
+            return False
+        date = self.config['search'].get('date', {})
+        if date.get('mode') != 'manual' or not date.get('start_date') or not date.get('end_date'):
+            logging.getLogger(self.__class__.__name__).warning("Sharding requires manual date range. Running unsharded.")
+            return False
+        return True
+
+    def is_distributed(self) -> bool:
+        """구간 분할 실행을 DB 작업 원장으로 여러 워커가 나누어 수행할지 여부"""
+        sharding = self.config['system']['crawler'].get('sharding', {})
+        return bool(sharding.get('distributed', {}).get('enabled'))
+
+    def create_task_ledger(self, storage: MySqlStorage) -> CrawlTaskLedger:
+        """연결된 저장소의 DB에 작업 원장 생성 (connect() 이후 호출)"""
+        distributed = self.config['system']['crawler'].get('sharding', {}).get('distributed', {})
+        return CrawlTaskLedger(
+            storage.engine,
+            lease_seconds=distributed.get('lease_seconds', 300),
+            max_attempts=self.config['system'].get('playwright', {}).get('max_retries', 3)
+        )
+
+    def create_crawler(self) -> Union[BaseCrawler, AsyncBaseCrawler]:
+        # 실행 엔진 선택 (sync: 기본, async: playwright.async_api 기반)
+        engine = self.config['system']['crawler'].get('engine', 'sync')
+        if engine == 'async':
+            return AsyncNuriCrawler(self.config)
+        return NuriCrawler(self.config)
@@ -0,0 +1,101 @@
+import os
+import socket
+import threading
+import logging
+from typing import Dict, Optional
+from src.core.base_storage import BaseStorage
+from src.core.shard_runner import plan_date_shards, run_shard, ShardAborted
+from src.storage.task_ledger import CrawlTaskLedger
+
+
+class _LeaseKeeper:
+    """작업 중 임대를 주기적으로 연장하는 스레드 (임대를 잃으면 lost=True)"""
+
+    def __init__(self, ledger: CrawlTaskLedger, task_id: str, owner: str, interval: float, logger):
+        self.ledger = ledger
+        self.task_id = task_id
+        self.owner = owner
+        self.interval = interval
+        self.logger = logger
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"lease-{task_id}", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                if not self.ledger.renew(self.task_id, self.owner):
+                    self.lost = True
+                    self.logger.warning(f"[Task {self.task_id}] lease lost.")
+                    return
+            except Exception as e:
+                # 일시적인 DB 오류는 다음 주기에 다시 시도 (임대 만료 전까지)
+                self.logger.warning(f"[Task {self.task_id}] lease renewal failed: {e}")
+
+
+class LedgerWorker:
+    """
+    분산 구간 수집 워커 (crawl_tasks 원장 기반)
+    - 같은 설정으로 여러 프로세스/컨테이너를 띄우면 원장에서 구간을 하나씩 임대하여 수집합니다.
+    - 구간이 끝나면 결과를 저장한 뒤 done으로 기록하며, 실패는 max_retries까지 다른 워커가 다시 가져갑니다.
+    - 워커가 죽으면 임대가 만료된 뒤 다른 워커가 해당 구간을 처음부터 다시 수집합니다.
+    - 임대 연장에 실패하면(다른 워커가 가져감) 수집을 멈추고 결과를 저장하지 않습니다.
+    """
+
+    def __init__(self, config: Dict, ledger: CrawlTaskLedger, logger=None):
+        self.config = config
+        self.ledger = ledger
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        sharding = config['system']['crawler'].get('sharding', {})
+        distributed = sharding.get('distributed', {})
+        self.unit = sharding.get('unit', 'day')
+        self.owner = distributed.get('worker_id') or f"{socket.gethostname()}-{os.getpid()}"
+        self.renew_interval = max(1.0, ledger.lease.total_seconds() / 3)
+
+    def run(self, storage: BaseStorage, known: Optional[Dict] = None) -> int:
+        """
+        가져갈 구간이 없을 때까지 임대 -> 수집 -> 저장 반복
+        - return: 이 워커가 저장한 공고 수
+        """
+        date = self.config['search']['date']
+        run_key = f"{date['start_date']}-{date['end_date']}:{self.unit}"
+        self.ledger.register(run_key, plan_date_shards(date['start_date'], date['end_date'], self.unit))
+        self.logger.info(f"Ledger worker {self.owner} started ({run_key}): {self.ledger.progress(run_key)}")
+
+        saved = 0
+        while (task := self.ledger.claim(run_key, self.owner)) is not None:
+            shard = {'id': task['task_id'], 'start_date': task['start_date'], 'end_date': task['end_date']}
+            self.logger.info(f"[Task {shard['id']}] claimed (attempt {task['attempts']}).")
+            try:
+                with _LeaseKeeper(self.ledger, shard['id'], self.owner, self.renew_interval, self.logger) as keeper:
+                    _, results = run_shard(self.config, shard, known, should_stop=lambda: keeper.lost)
+                    if keeper.lost:
+                        raise ShardAborted(f"Shard {shard['id']} lease lost.")
+                    unique = list({(bid.notice_code, bid.degree): bid for bid in results}.values())
+                    if unique:
+                        storage.save(unique)
+            except ShardAborted as e:
+                # 임대를 잃은 구간은 새 소유자가 처음부터 수집하므로 저장/완료/실패 기록 없이 넘어감
+                self.logger.warning(f"[Task {shard['id']}] abandoned: {e}")
+                continue
+            except Exception as e:
+                self.ledger.fail(shard['id'], self.owner, str(e))
+                self.logger.error(f"[Task {shard['id']}] failed: {e}")
+                continue
+
+            saved += len(unique)
+            # 저장 중 임대를 잃은 경우에도 결과는 Upsert로 유지되며, 완료 기록만 새 소유자에게 맡김
+            if not self.ledger.complete(shard['id'], self.owner, len(unique)):
+                self.logger.warning(f"[Task {shard['id']}] finished after lease was taken over.")
+            self.logger.info(f"[Task {shard['id']}] done: {len(results)} collected, {len(unique)} saved.")
+
+        self.logger.info(f"Ledger worker {self.owner} finished: {self.ledger.progress(run_key)}")
+        return saved
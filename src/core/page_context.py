@@ -1,3 +1,4 @@
+from typing import List
 from playwright.sync_api import Page
 
 class PageContext:
@@ -7,8 +8,31 @@ class PageContext:
     """
     def __init__(self, page: Page):
         self._page = page
+        self._workers: List["PageContext"] = []
 
     @property
     def current(self) -> Page:
         """현재 활성화된 페이지 반환"""
-        return self._page
\ No newline at end of file
+        return self._page
+
+    def open_worker(self) -> "PageContext":
+        """
+        같은 BrowserContext(쿠키/세션 공유)에 작업용 탭을 열어 반환
+        반환된 컨텍스트는 close_workers() 호출 시 함께 정리됩니다.
+        """
+        worker = PageContext(self._page.context.new_page())
+        self._workers.append(worker)
+        return worker
+
+    @property
+    def workers(self) -> List["PageContext"]:
+        return list(self._workers)
+
+    def close_workers(self):
+        """작업용 탭 일괄 종료 (개별 실패는 무시)"""
+        for worker in self._workers:
+            try:
+                worker.current.close()
+            except Exception:
+                pass
+        self._workers.clear()
@@ -0,0 +1,123 @@
+import re
+import threading
+from typing import Dict, Optional, Any
+from urllib.parse import urlsplit
+
+# 차단된 요청의 절감량 추정치 (리소스 유형별 평균 크기, 실제 응답을 관찰하면 관찰값 사용)
+DEFAULT_ESTIMATED_BYTES = {
+    'image': 30_000,
+    'media': 500_000,
+    'font': 60_000,
+    'stylesheet': 20_000,
+    'script': 40_000,
+}
+
+
+class RequestRouter:
+    """
+    BrowserContext 요청 라우팅 프로파일
+    - 리소스 유형, URL 패턴(정규식), 도메인 단위로 요청을 차단합니다.
+    - allow_patterns에 해당하는 요청(WebSquare 엔진/그리드 스크립트 등)은 어떤 규칙보다 우선하여 허용합니다.
+    - 실행 단위로 차단/허용 건수와 절감 바이트(추정)를 집계합니다.
+    """
+
+    def __init__(self, config: Dict, logger):
+        self.logger = logger
+        self.block_resource_types = set(config.get('block_resource_types', []))
+        self.block_url_patterns = [re.compile(p) for p in config.get('block_url_patterns', [])]
+        self.block_domains = [d.lower().lstrip('.') for d in config.get('block_domains', [])]
+        self.allow_patterns = [re.compile(p) for p in config.get('allow_patterns', [])]
+        self.estimated_bytes = {**DEFAULT_ESTIMATED_BYTES, **config.get('estimated_bytes', {})}
+
+        self._lock = threading.Lock()
+        self.blocked: Dict[str, int] = {}
+        self.allowed: Dict[str, int] = {}
+        self.bytes_allowed: Dict[str, int] = {}
+        self._sized_responses: Dict[str, int] = {}
+
+    def decide(self, url: str, resource_type: str) -> Optional[str]:
+        """차단 사유 반환 (허용이면 None)"""
+        if any(p.search(url) for p in self.allow_patterns):
+            return None
+        if resource_type in self.block_resource_types:
+            return f"type:{resource_type}"
+
+        host = (urlsplit(url).hostname or "").lower()
+        for domain in self.block_domains:
+            if host == domain or host.endswith("." + domain):
+                return f"domain:{domain}"
+
+        for pattern in self.block_url_patterns:
+            if pattern.search(url):
+                return f"pattern:{pattern.pattern}"
+        return None
+
+    # --- Playwright 연결 ---
+    def install(self, context):
+        """sync_api BrowserContext에 라우팅 설치"""
+        context.route("**/*", self._handle)
+        context.on("response", self._on_response)
+
+    async def install_async(self, context):
+        """async_api BrowserContext에 라우팅 설치"""
+        async def handle(route):
+            request = route.request
+            if self._record(request.url, request.resource_type):
+                await route.abort("blockedbyclient")
+            else:
+                await route.continue_()
+
+        await context.route("**/*", handle)
+        context.on("response", self._on_response)
+
+    def _handle(self, route):
+        request = route.request
+        if self._record(request.url, request.resource_type):
+            route.abort("blockedbyclient")
+        else:
+            route.continue_()
+
+    def _record(self, url: str, resource_type: str) -> bool:
+        """판정 후 집계. 차단이면 True"""
+        blocked = self.decide(url, resource_type) is not None
+        with self._lock:
+            counter = self.blocked if blocked else self.allowed
+            counter[resource_type] = counter.get(resource_type, 0) + 1
+        return blocked
+
+    def _on_response(self, response):
+        length = response.headers.get('content-length')
+        if not length or not length.isdigit():
+            return
+        resource_type = response.request.resource_type
+        with self._lock:
+            self.bytes_allowed[resource_type] = self.bytes_allowed.get(resource_type, 0) + int(length)
+            self._sized_responses[resource_type] = self._sized_responses.get(resource_type, 0) + 1
+
+    # --- 통계 ---
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            saved = 0
+            for resource_type, count in self.blocked.items():
+                sized = self._sized_responses.get(resource_type, 0)
+                if sized:
+                    avg = self.bytes_allowed[resource_type] / sized
+                else:
+                    avg = self.estimated_bytes.get(resource_type, 10_000)
+                saved += int(avg * count)
+
+            return {
+                'blocked': dict(self.blocked),
+                'allowed': dict(self.allowed),
+                'blocked_total': sum(self.blocked.values()),
+                'allowed_total': sum(self.allowed.values()),
+                'bytes_allowed': sum(self.bytes_allowed.values()),
+                'estimated_bytes_saved': saved,
+            }
+
+    def log_summary(self):
+        s = self.summary()
+        self.logger.info(
+            f"Routing summary: blocked {s['blocked_total']} / allowed {s['allowed_total']} requests, "
+            f"~{s['estimated_bytes_saved'] / 1024:.0f}KB saved. Blocked by type: {s['blocked']}"
+        )
@@ -0,0 +1,235 @@
+import copy
+import json
+import os
+import socket
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Set, Callable
+from src.core.base_storage import BaseStorage
+from src.utils.metrics import METRICS
+
+DATE_FORMAT = "%Y%m%d"
+UNIT_DAYS = {"day": 1, "week": 7}
+
+
+def plan_date_shards(start_date: str, end_date: str, unit: str = "day") -> List[Dict[str, str]]:
+    """
+    공고게시일자 범위를 겹치지 않는 일/주 단위 구간으로 분할
+    - return: [{'id': '20260201-20260207', 'start_date': '20260201', 'end_date': '20260207'}, ...]
+    """
+    step = timedelta(days=UNIT_DAYS.get(unit, 1))
+    start = datetime.strptime(start_date, DATE_FORMAT)
+    end = datetime.strptime(end_date, DATE_FORMAT)
+
+    shards = []
+    while start <= end:
+        shard_end = min(end, start + step - timedelta(days=1))
+        s, e = start.strftime(DATE_FORMAT), shard_end.strftime(DATE_FORMAT)
+        shards.append({'id': f"{s}-{e}", 'start_date': s, 'end_date': e})
+        start = shard_end + timedelta(days=1)
+    return shards
+
+
+def shard_state_file(state_dir: str, shard_id: str) -> str:
+    """구간 체크포인트 파일 (같은 디렉터리를 여러 호스트/프로세스가 공유해도 겹치지 않도록 호스트와 PID 포함)"""
+    return os.path.join(state_dir, f"{shard_id}.{socket.gethostname()}-{os.getpid()}.json")
+
+
+def discard_checkpoint(path: str):
+    """체크포인트 파일 삭제 (임시 파일 포함)"""
+    for target in (path, f"{path}.tmp"):
+        if os.path.exists(target):
+            os.remove(target)
+
+
+class ShardAborted(Exception):
+    """구간 수집 중단 요청 (분산 실행에서 임대를 잃은 경우)"""
+
+
+def run_shard(config: Dict, shard: Dict[str, str], known: Optional[Dict] = None,
+              should_stop: Optional[Callable[[], bool]] = None) -> Tuple[str, List[Any]]:
+    """
+    작업 프로세스에서 구간 하나를 수집 (프로세스마다 독립된 Playwright 인스턴스)
+    - 수집 결과는 반환값으로만 부모 프로세스에 전달되므로, 시도마다 체크포인트 없이 구간 처음부터 수집합니다.
+      (이전 시도의 체크포인트로 이어 받으면 실패 전에 수집한 행이 저장되지 않은 채 빠짐)
+    - should_stop: 결과 한 건마다 확인하여 True면 수집을 멈추고 ShardAborted
+    """
+    # 순환 import 방지 (AppContainer -> 크롤러 -> core)
+    from src.core.container import AppContainer
+
+    config = copy.deepcopy(config)
+    config['search']['date'] = {
+        **config['search'].get('date', {}),
+        'mode': 'manual',
+        'start_date': shard['start_date'],
+        'end_date': shard['end_date'],
+    }
+    sharding = config['system']['crawler'].get('sharding', {})
+    state_dir = sharding.get('state_dir', 'shard_states')
+    os.makedirs(state_dir, exist_ok=True)
+    state_file = shard_state_file(state_dir, shard['id'])
+    discard_checkpoint(state_file)
+    config['system']['crawler']['state_file'] = state_file
+    # 결과는 부모 프로세스에서 저장하므로 구간 프로세스는 결과 스풀을 사용하지 않음 (실패 구간은 처음부터 재수집)
+    config['system']['crawler']['spool'] = {'enabled': False}
+
+    crawler = AppContainer(config).create_crawler()
+    if known is not None:
+        crawler.set_known_index(known)
+    results = []
+    try:
+        run = crawler.run()
+        for bid in run:
+            results.append(bid)
+            if should_stop and should_stop():
+                run.close()
+                raise ShardAborted(f"Shard {shard['id']} aborted after {len(results)} rows.")
+        return shard['id'], results
+    finally:
+        discard_checkpoint(state_file)
+
+
+def run_shard_process(config: Dict, shard: Dict[str, str],
+                      known: Optional[Dict] = None) -> Tuple[str, List[Any], Dict[str, Any]]:
+    """
+    ProcessPoolExecutor 작업 함수: run_shard 결과와 이 구간의 계측 snapshot 반환
+    - 작업 프로세스는 여러 구간에 재사용되고 fork 시 부모 계측을 복사하므로, 구간마다 비우고 시작합니다.
+    """
+    METRICS.enabled = config['system'].get('metrics', {}).get('enabled', True)
+    METRICS.reset()
+    shard_id, results = run_shard(config, shard, known)
+    return shard_id, results, METRICS.snapshot()
+
+
+class ShardManifest:
+    """구간별 진행 상태 파일 (pending/done/failed, 시도 횟수, 수집 건수)"""
+
+    def __init__(self, path: str, logger):
+        self.path = path
+        self.logger = logger
+        self.data: Dict[str, Any] = {'range': '', 'shards': {}}
+
+    def load(self, range_key: str, shards: List[Dict[str, str]]):
+        """같은 범위의 이전 기록이 있으면 이어서 사용, 아니면 새로 작성"""
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                if data.get('range') == range_key:
+                    self.data = data
+            except Exception as e:
+                self.logger.warning(f"Failed to read shard manifest: {e}")
+
+        self.data['range'] = range_key
+        for shard in shards:
+            self.data['shards'].setdefault(shard['id'], {'status': 'pending', 'attempts': 0, 'count': 0})
+        self.save()
+
+    def status(self, shard_id: str) -> str:
+        return self.data['shards'][shard_id]['status']
+
+    def mark(self, shard_id: str, status: str, count: int = 0, error: str = ""):
+        entry = self.data['shards'][shard_id]
+        entry['status'] = status
+        if status in ('done', 'failed'):
+            entry['attempts'] += 1
+        if status == 'done':
+            entry['count'] = count
+        entry['error'] = error
+        self.save()
+
+    def save(self):
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            self.logger.warning(f"Failed to write shard manifest: {e}")
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class ShardRunner:
+    """
+    공고게시일자 구간 분할 실행 모드
+    - 구간마다 별도 프로세스에서 크롤러를 실행하고(ProcessPoolExecutor), 끝난 구간부터
+      (공고번호, 차수) 기준으로 중복을 제거하여 저장합니다.
+    - 끝난 구간의 계측(METRICS)은 현재 프로세스 레지스트리에 합칩니다.
+    - 저장까지 끝난 구간만 done으로 기록하므로, 재실행 시 실패/미완료 구간만 다시 수집합니다.
+    """
+
+    def __init__(self, config: Dict, logger=None):
+        self.config = config
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.sharding = config['system']['crawler'].get('sharding', {})
+        self.unit = self.sharding.get('unit', 'day')
+        self.workers = self.sharding.get('workers') or os.cpu_count() or 1
+        self.max_retries = config['system'].get('playwright', {}).get('max_retries', 3)
+        self.manifest = ShardManifest(self.sharding.get('manifest_file', 'crawl_shards.json'), self.logger)
+
+    def plan(self) -> List[Dict[str, str]]:
+        date = self.config['search'].get('date', {})
+        return plan_date_shards(date['start_date'], date['end_date'], self.unit)
+
+    def run(self, storage: BaseStorage, known: Optional[Dict] = None,
+            only: Optional[Iterable[str]] = None) -> int:
+        """
+        미완료 구간을 병렬 수집하고 구간이 끝날 때마다 저장
+        - only: 지정한 구간 ID만 실행 (실패 구간 단독 재시도)
+        - return: 이번 실행에서 저장한 공고 수 (중복 제거)
+        """
+        shards = self.plan()
+        date = self.config['search']['date']
+        self.manifest.load(f"{date['start_date']}-{date['end_date']}:{self.unit}", shards)
+
+        todo = [s for s in shards if self.manifest.status(s['id']) != 'done']
+        if only:
+            only = set(only)
+            todo = [s for s in todo if s['id'] in only]
+        self.logger.info(f"Sharded run: {len(shards)} shards ({self.unit}), {len(todo)} to crawl, "
+                         f"{min(self.workers, max(1, len(todo)))} workers.")
+
+        seen: Set[Tuple[str, str]] = set()
+        attempts = {s['id']: 0 for s in todo}
+        pending = list(todo)
+
+        while pending:
+            failed = []
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as executor:
+                futures = {executor.submit(run_shard_process, self.config, s, known): s for s in pending}
+                for future in as_completed(futures):
+                    shard = futures[future]
+                    attempts[shard['id']] += 1
+                    try:
+                        _, results, metrics = future.result()
+                        METRICS.merge(metrics)
+                        saved = self._save_unique(storage, results, seen)
+                        self.manifest.mark(shard['id'], 'done', count=saved)
+                        self.logger.info(f"[Shard {shard['id']}] done: {len(results)} collected, {saved} saved.")
+                    except Exception as e:
+                        self.manifest.mark(shard['id'], 'failed', error=str(e))
+                        self.logger.error(f"[Shard {shard['id']}] failed (attempt {attempts[shard['id']]}): {e}")
+                        if attempts[shard['id']] < self.max_retries:
+                            failed.append(shard)
+            pending = failed
+
+        if all(self.manifest.status(s['id']) == 'done' for s in shards):
+            self.manifest.clear()
+        else:
+            self.logger.warning(f"Some shards failed. Re-run to retry them (manifest: {self.manifest.path}).")
+
+        return len(seen)
+
+    def _save_unique(self, storage: BaseStorage, results: List[Any], seen: Set[Tuple[str, str]]) -> int:
+        """이미 저장한 (공고번호, 차수)를 제외하고 저장 (키만 보관)"""
+        unique = {}
+        for bid in results:
+            key = (bid.notice_code, bid.degree)
+            if key not in seen:
+                unique[key] = bid
+        if unique:
+            storage.save(list(unique.values()))
+            seen.update(unique)
+        return len(unique)
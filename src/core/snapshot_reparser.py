@@ -0,0 +1,60 @@
+import logging
+from typing import Dict, Any, Optional
+from src.core.base_storage import BaseStorage
+from src.core.storage_sink import StorageSink
+from src.models.bid_notice import BidNotice
+from src.crawlers.components.nuri_parser import NuriParser
+from src.crawlers.components.known_index import KnownNoticeIndex
+from src.crawlers.components.snapshot_store import DetailSnapshotStore, DetailSnapshot
+from src.crawlers.components.detail_batch_parser import DetailBatchParser
+from src.utils.metrics import METRICS
+
+
+class SnapshotReparser:
+    """
+    저장된 상세 HTML 스냅샷을 브라우저 없이 다시 파싱하여 저장소에 반영 (--reparse)
+    - 공고별 최신 스냅샷만 사용하며, 라벨 매칭/병합/BidFactory 규칙은 수집 경로와 같습니다.
+    - HTML 파싱은 DetailBatchParser로 여러 프로세스에 나누고, 모델 생성과 저장은 현재 프로세스에서 합니다.
+    - FIELD_CONFIG에 라벨이나 필드를 추가한 뒤 재수집 없이 기존 공고를 채우는 용도입니다.
+    - 첨부파일 다운로드 정보(크기/URL/SHA-256)는 HTML에 없으므로 None으로 넘기며, 벌크 저장 경로에서 저장된 값이 유지됩니다.
+    """
+
+    def __init__(self, config: Dict, store: Optional[DetailSnapshotStore] = None):
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+        snapshots = config['system']['crawler'].get('snapshots', {})
+        self.store = store or DetailSnapshotStore.from_config(snapshots, self.logger)
+        self.batch = DetailBatchParser(self.logger, workers=snapshots.get('reparse_workers', 0),
+                                       chunk_size=snapshots.get('reparse_chunk', 200),
+                                       backend=snapshots.get('parser_backend', 'auto'))
+        self.parser = NuriParser(self.logger)
+        self.failed = 0
+
+    def build(self, snapshot: DetailSnapshot, raw_data: Dict[str, Any]) -> Optional[BidNotice]:
+        """Raw Data -> BidNotice (공고번호/차수와 목록 지문은 스냅샷 기준)"""
+        bid = self.parser.build_notice(raw_data)
+        if bid:
+            bid.notice_code, bid.degree = snapshot.notice_code, snapshot.degree
+            bid.list_fingerprint = KnownNoticeIndex.fingerprint(snapshot.list_data)
+        return bid
+
+    def run(self, storage: BaseStorage) -> int:
+        """전체 재파싱 후 배치 저장, 저장 건수 반환"""
+        snapshots = self.store.latest()
+        self.logger.info(f"Re-parsing {len(snapshots)} detail snapshots from {self.store.root}.")
+
+        sink = StorageSink(storage, self.config['system'].get('storage', {}))
+        try:
+            for snapshot, raw_data in self.batch.parse(self.store.root, snapshots):
+                bid = self.build(snapshot, raw_data) if raw_data else None
+                if bid is None:
+                    self.failed += 1
+                    continue
+                METRICS.inc("notices_reparsed")
+                sink.add(bid)
+        finally:
+            sink.close()
+            self.store.close()
+
+        self.logger.info(f"Re-parse finished. Saved {sink.saved}, failed {self.failed}.")
+        return sink.saved
@@ -0,0 +1,53 @@
+import time
+import logging
+from typing import List, Dict, Any, Callable, Optional
+from src.core.base_storage import BaseStorage
+
+class StorageSink:
+    """
+    크롤러가 yield하는 결과를 모아 배치 단위로 저장
+    - batch_size건이 모이거나 flush_interval초가 지나면 저장합니다.
+    - close()에서 남은 결과를 저장하므로, 크롤링 중 예외가 나도 그때까지 수집한 데이터는 보존됩니다.
+    - 저장에 실패한 배치는 버리지 않고 남겨 두며, 다음 flush에서 새 결과와 함께 다시 저장합니다.
+    - on_saved: 저장이 끝난 배치를 받는 콜백 (스풀 정리 등)
+    """
+
+    def __init__(self, storage: BaseStorage, config: Dict, logger=None,
+                 on_saved: Optional[Callable[[List[Any]], None]] = None):
+        self.storage = storage
+        self.on_saved = on_saved
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.batch_size = max(1, config.get('batch_size', 100))
+        self.flush_interval = config.get('flush_interval', 30)
+
+        self._buffer: List[Any] = []
+        self._last_flush = time.monotonic()
+        self.saved = 0
+        self.batches = 0
+
+    def add(self, item: Any):
+        self._buffer.append(item)
+        if len(self._buffer) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        batch = self._buffer
+        self.storage.save(batch)
+        self._buffer = []
+        self.saved += len(batch)
+        self.batches += 1
+        if self.on_saved:
+            self.on_saved(batch)
+
+    @property
+    def pending(self) -> int:
+        """저장되지 않은 결과 수"""
+        return len(self._buffer)
+
+    def close(self):
+        """남은 결과 저장"""
+        self.flush()
+        self.logger.info(f"Storage sink closed. Saved {self.saved} records in {self.batches} batches.")
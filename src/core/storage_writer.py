@@ -0,0 +1,88 @@
+import queue
+import threading
+import logging
+from typing import Dict, Any, List, Optional, Callable
+from src.core.base_storage import BaseStorage
+from src.core.storage_sink import StorageSink
+
+_STOP = object()
+
+class BackgroundStorageWriter:
+    """
+    별도 스레드에서 저장하는 StorageSink (Producer/Consumer)
+    - 크롤러 스레드는 제한된 크기의 큐에 넣기만 하며, 큐가 가득 차면 대기합니다. (Backpressure)
+    - 작업 스레드마다 StorageSink를 하나씩 가지고 배치 단위로 각자의 트랜잭션에서 저장합니다.
+    - 저장 오류가 나면 이후 add()는 바로 실패하고(Fail-fast), 실패한 배치는 close()에서 한 번 더 저장을 시도합니다.
+    - close()는 남은 항목을 모두 저장한 뒤 반환하며, 저장 중 발생한 첫 오류를 다시 던집니다.
+    """
+
+    def __init__(self, storage: BaseStorage, config: Dict, logger=None,
+                 on_saved: Optional[Callable[[List[Any]], None]] = None):
+        self.storage = storage
+        self.config = config
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, config.get('queue_size', 500)))
+
+        self.error: Optional[Exception] = None
+        self._sinks: List[StorageSink] = []
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+
+        for i in range(max(1, config.get('writer_threads', 1))):
+            sink = StorageSink(storage, config, self.logger, on_saved)
+            thread = threading.Thread(target=self._drain, args=(sink,), name=f"storage-writer-{i}", daemon=True)
+            self._sinks.append(sink)
+            self._threads.append(thread)
+            thread.start()
+
+    @property
+    def saved(self) -> int:
+        return sum(sink.saved for sink in self._sinks)
+
+    def add(self, item: Any):
+        """큐에 추가 (가득 차면 작업 스레드가 비울 때까지 대기, 저장 오류 이후에는 예외)"""
+        if self._closed:
+            raise RuntimeError("storage writer is closed")
+        self._raise_error()
+        self.queue.put(item)
+
+    def _drain(self, sink: StorageSink):
+        # 새 항목이 없어도 flush_interval마다 깨어나 모아둔 배치를 저장
+        timeout = max(0.1, sink.flush_interval)
+        while True:
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                self._safe(sink.flush)
+                continue
+            if item is _STOP:
+                self._safe(sink.flush)
+                return
+            self._safe(lambda: sink.add(item))
+
+    def _safe(self, action):
+        try:
+            action()
+        except Exception as e:
+            self.logger.error(f"Background save failed: {e}")
+            if self.error is None:
+                self.error = e
+
+    def close(self):
+        """남은 항목 저장 후 작업 스레드 종료 (여러 번 호출해도 한 번만 종료)"""
+        if not self._closed:
+            self._closed = True
+            for _ in self._threads:
+                self.queue.put(_STOP)
+            for thread in self._threads:
+                thread.join()
+            self.logger.info(f"Storage writer closed. Saved {self.saved} records "
+                             f"in {sum(s.batches for s in self._sinks)} batches.")
+            pending = sum(s.pending for s in self._sinks)
+            if pending:
+                self.logger.error(f"{pending} records were not saved.")
+        self._raise_error()
+
+    def _raise_error(self):
+        if self.error is not None:
+            raise RuntimeError(f"background storage failed: {self.error}") from self.error
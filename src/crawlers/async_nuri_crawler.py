@@ -0,0 +1,308 @@
+import asyncio
+from typing import List, Dict, Any, Optional, Set, Tuple, AsyncIterator
+from src.core.async_base_crawler import AsyncBaseCrawler
+from src.core.async_page_context import AsyncPageContext
+from src.models.bid_notice import BidNotice
+from src.crawlers.components.async_nuri_navigator import AsyncNuriNavigator
+from src.crawlers.components.nuri_navigator import PageMoveFailed
+from src.crawlers.components.async_nuri_parser import AsyncNuriParser
+from src.crawlers.components.nuri_navigator import GRID_ROWS_SELECTOR
+from src.crawlers.components.nuri_parser import NuriParser
+from src.crawlers.components.bid_factory import BidFactory
+from src.crawlers.components.result_spool import create_state_store
+from src.crawlers.components.wait_engine import AsyncWaitEngine
+from src.crawlers.components.known_index import KnownNoticeIndex
+from src.crawlers.components.retry_queue import RowRetryQueue, RetryEntry
+from src.crawlers.components.attachment_downloader import AttachmentDownloader
+from src.crawlers.components.snapshot_store import DetailSnapshotStore
+from src.crawlers.components.nuri_detail_extractor import DETAIL_CONTAINER_SELECTOR
+
+class AsyncDetailWorker:
+    """상세 수집용 작업 탭 (탭마다 독립된 Navigator와 목록 상태를 가짐)"""
+
+    def __init__(self, worker_id: int, ctx: AsyncPageContext, logger, waits: Optional[AsyncWaitEngine] = None):
+        self.worker_id = worker_id
+        self.ctx = ctx
+        self.nav = AsyncNuriNavigator(ctx, logger, waits)
+        # 탭이 현재 보고 있는 목록 페이지 (0: 미동기화)
+        self.list_page = 0
+
+    @property
+    def page(self):
+        return self.ctx.current
+
+
+class AsyncNuriCrawler(AsyncBaseCrawler):
+    """
+    누리장터 크롤러 (asyncio 엔진)
+    - 목록 탭은 그리드 조회/페이지 이동만 담당합니다.
+    - 상세 수집은 Semaphore(async_concurrency)로 제한된 개수만큼 작업 탭에서 동시에 진행합니다.
+    """
+    def __init__(self, config):
+        super().__init__(config)
+        self.nav: Optional[AsyncNuriNavigator] = None
+        self.known: Optional[KnownNoticeIndex] = None
+        self.parser = AsyncNuriParser(self.logger)
+        self.waits = AsyncWaitEngine(config['system'].get('waits', {}), self.logger)
+        pw_config = config['system'].get('playwright', {})
+        self.retries = RowRetryQueue(pw_config.get('max_retries', 3), pw_config.get('retry_backoff', 1.0),
+                                     pw_config.get('retry_backoff_max', 30.0), self.logger)
+        attachments = config['system']['crawler'].get('attachments', {})
+        self.downloader = AttachmentDownloader(attachments, self.logger, self.waits.rate) if attachments.get('enabled') else None
+        # 상세 HTML 스냅샷 (FIELD_CONFIG가 바뀌면 --reparse 로 재수집 없이 다시 파싱)
+        snapshots = config['system']['crawler'].get('snapshots', {})
+        if snapshots.get('enabled'):
+            self.parser.enable_snapshots(DetailSnapshotStore.from_config(snapshots, self.logger),
+                                         snapshots.get('container', DETAIL_CONTAINER_SELECTOR))
+        self.state_file = config['system']['crawler'].get('state_file', "crawling_state.json")
+        # spool.enabled면 체크포인트와 수집 결과를 로컬 스풀에 함께 기록
+        self.state = create_state_store(self.state_file, config['system']['crawler'].get('spool'), self.logger)
+        self._idle_workers: Optional[asyncio.Queue] = None
+
+    def set_known_index(self, known: Dict[Tuple[str, str], Optional[str]]):
+        """저장된 공고 인덱스 설정 (목록 지문이 같은 행은 상세 수집을 건너뜀)"""
+        self.known = KnownNoticeIndex(known)
+        self.logger.info(f"Incremental mode: {len(self.known)} known notices.")
+
+    async def _navigate_to_target(self):
+        """누리장터 접속 및 검색 조건 설정 (목록 탭 + 작업 탭)"""
+        self.nav = AsyncNuriNavigator(self.ctx, self.logger, self.waits)
+        # 429/5xx 응답과 오류 대화상자는 요청 속도 감소 신호
+        self.waits.watch(self.context)
+        await self._open_search(self.nav)
+
+        # 작업 탭 준비 (동시에 초기화)
+        workers = [AsyncDetailWorker(i, await self.ctx.open_worker(), self.logger, self.waits) for i in range(self.concurrency)]
+        await asyncio.gather(*(self._reset_worker(w) for w in workers), return_exceptions=True)
+
+        self._idle_workers = asyncio.Queue()
+        for worker in workers:
+            self._idle_workers.put_nowait(worker)
+        self.logger.info(f"Async engine ready with {len(workers)} detail tabs.")
+
+    async def _open_search(self, nav: AsyncNuriNavigator):
+        base_url = self.config['system']['crawler']['base_url']
+        await nav.go_to_main(base_url)
+        await nav.go_to_bid_list()
+        await nav.set_search_conditions(self.config.get('search', {}))
+
+    async def _download_attachments(self, results: List[BidNotice]):
+        """첨부파일 다운로드 (이벤트 루프를 막지 않도록 작업 스레드에서)"""
+        if self.downloader and results:
+            await asyncio.to_thread(self.downloader.download_all, results, await self.context.cookies())
+            # 스풀에는 다운로드 전에 기록되었으므로 채워진 첨부파일 정보를 다시 기록
+            self.state.refresh(results)
+
+    async def _teardown_browser(self):
+        if self.downloader:
+            self.downloader.log_summary()
+        if self.parser.snapshots:
+            self.parser.snapshots.log_summary()
+            self.parser.snapshots.close()
+        self.waits.log_summary()
+        await super()._teardown_browser()
+
+    async def _restore_search_state(self, target_page: int) -> bool:
+        """목록 탭을 목표 페이지로 이동 (도착하면 True)"""
+        self.logger.warning(f"State lost or starting. Restoring to page {target_page}...")
+
+        if not await self.nav.is_on_list():
+            await self.nav.go_to_bid_list()
+            await self.nav.set_search_conditions(self.config.get('search', {}))
+
+        if not await self.nav.jump_to_page(target_page):
+            self.logger.error("Failed to restore page position.")
+            return False
+
+        self.logger.info(f"Restored position to page {target_page}.")
+        return True
+
+    async def _move_to_next_page(self, current_page: int) -> bool:
+        """다음 페이지 이동 (False: 마지막 페이지, 이동을 확인하지 못하면 다시 이동하고 끝내 실패하면 예외)"""
+        try:
+            return await self.nav.move_to_next_page(current_page)
+        except PageMoveFailed as e:
+            self.logger.warning(f"Page move not confirmed: {e}")
+
+        next_page = current_page + 1
+        attempts = max(1, self.config['system'].get('playwright', {}).get('max_retries', 3))
+        for _ in range(attempts):
+            if await self._restore_search_state(next_page) and await self.waits.loading_done(self.page):
+                return True
+        raise RuntimeError(f"cannot move to page {next_page} after {attempts} attempts")
+
+    async def _extract_data(self) -> AsyncIterator[BidNotice]:
+        """전체 페이지 데이터 추출 (페이지 단위로 yield)"""
+        start_page, start_index = self.state.load()
+        self.retries.restore(self.state.load_retries())
+        if start_page > 1:
+            self.logger.info(f"Checkpoint loaded. Page: {start_page}, Index: {start_index}")
+            await self._restore_search_state(start_page)
+
+        current_page = start_page
+        current_index_start = start_index
+
+        while True:
+            self.logger.info(f"=== Processing Page {current_page} (Start Index: {current_index_start}) ===")
+
+            # 첨부파일은 페이지 단위로 동시에 다운로드
+            results = await self._process_page_items(current_page, current_index_start)
+            await self._download_attachments(results)
+            for bid in results:
+                yield bid
+
+            # 이동 실패는 예외로 끝나며 체크포인트는 유지
+            if not await self._move_to_next_page(current_page):
+                self.logger.info("End of pages.")
+                break
+
+            current_page += 1
+            current_index_start = 0
+
+            self._save_checkpoint(current_page, 0)
+            await self.waits.pace("page_change")
+
+        # 실패한 행 마지막 재시도
+        while len(self.retries):
+            for page_no in self.retries.pages():
+                entries = self.retries.entries(page_no)
+                delay = self.retries.wait_time(entries)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self.logger.info(f"Retrying {len(entries)} rows on page {page_no}.")
+                retried = await self._retry_entries(page_no, entries)
+                await self._download_attachments(retried)
+                for bid in retried:
+                    yield bid
+        s = self.retries.summary()
+        if s['recovered'] or s['gave_up']:
+            self.logger.info(f"Retry summary: recovered {s['recovered']} rows, gave up {s['gave_up']}.")
+
+        self.state.clear()
+
+        if self.known:
+            s = self.known.summary()
+            self.logger.info(f"Incremental summary: skipped {s['skipped']} unchanged rows, "
+                             f"fetched {s['fetched']} (changed {s['changed']}, new {s['new']}).")
+
+    async def _process_page_items(self, expected_page: int, start_index: int) -> List[BidNotice]:
+        """한 페이지의 아이템을 작업 탭에서 동시에 처리"""
+        try:
+            # 그리드 로딩 및 스냅샷 (evaluate 1회)
+            await self.page.locator(GRID_ROWS_SELECTOR).first.wait_for(state="visible", timeout=15000)
+            snapshot = await self.parser.snapshot_grid(self.page, GRID_ROWS_SELECTOR)
+            count = len(snapshot)
+            self.logger.info(f"Found {count} rows. Starting from index {start_index}.")
+
+            tasks = []
+            for snap in snapshot[start_index:]:
+                if not snap['visible'] or not snap['has_link']: continue
+                list_data = NuriParser.to_basic_data(NuriParser.parse_snapshot_row(snap))
+                # 저장된 공고와 목록 필드가 같으면 상세 수집 생략
+                if self.known is not None and not self.known.should_fetch(list_data): continue
+                tasks.append((snap['index'], list_data))
+
+        except Exception as e:
+            self.logger.error(f"Page processing error: {e}")
+            return []
+
+        # 완료 순서와 무관하게 '연속으로 끝난 위치'까지만 체크포인트 저장
+        pending: Set[int] = {i for i, _ in tasks}
+
+        async def fetch_and_mark(index: int, list_data: Dict[str, Any]) -> Optional[BidNotice]:
+            bid = None
+            try:
+                bid = await self._fetch_detail(expected_page, index, list_data)
+                return bid
+            finally:
+                if not bid:
+                    self.retries.push(expected_page, index, list_data, "detail failed")
+                pending.discard(index)
+                next_index = min(pending) if pending else count
+                self._save_checkpoint(expected_page, next_index, [bid] if bid else [])
+
+        outcomes = await asyncio.gather(*(fetch_and_mark(i, data) for i, data in tasks))
+        results = [bid for bid in outcomes if bid]
+
+        # 기한이 된 같은 페이지 재시도 (작업 탭은 이미 이 페이지에 있음)
+        due = self.retries.due(expected_page)
+        if due:
+            results.extend(await self._retry_entries(expected_page, due))
+        return results
+
+    async def _retry_entries(self, list_page: int, entries: List[RetryEntry]) -> List[BidNotice]:
+        """재시도 실행 (작업 탭에서 동시에, 체크포인트 위치는 유지하고 결과만 기록)"""
+        outcomes = await asyncio.gather(*(self._fetch_detail(list_page, e.index, e.list_data) for e in entries))
+        results = []
+        for entry, bid in zip(entries, outcomes):
+            if not bid:
+                self.retries.push(list_page, entry.index, entry.list_data, entry.error)
+                continue
+            self.retries.resolve(entry.key)
+            self._save_checkpoint(*self.state.load(), [bid])
+            results.append(bid)
+        return results
+
+    def _save_checkpoint(self, page: int, index: int, notices: List[BidNotice] = ()):
+        """페이지와 인덱스 저장 (스풀 사용 시 수집한 공고, 바뀐 재시도 대기열도 함께 기록)"""
+        self.state.save(page, index, notices, retries=self.retries.take_changes())
+
+    async def _fetch_detail(self, expected_page: int, index: int, list_data: Dict[str, Any]) -> Optional[BidNotice]:
+        """작업 탭 하나를 빌려 상세 수집 (실패는 해당 탭에만 격리)"""
+        async with self.semaphore:
+            worker: AsyncDetailWorker = await self._idle_workers.get()
+            try:
+                await self._sync_worker(worker, expected_page)
+
+                link = await self._find_row_link(worker, index, list_data['notice_code_full'])
+                if link is None or not await worker.nav.enter_detail_page(link):
+                    raise RuntimeError("detail page not loaded")
+
+                self.logger.info(f"[Worker {worker.worker_id}] Processing [{index + 1}]: {list_data['title']}")
+                bid = await self.parser.parse_detail(worker.page, list_data)
+                await worker.nav.go_back_to_list()
+
+                if bid:
+                    bid.notice_code, bid.degree = BidFactory.split_notice_code(list_data['notice_code_full'])
+                    bid.list_fingerprint = KnownNoticeIndex.fingerprint(list_data)
+                    if self.known is not None:
+                        self.known.remember(list_data)
+                return bid
+
+            except Exception as e:
+                self.logger.error(f"[Worker {worker.worker_id}] Row {index} failed: {e}")
+                worker.list_page = 0
+                return None
+            finally:
+                self._idle_workers.put_nowait(worker)
+
+    async def _find_row_link(self, worker: AsyncDetailWorker, index: int, notice_code_full: str):
+        """작업 탭의 같은 인덱스 행이 목록 탭과 같은 공고인지 확인 후 링크 반환"""
+        row = worker.nav.get_row(index)
+        await row.wait_for(state="visible", timeout=15000)
+
+        # 페이지 이동 직후에는 이전 그리드가 남아 있을 수 있으므로 공고번호가 일치할 때까지 대기
+        if not notice_code_full or await self.waits.row_cell_text(
+                worker.page, GRID_ROWS_SELECTOR, index, NuriParser.LIST_COLUMNS['notice_code'], notice_code_full,
+                timeout=5000):
+            return row.locator("td").nth(NuriParser.TITLE_COLUMN).locator("a").first
+
+        self.logger.warning(f"[Worker {worker.worker_id}] Row {index} mismatch. Expected {notice_code_full}.")
+        return None
+
+    async def _sync_worker(self, worker: AsyncDetailWorker, list_page: int):
+        """작업 탭을 목록 탭과 같은 페이지로 이동"""
+        if worker.list_page == list_page:
+            return
+        if worker.list_page == 0:
+            await self._reset_worker(worker)
+
+        if not await worker.nav.jump_to_page(list_page):
+            raise RuntimeError(f"cannot reach page {list_page}")
+        worker.list_page = list_page
+
+    async def _reset_worker(self, worker: AsyncDetailWorker):
+        """작업 탭을 검색 결과 1페이지 상태로 초기화"""
+        worker.list_page = 0
+        await self._open_search(worker.nav)
+        worker.list_page = 1
@@ -0,0 +1,18 @@
+from typing import Dict, Any
+from playwright.async_api import Page
+from src.utils.metrics import timed
+from src.crawlers.components.nuri_detail_extractor import (
+    NuriDetailExtractor, TITLE_SELECTOR, ATTACHMENT_LABEL, DETAIL_SNAPSHOT_JS
+)
+
+class AsyncNuriDetailExtractor(NuriDetailExtractor):
+    """
+    NuriDetailExtractor의 playwright.async_api 버전
+    FIELD_CONFIG, 라벨 매칭, 병합 규칙은 부모 클래스를 그대로 사용합니다.
+    """
+
+    @timed("extractor.extract_all")
+    async def extract_all(self, page: Page, list_data: Dict[str, str]) -> Dict[str, Any]:
+        """상세 페이지 정보 추출 및 목록 데이터 병합 (evaluate 1회)"""
+        snapshot = await page.evaluate(DETAIL_SNAPSHOT_JS, [TITLE_SELECTOR, ATTACHMENT_LABEL, self.snapshot_container])
+        return self.with_html(self.extract_from_snapshot(snapshot, list_data), snapshot)
@@ -0,0 +1,308 @@
+from typing import Optional
+from playwright.async_api import Page, Locator
+from src.core.async_page_context import AsyncPageContext
+from src.crawlers.components.nuri_navigator import (
+    GRID_SELECTOR, GRID_ROWS_SELECTOR, DETAIL_HEADER_SELECTOR,
+    POPUP_CLOSE_SELECTOR, UNLOCK_DATE_INPUT_JS, SEARCH_DROPDOWNS,
+    PAGE_LABEL_SELECTOR, SELECTED_PAGE_SELECTOR, PAGELIST_ID, NEXT_GROUP_SELECTOR, PREV_GROUP_SELECTOR,
+    ROWS_PER_PAGE_SELECTOR, MAX_GROUP_HOPS, PAGELIST_JUMP_JS, PAGE_LABELS_JS, PAGE_GROUP_CHANGED_JS,
+    PageMoveFailed
+)
+from src.crawlers.components.wait_engine import AsyncWaitEngine
+from src.utils.metrics import timed
+
+class AsyncNuriNavigator:
+    """NuriNavigator의 playwright.async_api 버전 (동작과 셀렉터는 동일)"""
+
+    def __init__(self, context: AsyncPageContext, logger, waits: Optional[AsyncWaitEngine] = None):
+        self.ctx = context
+        self.logger = logger
+        self.waits = waits or AsyncWaitEngine({}, logger)
+
+    @property
+    def page(self) -> Page:
+        return self.ctx.current
+
+    @timed("navigator.go_to_main")
+    async def go_to_main(self, url: str):
+        self.logger.info(f"Navigating to {url}")
+        await self.waits.throttle()
+        await self.page.goto(url)
+        await self.page.wait_for_load_state("networkidle")
+        await self._close_popups()
+
+    async def _close_popups(self):
+        await self.waits.loading_done(self.page)
+        # 최대 5개의 팝업이 있다고 가정하고 순차적으로 닫기 시도
+        for _ in range(5):
+            close_buttons = self.page.locator(POPUP_CLOSE_SELECTOR)
+
+            count = await close_buttons.count()
+            if count == 0:
+                break # 더 이상 닫을 팝업이 없음
+
+            self.logger.info(f"Found {count} popups. Closing them...")
+            # 보이는 닫기 버튼을 모두 클릭
+            for i in range(count):
+                btn = close_buttons.nth(i)
+                if await btn.is_visible():
+                    await btn.click(force=True)
+                    await self.waits.until_state("popup", btn, "hidden", timeout=3000)
+
+    @timed("navigator.go_to_bid_list")
+    async def go_to_bid_list(self):
+        """입찰공고 목록 메뉴로 이동"""
+        self.logger.info("Moving to Bid Notice List...")
+        try:
+            # 상단 메뉴 Hover
+            await self.page.locator("#mf_wfm_gnb_wfm_gnbMenu_genDepth1_1_btn_menuLvl1").hover()
+            # 하위 메뉴가 펼쳐지면 클릭
+            menu = self.page.get_by_role("link", name="입찰공고목록")
+            await self.waits.until_state("menu", menu, "visible", timeout=5000)
+            await self.waits.throttle()
+            await menu.click()
+            await self.page.wait_for_load_state("networkidle")
+        except Exception as e:
+            self.logger.error(f"Menu navigation failed: {e}")
+            raise e
+
+    @timed("navigator.set_search_conditions")
+    async def set_search_conditions(self, config: dict):
+        """검색 조건 설정"""
+        self.logger.info("Applying search conditions...")
+        await self.page.get_by_role("button", name="상세조건").click()
+        try:
+            # 키워드
+            if config.get('keyword'):
+                try: await self.page.get_by_label("입찰공고명").fill(config['keyword'])
+                except: await self.page.locator("#mf_wfm_container_tbxBidPbancNm").fill(config['keyword'])
+
+            # 날짜 설정
+            date_config = config.get('date', {})
+            mode = date_config.get('mode', 'preset')
+
+            if mode == 'manual':
+                start_date = date_config.get('start_date', '')
+                end_date = date_config.get('end_date', '')
+
+                if start_date and end_date:
+                    self.logger.info(f"Setting date range (Force Input): {start_date} ~ {end_date}")
+
+                    # 공고게시일자 행 찾기
+                    date_row = self.page.locator("tr").filter(has_text="공고게시일자")
+                    await self._force_input_date(date_row.locator("input[title*='시작 날짜']"), start_date)
+                    await self._force_input_date(date_row.locator("input[title*='종료 날짜']"), end_date)
+            else:
+                # 기간 버튼(Preset) 클릭 모드
+                preset = date_config.get('preset_value', '1개월')
+                try:
+                    await self.page.get_by_text(preset, exact=True).click()
+                except:
+                    self.logger.warning(f"Failed to click date preset: {preset}")
+
+            # 드롭다운
+            for key, label in SEARCH_DROPDOWNS.items():
+                val = config.get(key)
+                if val and val != "전체":
+                    try:
+                        t = self.page.get_by_label(label).first
+                        if await t.is_visible(): await t.select_option(label=val)
+                    except Exception as e:
+                        self.logger.warning(f"Failed to set dropdown {label}: {e}")
+
+            # 페이지당 조회 건수
+            await self._set_rows_per_page(config.get('rows_per_page'))
+
+            # 검색 버튼 클릭
+            signature = await self.waits.grid_signature(self.page, GRID_ROWS_SELECTOR)
+            await self.waits.throttle()
+            await self.page.get_by_role("button", name="검색", exact=True).click()
+            await self.page.wait_for_load_state("networkidle")
+            # 조회 결과가 이전 목록과 같을 수 있으므로 그리드 변화가 없으면 로딩 마스크만 확인 (속도 감소 신호 아님)
+            if not await self.waits.grid_changed(self.page, GRID_ROWS_SELECTOR, signature, name="search", penalize=False):
+                await self.waits.loading_done(self.page)
+
+        except Exception as e:
+            self.logger.error(f"Error setting conditions: {e}")
+
+    async def _force_input_date(self, target_locator: Locator, date_value: str):
+        if not await target_locator.is_visible(): return
+
+        await target_locator.click(force=True)
+        await target_locator.evaluate(UNLOCK_DATE_INPUT_JS)
+        await target_locator.clear()
+        await target_locator.type(date_value, delay=10)
+        await target_locator.press("Tab")
+        await self.waits.input_value(target_locator, date_value)
+
+    async def _set_rows_per_page(self, value):
+        """페이지당 조회 건수 선택 ('max'면 가장 큰 옵션)"""
+        if not value:
+            return
+        try:
+            select = self.page.locator(ROWS_PER_PAGE_SELECTOR).first
+            if not await select.is_visible():
+                self.logger.warning("Rows-per-page selector not found.")
+                return
+            options = [o.strip() for o in await select.evaluate("el => Array.from(el.options).map(o => o.text)")]
+            numeric = [o for o in options if o.isdigit()]
+            label = max(numeric, key=int) if str(value).lower() == 'max' and numeric else str(value)
+            await select.select_option(label=label)
+            self.logger.info(f"Rows per page set to {label}.")
+        except Exception as e:
+            self.logger.warning(f"Failed to set rows per page ({value}): {e}")
+
+    async def current_page(self) -> Optional[int]:
+        """현재 선택된 목록 페이지 번호 (페이지 목록이 없으면 None)"""
+        return (await self.page.evaluate(PAGE_LABELS_JS, [PAGE_LABEL_SELECTOR, SELECTED_PAGE_SELECTOR]))['selected']
+
+    async def is_on_list(self) -> bool:
+        try:
+            return await self.page.locator(GRID_SELECTOR).first.is_visible()
+        except Exception:
+            return False
+
+    @timed("navigator.jump_to_page")
+    async def jump_to_page(self, target_page: int) -> bool:
+        """목록을 target_page로 바로 이동 (pageList API -> 그룹 화살표 + 번호)"""
+        try:
+            if await self.current_page() == target_page:
+                return True
+            self.logger.info(f"Jumping to page {target_page}...")
+            signature = await self.waits.grid_signature(self.page, GRID_ROWS_SELECTOR)
+
+            await self.waits.throttle()
+            if await self.page.evaluate(PAGELIST_JUMP_JS, [PAGELIST_ID, target_page]):
+                if await self.waits.selected_page(self.page, SELECTED_PAGE_SELECTOR, target_page):
+                    await self.waits.grid_changed(self.page, GRID_ROWS_SELECTOR, signature, name="page_change")
+                    return True
+                self.logger.warning("Pagelist API did not move the grid. Falling back to group arrows.")
+
+            return await self._jump_by_groups(target_page)
+
+        except Exception as e:
+            self.logger.error(f"Page jump error: {e}")
+            return False
+
+    async def _jump_by_groups(self, target_page: int) -> bool:
+        for _ in range(MAX_GROUP_HOPS):
+            state = await self.page.evaluate(PAGE_LABELS_JS, [PAGE_LABEL_SELECTOR, SELECTED_PAGE_SELECTOR])
+            labels = state['labels']
+            if state['selected'] == target_page:
+                return True
+            if not labels:
+                return False
+
+            signature = await self.waits.grid_signature(self.page, GRID_ROWS_SELECTOR)
+            if target_page in labels:
+                await self.waits.throttle()
+                await self.page.locator(f"{PAGE_LABEL_SELECTOR}:text-is('{target_page}')").first.click(force=True)
+                return await self._wait_page_change(target_page, signature)
+
+            arrow = self.page.locator(NEXT_GROUP_SELECTOR if target_page > max(labels) else PREV_GROUP_SELECTOR)
+            if not await arrow.is_visible():
+                self.logger.warning(f"Page {target_page} is out of range (visible: {labels[0]}~{labels[-1]}).")
+                return False
+            await self.waits.throttle()
+            await arrow.click(force=True)
+            await self.waits.until("page_group", self.page, PAGE_GROUP_CHANGED_JS, [PAGE_LABEL_SELECTOR, labels[0]])
+            await self.waits.loading_done(self.page)
+
+        self.logger.error(f"Too many group moves while jumping to page {target_page}.")
+        return False
+
+    @timed("navigator.move_to_next_page")
+    async def move_to_next_page(self, current_page: int) -> bool:
+        """페이지네이션 처리 (False: 다음 페이지 없음, 이동을 확인하지 못하면 PageMoveFailed)"""
+        next_page = current_page + 1
+        self.logger.info(f"Attempting to move to page {next_page}...")
+
+        try:
+            signature = await self.waits.grid_signature(self.page, GRID_ROWS_SELECTOR)
+            await self.waits.throttle()
+
+            # 숫자 버튼
+            next_btn = self.page.locator(f".w2pageList_label:text-is('{next_page}')").first
+            if await next_btn.is_visible():
+                await next_btn.click(force=True)
+                return await self._confirm_page_change(next_page, signature)
+
+            # 화살표 버튼
+            arrow = self.page.locator(NEXT_GROUP_SELECTOR)
+            if await arrow.is_visible():
+                self.logger.info("Clicking next group arrow...")
+                await arrow.click(force=True)
+
+                # 이동 확인 (현재 선택된 페이지 번호 확인)
+                if await self.waits.selected_page(self.page, SELECTED_PAGE_SELECTOR, next_page):
+                    return await self._confirm_page_change(next_page, signature)
+
+                # 버튼 다시 찾기
+                next_btn_after = self.page.locator(f".w2pageList_label:text-is('{next_page}')").first
+                if await next_btn_after.is_visible():
+                    await next_btn_after.click(force=True)
+                    return await self._confirm_page_change(next_page, signature)
+                # 다음 그룹 화살표가 있었으므로 마지막 페이지가 아님
+                raise PageMoveFailed(f"page {next_page} did not appear after the group arrow")
+
+            return False
+        except PageMoveFailed:
+            raise
+        except Exception as e:
+            raise PageMoveFailed(f"pagination error: {e}") from e
+
+    async def _confirm_page_change(self, page_no: int, signature) -> bool:
+        """다음 페이지 클릭 후 이동 확인 (확인하지 못하면 마지막 페이지와 구분하도록 예외)"""
+        if not await self._wait_page_change(page_no, signature):
+            raise PageMoveFailed(f"page {page_no} change was not confirmed in time")
+        return True
+
+    async def _wait_page_change(self, page_no: int, signature) -> bool:
+        """선택 페이지 번호와 그리드 갱신 대기 (둘 다 확인되어야 True, 이전 목록을 읽지 않도록)"""
+        if not await self.waits.selected_page(self.page, SELECTED_PAGE_SELECTOR, page_no):
+            return False
+        return await self.waits.grid_changed(self.page, GRID_ROWS_SELECTOR, signature, name="page_change")
+
+    def get_row(self, index: int) -> Locator:
+        """목록 그리드의 index번째 행"""
+        return self.page.locator(GRID_ROWS_SELECTOR).nth(index)
+
+    @timed("navigator.enter_detail_page")
+    async def enter_detail_page(self, link_element) -> bool:
+        """상세 페이지 진입"""
+        try:
+            if not await self.click_detail_link(link_element):
+                return False
+            return await self.wait_for_detail_page()
+
+        except Exception as e:
+            self.logger.error(f"Error entering detail: {e}")
+            return False
+
+    async def click_detail_link(self, link_element) -> bool:
+        """상세 링크 클릭만 수행 (화면 전환은 기다리지 않음)"""
+        if not await link_element.is_visible():
+            self.logger.warning("Link element not visible.")
+            return False
+
+        await self.waits.throttle()
+        try: await link_element.evaluate("el => el.click()")
+        except: await link_element.click(force=True)
+        return True
+
+    async def wait_for_detail_page(self) -> bool:
+        """상세 화면 전환 대기 (헤더 텍스트)"""
+        if await self.waits.text_contains("detail", self.page, DETAIL_HEADER_SELECTOR, "상세", timeout=5000):
+            return True
+
+        # 타임아웃
+        self.logger.error("Timeout waiting for detail page header.")
+        return False
+
+    @timed("navigator.go_back_to_list")
+    async def go_back_to_list(self):
+        """목록으로 복귀"""
+        await self.waits.throttle()
+        await self.page.go_back()
+        await self.page.locator(GRID_SELECTOR).first.wait_for(state="visible", timeout=10000)
+        await self.waits.loading_done(self.page)
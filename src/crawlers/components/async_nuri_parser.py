@@ -0,0 +1,44 @@
+from typing import Optional, Dict, Any, List
+from playwright.async_api import Page
+from src.models.bid_notice import BidNotice
+from src.crawlers.components.nuri_parser import NuriParser, GRID_SNAPSHOT_JS
+from src.crawlers.components.async_nuri_detail_extractor import AsyncNuriDetailExtractor
+from src.crawlers.components.bid_factory import BidFactory
+from src.crawlers.components.snapshot_store import DetailSnapshotStore
+from src.utils.metrics import timed
+
+class AsyncNuriParser:
+    """NuriParser의 playwright.async_api 버전 (컬럼 정의와 정제 규칙은 NuriParser 공유)"""
+
+    def __init__(self, logger):
+        self.logger = logger
+        self.extractor = AsyncNuriDetailExtractor(logger)
+        self.snapshots: Optional[DetailSnapshotStore] = None
+
+    def enable_snapshots(self, store: DetailSnapshotStore, container: str):
+        """상세 파싱 시 container 영역 HTML을 스냅샷 저장소에 보관"""
+        self.snapshots = store
+        self.extractor.snapshot_container = container
+
+    @timed("parser.snapshot_grid")
+    async def snapshot_grid(self, page: Page, rows_selector: str) -> List[Dict[str, Any]]:
+        """그리드 전체를 evaluate 1회로 스냅샷 (NuriParser.snapshot_grid 참고)"""
+        return await page.evaluate(GRID_SNAPSHOT_JS, [rows_selector, NuriParser.TITLE_COLUMN])
+
+    @timed("parser.parse_detail")
+    async def parse_detail(self, page: Page, list_data: Dict[str, Any]) -> Optional[BidNotice]:
+        """상세 페이지 파싱"""
+        try:
+            raw_data = await self.extractor.extract_all(page, list_data)
+            if self.snapshots:
+                self.snapshots.keep(raw_data, list_data, page.url)
+            bid_notice = BidFactory.create_bid_notice(raw_data)
+
+            if bid_notice:
+                self.logger.info(f"Parsed Successfully: {bid_notice.title}")
+
+            return bid_notice
+
+        except Exception as e:
+            self.logger.error(f"Detail parsing failed: {e}")
+            return None
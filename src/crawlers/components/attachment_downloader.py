@@ -0,0 +1,233 @@
+import os
+import time
+import uuid
+import hashlib
+import threading
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from src.models.bid_notice import BidNotice, BidAttachment
+from src.crawlers.components.rate_controller import RateController
+from src.utils.metrics import timed
+
+# 상세 화면 첨부파일 링크 (파일명으로 찾기)
+ATTACHMENT_LINK_SELECTOR = "//th[contains(., '첨부파일')]/following-sibling::td//a"
+
+
+def format_size(size: int) -> str:
+    """바이트 수 -> '14.5KB' 형식"""
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{int(value)}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{size}B"
+
+
+class AttachmentStore:
+    """
+    SHA-256 내용 주소 파일 저장소 (root/ab/cd/<sha256>)
+    - 같은 파일은 공고가 달라도 한 번만 저장됩니다.
+    - 받는 중인 파일은 root/.partial/ 아래에 두어 중단 후 이어받을 수 있습니다.
+      (URL별 이어받기 파일을 시도마다 고유한 이름으로 옮겨 쓰므로 여러 프로세스가 같은 파일을 함께 쓰지 않음)
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.partial_dir = os.path.join(root, ".partial")
+        os.makedirs(self.partial_dir, exist_ok=True)
+
+    def path_for(self, sha256: str) -> str:
+        return os.path.join(self.root, sha256[:2], sha256[2:4], sha256)
+
+    def partial_path(self, url: str) -> str:
+        """URL별 이어받기 파일 (중단된 시도가 남긴 파일)"""
+        return os.path.join(self.partial_dir, hashlib.blake2b(url.encode(), digest_size=16).hexdigest() + ".part")
+
+    def begin(self, url: str) -> str:
+        """
+        이번 시도 전용 임시 파일 경로 반환
+        - 이어받기 파일이 있으면 고유한 이름으로 옮겨 사용 (rename은 원자적이므로 한 시도만 가져감)
+        """
+        attempt = f"{self.partial_path(url)}.{os.getpid()}-{threading.get_ident()}-{uuid.uuid4().hex[:8]}"
+        try:
+            os.rename(self.partial_path(url), attempt)
+        except FileNotFoundError:
+            pass
+        return attempt
+
+    def suspend(self, url: str, attempt: str):
+        """실패한 시도의 파일을 이어받기 파일로 되돌림 (다른 시도가 이미 남겼으면 삭제)"""
+        if not os.path.exists(attempt):
+            return
+        resume = self.partial_path(url)
+        if os.path.exists(resume):
+            os.remove(attempt)
+        else:
+            os.replace(attempt, resume)
+
+    def commit(self, partial: str, sha256: str) -> str:
+        """받은 파일을 해시 경로로 이동 (이미 있으면 임시 파일만 삭제)"""
+        target = self.path_for(sha256)
+        if os.path.exists(target):
+            os.remove(partial)
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            # 다른 프로세스가 같은 내용을 먼저 옮겼어도 내용이 같으므로 덮어써도 됨
+            os.replace(partial, target)
+        return target
+
+
+class AttachmentDownloader:
+    """
+    첨부파일 동시 다운로드
+    - 상세 화면 링크의 href를 그대로 쓰고, 스크립트 링크는 브라우저 download 이벤트로 URL만 얻습니다. (capture_urls)
+    - concurrency개 스레드로 나누어 받으며, 청크 단위로 디스크에 쓰고 Range 요청으로 이어받습니다.
+    - BidAttachment에 download_url, file_size, sha256을 채웁니다. (같은 URL은 실행 중 한 번만 받음)
+    """
+
+    def __init__(self, config: Dict, logger, rate: Optional[RateController] = None):
+        self.logger = logger
+        self.store = AttachmentStore(config.get('dir', 'attachments'))
+        self.concurrency = max(1, config.get('concurrency', 4))
+        self.timeout = config.get('timeout', 60)
+        self.chunk_size = config.get('chunk_size', 65536)
+        self.capture_downloads = config.get('capture_downloads', True)
+        self.capture_timeout = config.get('capture_timeout', 5000)
+        self.rate = rate or RateController({'enabled': False}, logger)
+
+        self._done: Dict[str, Tuple[str, int]] = {}
+        # URL별 잠금 (같은 URL을 동시에 받지 않고 먼저 받은 결과를 재사용)
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.counts = {'downloaded': 0, 'reused': 0, 'failed': 0, 'bytes': 0}
+
+    def capture_urls(self, page, bid: BidNotice):
+        """
+        URL이 없는 첨부파일은 링크를 클릭해 download 이벤트의 URL을 기록 (다운로드는 취소)
+        - 클릭이 다운로드 대신 화면을 이동시키면 뒤로 가기로 상세 화면을 되돌리고 남은 링크는 건너뜁니다.
+        """
+        if not self.capture_downloads:
+            return
+        detail_url = page.url
+        links = page.locator(ATTACHMENT_LINK_SELECTOR)
+        for attach in bid.attachments:
+            if attach.download_url:
+                continue
+            link = links.filter(has_text=attach.file_name).first
+            try:
+                with page.expect_download(timeout=self.capture_timeout) as info:
+                    link.click()
+                download = info.value
+                attach.download_url = download.url
+                download.cancel()
+            except Exception as e:
+                self.logger.warning(f"No download URL for attachment '{attach.file_name}': {str(e).splitlines()[0]}")
+
+            if page.url != detail_url:
+                self.logger.warning(f"Attachment link '{attach.file_name}' navigated to {page.url}. Restoring detail page.")
+                self._restore_detail(page, detail_url)
+                return
+
+    def _restore_detail(self, page, detail_url: str):
+        """첨부파일 링크가 이동시킨 화면을 상세 화면으로 되돌림 (실패하면 예외: 호출 측의 행 복구로 넘김)"""
+        page.go_back()
+        page.wait_for_load_state("networkidle")
+        if page.url != detail_url:
+            raise RuntimeError(f"detail page not restored after attachment click (at {page.url})")
+
+    def download_all(self, bids: List[BidNotice], cookies: Optional[List[Dict[str, Any]]] = None):
+        """공고 목록의 첨부파일을 동시에 받아 필드 채움 (실패한 파일은 URL만 남김)"""
+        attachments = [a for bid in bids for a in bid.attachments if a.download_url and not a.sha256]
+        if not attachments:
+            return
+        cookie_header = "; ".join(f"{c['name']}={c['value']}" for c in cookies or [])
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(lambda a: self._fill(a, cookie_header), attachments))
+
+    def _fill(self, attach: BidAttachment, cookie_header: str):
+        try:
+            sha256, size = self.fetch(attach.download_url, cookie_header)
+        except Exception as e:
+            with self._lock:
+                self.counts['failed'] += 1
+            self.logger.error(f"Attachment download failed ({attach.file_name}): {e}")
+            return
+        attach.sha256 = sha256
+        attach.file_size = format_size(size)
+
+    @timed("attachments.fetch")
+    def fetch(self, url: str, cookie_header: str = "") -> Tuple[str, int]:
+        """URL을 받아 저장하고 (sha256, 바이트 수) 반환"""
+        with self._lock:
+            url_lock = self._url_locks.setdefault(url, threading.Lock())
+        with url_lock:
+            with self._lock:
+                if url in self._done:
+                    self.counts['reused'] += 1
+                    return self._done[url]
+
+            partial = self.store.begin(url)
+            try:
+                sha256, size = self._download(url, partial, cookie_header)
+            except BaseException:
+                self.store.suspend(url, partial)
+                raise
+
+            with self._lock:
+                self._done[url] = (sha256, size)
+                self.counts['downloaded'] += 1
+                self.counts['bytes'] += size
+            return sha256, size
+
+    def _download(self, url: str, partial: str, cookie_header: str) -> Tuple[str, int]:
+        """partial에 이어받아 저장소로 옮기고 (sha256, 바이트 수) 반환"""
+        digest = hashlib.sha256()
+        offset = 0
+        if os.path.exists(partial):
+            # 이어받기: 받은 부분을 먼저 해시에 반영
+            with open(partial, 'rb') as f:
+                for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                    digest.update(chunk)
+                    offset += len(chunk)
+
+        headers = {"Cookie": cookie_header} if cookie_header else {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        self.rate.acquire()
+        # 응답 지연 (본문 수신 시간은 파일 크기에 비례하므로 제외)
+        started = time.monotonic()
+        try:
+            resp = urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            self.rate.on_response(e.code, time.monotonic() - started)
+            if e.code != 416 or not offset:
+                raise
+            # 이미 끝까지 받은 파일
+            resp = None
+
+        if resp is not None:
+            latency = time.monotonic() - started
+            with resp:
+                if offset and resp.status != 206:
+                    # 서버가 Range를 지원하지 않으면 처음부터 다시 받기
+                    digest, offset = hashlib.sha256(), 0
+                mode = 'ab' if offset else 'wb'
+                with open(partial, mode) as f:
+                    for chunk in iter(lambda: resp.read(self.chunk_size), b""):
+                        f.write(chunk)
+                        digest.update(chunk)
+                        offset += len(chunk)
+            self.rate.on_success(latency)
+
+        sha256 = digest.hexdigest()
+        self.store.commit(partial, sha256)
+        return sha256, offset
+
+    def log_summary(self):
+        c = self.counts
+        self.logger.info(f"Attachments: {c['downloaded']} downloaded ({format_size(c['bytes'])}), "
+                         f"{c['reused']} reused, {c['failed']} failed.")
@@ -1,7 +1,11 @@
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from src.models.bid_notice import BidNotice, BidDetail, BidAttachment
 
+# 날짜와 시각이 붙은 문자열 (2026-02-0310:00)
+_DATE_TIME_GLUED = re.compile(r"(\d{4}-\d{2}-\d{2})(\d{2}:\d{2})")
+_NON_DIGITS = re.compile(r"[^\d]")
+
 class BidFactory:
     """Raw 데이터를 도메인 모델(BidNotice)로 변환하는 팩토리"""
 
@@ -12,7 +16,9 @@ class BidFactory:
         """
         # 첨부파일 객체 변환 (String List -> Object List)
         attachment_names = raw_data.get('attachment_names', [])
-        attachments = [BidAttachment(file_name=name) for name in attachment_names]
+        attachment_urls = raw_data.get('attachment_urls') or [''] * len(attachment_names)
+        attachments = [BidAttachment(file_name=name, download_url=url or None)
+                       for name, url in zip(attachment_names, attachment_urls)]
 
         # 상세 정보 생성
         detail = BidFactory._create_bid_detail(raw_data)
@@ -22,7 +28,7 @@ class BidFactory:
             if not d_str or not isinstance(d_str, str):
                 return None
             temp = d_str.replace("/", "-").strip()
-            temp = re.sub(r"(\d{4}-\d{2}-\d{2})(\d{2}:\d{2})", r"\1 \2", temp)
+            temp = _DATE_TIME_GLUED.sub(r"\1 \2", temp)
             return temp
 
         # 최종 객체 반환
@@ -40,11 +46,18 @@ class BidFactory:
             contract_method=raw_data.get('contract_method', ''),
             bid_method=raw_data.get('bid_method', ''),
             succ_method=raw_data.get('succ_method', ''),
-            collected_at=None,
             detail_info=detail,
             attachments=attachments
         )
 
+    @staticmethod
+    def split_notice_code(notice_code_full: str) -> Tuple[str, str]:
+        """'공고번호-차수' 문자열을 (공고번호, 차수)로 분리"""
+        if "-" in notice_code_full:
+            code, degree = notice_code_full.split("-", 1)
+            return code, degree
+        return notice_code_full, "00"
+
     @staticmethod
     def _create_bid_detail(data: Dict[str, Any]) -> BidDetail:
         briefing_text = data.get('briefing_yn_text', '')
@@ -70,5 +83,5 @@ class BidFactory:
         """문자열에서 숫자만 추출하여 int로 변환"""
         if not text or not isinstance(text, str):
             return 0
-        clean = re.sub(r"[^\d]", "", text)
+        clean = _NON_DIGITS.sub("", text)
         return int(clean) if clean else 0
\ No newline at end of file
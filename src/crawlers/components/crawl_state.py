@@ -0,0 +1,61 @@
+import json
+import os
+from typing import Tuple, Iterable, Any, List, Dict, Optional
+
+class CrawlStateStore:
+    """
+    (페이지, 인덱스) 체크포인트 파일 저장소
+    - 임시 파일에 쓴 뒤 교체하므로 쓰는 도중 중단되어도 이전 체크포인트가 남습니다.
+    - 재시도 대기 중인 행도 같은 파일에 기록합니다.
+    - 수집 결과는 보관하지 않습니다. (결과까지 보관하려면 ResultSpool 사용)
+    """
+
+    def __init__(self, path: str, logger):
+        self.path = path
+        self.logger = logger
+        # 마지막으로 기록한 재시도 대기 행 (save에서 retries를 생략하면 그대로 다시 기록)
+        self._retries: List[Dict[str, Any]] = []
+
+    def _read(self) -> Dict[str, Any]:
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                self.logger.warning(f"Failed to read state file: {e}")
+        return {}
+
+    def load(self) -> Tuple[int, int]:
+        """(페이지, 인덱스) 반환"""
+        data = self._read()
+        return data.get('page', 1), data.get('index', 0)
+
+    def load_retries(self) -> List[Dict[str, Any]]:
+        """기록된 재시도 대기 행"""
+        self._retries = self._read().get('retries', [])
+        return list(self._retries)
+
+    def save(self, page: int, index: int, notices: Iterable[Any] = (),
+             retries: Optional[List[Dict[str, Any]]] = None):
+        """페이지와 인덱스 저장 (notices는 ResultSpool 호환용, 무시 / retries가 None이면 이전 대기 행 유지)"""
+        if retries is not None:
+            self._retries = retries
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'page': page, 'index': index, 'retries': self._retries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.warning(f"Failed to write state file: {e}")
+
+    def refresh(self, notices: Iterable[Any]):
+        """ResultSpool 호환용 (수집 결과를 보관하지 않으므로 무시)"""
+
+    def clear(self):
+        """정상 종료 시 상태 파일 삭제"""
+        if os.path.exists(self.path):
+            try:
+                os.remove(self.path)
+                self.logger.info("Crawling finished successfully. State file deleted.")
+            except Exception as e:
+                self.logger.warning(f"Failed to delete state file: {e}")
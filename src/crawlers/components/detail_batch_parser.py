@@ -0,0 +1,73 @@
+import os
+import logging
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Tuple, Iterator, Optional
+from src.crawlers.components.detail_html import resolve_backend
+from src.crawlers.components.nuri_detail_extractor import NuriDetailExtractor
+from src.crawlers.components.snapshot_store import DetailSnapshot, SegmentReader
+
+# 작업 단위: (순번, 세그먼트, 위치, 길이, 페이지 URL, 목록 데이터)
+ChunkItem = Tuple[int, str, int, int, str, Dict[str, Any]]
+
+
+def parse_chunk(root: str, items: List[ChunkItem], backend: str) -> List[Tuple[int, Optional[Dict[str, Any]], str]]:
+    """
+    스냅샷 묶음 파싱 (작업 프로세스에서 실행)
+    - return: (순번, Raw Data, 오류 메시지) 목록. 실패한 건은 Raw Data가 None
+    """
+    extractor = NuriDetailExtractor(logging.getLogger("DetailBatchParser"))
+    extractor.html_backend = backend
+    reader = SegmentReader(root)
+    results = []
+    try:
+        for index, segment, offset, length, url, list_data in items:
+            try:
+                html = reader.read(segment, offset, length)
+                results.append((index, extractor.extract_from_html(html, list_data, url), ""))
+            except Exception as e:
+                results.append((index, None, str(e)))
+    finally:
+        reader.close()
+    return results
+
+
+class DetailBatchParser:
+    """
+    저장된 상세 스냅샷 일괄 파싱 (ProcessPoolExecutor, 브라우저 없음)
+    - 작업 프로세스에는 스냅샷 위치만 넘기고, 각 프로세스가 세그먼트를 직접 읽어 파싱한 Raw Data만 돌려받습니다.
+    - chunk_size건씩 묶어 보내므로 프로세스 간 전달 횟수는 건수/chunk_size 입니다.
+    - workers가 1이거나 묶음이 하나뿐이면 현재 프로세스에서 처리합니다.
+    """
+
+    def __init__(self, logger, workers: int = 0, chunk_size: int = 200, backend: str = "auto"):
+        self.logger = logger
+        # 0이면 CPU 코어 수
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.backend = resolve_backend(backend)
+        self.failed = 0
+
+    def parse(self, root: str, snapshots: List[DetailSnapshot]) -> Iterator[Tuple[DetailSnapshot, Optional[Dict[str, Any]]]]:
+        """(스냅샷, Raw Data) 를 입력 순서대로 반환 (파싱 실패는 Raw Data None)"""
+        items = [(i, s.segment, s.offset, s.length, s.url, s.list_data) for i, s in enumerate(snapshots)]
+        chunks = [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+        workers = min(self.workers, len(chunks))
+        self.logger.info(f"Parsing {len(items)} snapshots with {max(workers, 1)} process(es), backend={self.backend}.")
+
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        if executor:
+            results = executor.map(parse_chunk, repeat(root), chunks, repeat(self.backend))
+        else:
+            results = (parse_chunk(root, chunk, self.backend) for chunk in chunks)
+        try:
+            for chunk_result in results:
+                for index, raw_data, error in chunk_result:
+                    if raw_data is None:
+                        self.failed += 1
+                        s = snapshots[index]
+                        self.logger.error(f"Snapshot parsing failed ({s.notice_code}-{s.degree}): {error}")
+                    yield snapshots[index], raw_data
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
@@ -0,0 +1,312 @@
+import re
+from html.parser import HTMLParser
+from typing import Dict, Any, List, Optional, Union
+from urllib.parse import urljoin
+
+try:
+    import lxml.html as lxml_html
+except ImportError:  # 선택 의존성 (없으면 표준 라이브러리 파서 사용)
+    lxml_html = None
+
+# 파서 백엔드 (auto: 설치되어 있으면 lxml)
+BACKENDS = ("lxml", "stdlib")
+
+# innerText에서 앞뒤로 줄바꿈이 생기는 블록 요소
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "caption", "dd", "div", "dl", "dt", "fieldset", "figure",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p",
+    "pre", "section", "table", "tbody", "tfoot", "thead", "tr", "ul",
+})
+# 닫는 태그가 없는 요소
+VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr",
+})
+# innerText에서 제외되는 요소
+HIDDEN_TAGS = frozenset({"script", "style", "template", "noscript", "head", "title"})
+# 닫는 태그를 생략할 수 있는 요소 (새 태그 : 자동으로 닫히는 열린 태그)
+IMPLIED_END = {
+    "td": frozenset({"td", "th"}),
+    "th": frozenset({"td", "th"}),
+    "tr": frozenset({"td", "th", "tr"}),
+    "li": frozenset({"li"}),
+    "option": frozenset({"option"}),
+    "p": frozenset({"p"}),
+}
+
+_SPACES = re.compile(r"[ \t\n\r\f]+")
+_BLOCK_BREAKS = re.compile(r"[ \x00]*\x00[ \x00]*")
+_LINE_SPACES = re.compile(r" *\n *")
+_DISPLAY_NONE = re.compile(r"display\s*:\s*none", re.I)
+
+
+class Element:
+    """최소 DOM 요소 (자식은 Element 또는 텍스트)"""
+    __slots__ = ("tag", "attrs", "parent", "children", "order")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional["Element"], order: int):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children: List[Union["Element", str]] = []
+        self.order = order
+
+    def elements(self) -> List["Element"]:
+        return [c for c in self.children if isinstance(c, Element)]
+
+    def iter(self):
+        """자신과 하위 요소 (문서 순서)"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.elements()))
+
+    def next_element(self) -> Optional["Element"]:
+        if self.parent is None:
+            return None
+        siblings = self.parent.elements()
+        i = siblings.index(self)
+        return siblings[i + 1] if i + 1 < len(siblings) else None
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document", {}, None, 0)
+        self._stack = [self.root]
+        self._order = 0
+
+    def _append(self, tag: str, attrs) -> Element:
+        closes = IMPLIED_END.get(tag)
+        while closes and self._stack[-1].tag in closes:
+            self._stack.pop()
+        self._order += 1
+        parent = self._stack[-1]
+        node = Element(tag, {k: v or "" for k, v in attrs}, parent, self._order)
+        parent.children.append(node)
+        return node
+
+    def handle_starttag(self, tag, attrs):
+        node = self._append(tag, attrs)
+        if tag not in VOID_TAGS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self._append(tag, attrs)
+
+    def handle_endtag(self, tag):
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i].tag == tag:
+                del self._stack[i:]
+                return
+
+    def handle_data(self, data):
+        self._stack[-1].children.append(data)
+
+
+def parse_html(html: str) -> Element:
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+def text_content(node: Element) -> str:
+    """DOM textContent"""
+    parts = []
+    stack: List[Union[Element, str]] = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+        else:
+            stack.extend(reversed(item.children))
+    return "".join(parts)
+
+
+def inner_text(node: Element) -> str:
+    """
+    DOM innerText 근사
+    - 공백 축약, <br>은 줄바꿈, 블록 요소 경계는 (겹치지 않는) 줄바꿈, 같은 행의 셀 사이는 탭
+    - script/style 과 style="display:none" 요소는 제외 (CSS 파일의 숨김 규칙은 반영하지 않음)
+    """
+    parts: List[str] = []
+    _collect_text(node, parts)
+    return _finish_text(parts)
+
+
+def _finish_text(parts: List[str]) -> str:
+    """수집한 조각 -> innerText (블록 경계 \\x00 을 겹치지 않는 줄바꿈으로)"""
+    text = _BLOCK_BREAKS.sub("\x00", "".join(parts)).strip("\x00")
+    return _LINE_SPACES.sub("\n", text.replace("\x00", "\n")).strip(" ")
+
+
+def _collect_text(node: Element, parts: List[str]):
+    for child in node.children:
+        if isinstance(child, str):
+            parts.append(_SPACES.sub(" ", child))
+            continue
+        tag = child.tag
+        if tag in HIDDEN_TAGS or _DISPLAY_NONE.search(child.attrs.get("style", "")):
+            continue
+        if tag == "br":
+            parts.append("\n")
+            continue
+        if tag in ("td", "th") and child.parent is not None and child.parent.elements()[0] is not child:
+            parts.append("\t")
+        block = tag in BLOCK_TAGS
+        if block:
+            parts.append("\x00")
+        _collect_text(child, parts)
+        if block:
+            parts.append("\x00")
+
+
+def find_by_id(root: Element, element_id: str) -> Optional[Element]:
+    for node in root.iter():
+        if node.attrs.get("id") == element_id:
+            return node
+    return None
+
+
+def available_backends() -> List[str]:
+    return [name for name in BACKENDS if name != "lxml" or lxml_html is not None]
+
+
+def resolve_backend(name: Optional[str] = "auto") -> str:
+    """백엔드 이름 확인 (auto: lxml이 있으면 lxml, 없으면 stdlib)"""
+    if not name or name == "auto":
+        return "lxml" if lxml_html is not None else "stdlib"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {name}")
+    if name == "lxml" and lxml_html is None:
+        raise ValueError("HTML parser backend 'lxml' requires the lxml package.")
+    return name
+
+
+def parse_detail_html(html: str, base_url: str = "", title_id: str = "mf_wfm_cntsHeader_spnHeaderTitle",
+                      attachment_label: str = "첨부파일", backend: Optional[str] = "auto") -> Dict[str, Any]:
+    """
+    상세 화면 HTML -> DETAIL_SNAPSHOT_JS 와 같은 형태의 스냅샷 (브라우저 없이)
+    - pairs: 문서 순서의 [th textContent, 바로 뒤 형제 td innerText]
+    - title: title_id 요소의 innerText (없으면 None)
+    - attachments / attachment_urls: 첨부파일 th 뒤 형제 td 안의 링크 (href는 base_url 기준 절대 주소)
+    - backend: lxml(C 파서, 빠름) 또는 stdlib(html.parser). 두 백엔드는 같은 결과를 냅니다.
+    """
+    if not html or not html.strip():
+        return {'pairs': [], 'title': None, 'attachments': [], 'attachment_urls': []}
+    if resolve_backend(backend) == "lxml":
+        return _parse_lxml(html, base_url, title_id, attachment_label)
+    return _parse_stdlib(html, base_url, title_id, attachment_label)
+
+
+def _parse_stdlib(html: str, base_url: str, title_id: str, attachment_label: str) -> Dict[str, Any]:
+    root = parse_html(html)
+
+    pairs = []
+    links: Dict[int, Element] = {}
+    for node in root.iter():
+        if node.tag != "th":
+            continue
+        label = text_content(node)
+        td = node.next_element()
+        while td is not None and td.tag != "td":
+            td = td.next_element()
+        if td is not None:
+            pairs.append([label, inner_text(td)])
+
+        if attachment_label in label:
+            sib = td
+            while sib is not None:
+                if sib.tag == "td":
+                    for a in sib.iter():
+                        if a.tag == "a":
+                            links[a.order] = a
+                sib = sib.next_element()
+
+    ordered = [links[order] for order in sorted(links)]
+    header = find_by_id(root, title_id)
+    return {
+        'pairs': pairs,
+        'title': inner_text(header) if header is not None else None,
+        'attachments': [inner_text(a) for a in ordered],
+        'attachment_urls': [_link_url(a.attrs.get("href", ""), base_url) for a in ordered],
+    }
+
+
+# ----- lxml 백엔드 (같은 규칙을 lxml 요소 트리에 적용) -----
+
+def _parse_lxml(html: str, base_url: str, title_id: str, attachment_label: str) -> Dict[str, Any]:
+    doc = lxml_html.document_fromstring(html)
+
+    pairs = []
+    targets = set()
+    for th in doc.iter("th"):
+        label = th.text_content()
+        td = _lxml_next_td(th)
+        if td is not None:
+            pairs.append([label, _lxml_inner_text(td)])
+
+        if attachment_label in label:
+            while td is not None:
+                targets.add(td)
+                td = _lxml_next_td(td)
+
+    # 대상 td 안의 링크 (문서 순서)
+    ordered = [a for a in doc.iter("a") if targets and any(td in targets for td in a.iterancestors("td"))]
+    header = doc.get_element_by_id(title_id, None)
+    return {
+        'pairs': pairs,
+        'title': _lxml_inner_text(header) if header is not None else None,
+        'attachments': [_lxml_inner_text(a) for a in ordered],
+        'attachment_urls': [_link_url(a.get("href", ""), base_url) for a in ordered],
+    }
+
+
+def _lxml_next_td(el):
+    """다음 형제 td (주석 등 요소가 아닌 노드와 다른 태그는 건너뜀)"""
+    el = el.getnext()
+    while el is not None and el.tag != "td":
+        el = el.getnext()
+    return el
+
+
+def _lxml_inner_text(el) -> str:
+    parts: List[str] = []
+    _lxml_collect_text(el, parts)
+    return _finish_text(parts)
+
+
+def _lxml_collect_text(el, parts: List[str]):
+    if el.text:
+        parts.append(_SPACES.sub(" ", el.text))
+    first = True
+    for child in el:
+        tag = child.tag
+        # 주석/처리 명령은 tag가 문자열이 아님 (뒤따르는 텍스트만 사용)
+        if isinstance(tag, str):
+            if tag in HIDDEN_TAGS or _DISPLAY_NONE.search(child.get("style", "")):
+                pass
+            elif tag == "br":
+                parts.append("\n")
+            else:
+                if tag in ("td", "th") and not first:
+                    parts.append("\t")
+                block = tag in BLOCK_TAGS
+                if block:
+                    parts.append("\x00")
+                _lxml_collect_text(child, parts)
+                if block:
+                    parts.append("\x00")
+            first = False
+        if child.tail:
+            parts.append(_SPACES.sub(" ", child.tail))
+
+
+def _link_url(href: str, base_url: str) -> str:
+    """http(s) 링크만 절대 주소로 ('#' 링크, 스크립트 링크는 빈 문자열)"""
+    href = href.strip()
+    if not href or href.startswith("#"):
+        return ""
+    url = urljoin(base_url, href)
+    return url if re.match(r"(?i)https?:", url) else ""
@@ -0,0 +1,217 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlsplit, urlencode, parse_qsl, urljoin
+from src.crawlers.components.bid_factory import BidFactory
+from src.crawlers.components.nuri_detail_extractor import NuriDetailExtractor
+from src.crawlers.components.record_template import render_fields, find_records
+from src.crawlers.components.rate_controller import RateController
+from src.utils.http_pool import KeepAliveHttpPool
+from src.utils.metrics import timed
+
+CODE_PLACEHOLDER = "{{notice_code}}"
+DEGREE_PLACEHOLDER = "{{degree}}"
+
+# 재생 시 그대로 복사하지 않는 헤더
+_SKIP_HEADERS = {"cookie", "content-length", "host", "connection", "accept-encoding"}
+
+
+class RecordedEndpoint:
+    """브라우저에서 관찰한 상세 데이터 요청 (공고번호/차수 자리를 자리표시자로 바꾼 템플릿)"""
+
+    def __init__(self, method: str, url: str, headers: Dict[str, str], body: Any, body_format: str):
+        self.method = method
+        self.url = url
+        self.headers = {k: v for k, v in headers.items() if k.lower() not in _SKIP_HEADERS}
+        self.body = body
+        self.body_format = body_format  # json | form | none
+
+    @classmethod
+    def from_request(cls, method: str, url: str, headers: Dict[str, str], post_data: Optional[str],
+                     notice_code: str, degree: str) -> "RecordedEndpoint":
+        values = {notice_code: CODE_PLACEHOLDER, degree: DEGREE_PLACEHOLDER}
+
+        parts = urlsplit(url)
+        query = [(k, values.get(v, v)) for k, v in parse_qsl(parts.query, keep_blank_values=True)]
+        url = parts._replace(query=urlencode(query, safe="{}")).geturl()
+
+        if not post_data:
+            return cls(method, url, headers, None, "none")
+        try:
+            return cls(method, url, headers, _substitute(json.loads(post_data), values), "json")
+        except ValueError:
+            form = [(k, values.get(v, v)) for k, v in parse_qsl(post_data, keep_blank_values=True)]
+            return cls(method, url, headers, form, "form")
+
+    def is_templated(self) -> bool:
+        """공고번호 자리표시자가 URL/본문에 들어갔는지 (없으면 모든 재생이 같은 공고를 요청)"""
+        return CODE_PLACEHOLDER in self.url or CODE_PLACEHOLDER in json.dumps(self.body, ensure_ascii=False)
+
+    def build(self, notice_code: str, degree: str) -> Tuple[str, Optional[bytes]]:
+        """(요청 경로, 본문) 생성"""
+        values = {CODE_PLACEHOLDER: notice_code, DEGREE_PLACEHOLDER: degree}
+        parts = urlsplit(self.url)
+        query = [(k, values.get(v, v)) for k, v in parse_qsl(parts.query, keep_blank_values=True)]
+        path = parts._replace(scheme="", netloc="", query=urlencode(query)).geturl() or "/"
+
+        if self.body_format == "json":
+            body = json.dumps(_substitute(self.body, values), ensure_ascii=False).encode("utf-8")
+        elif self.body_format == "form":
+            body = urlencode([(k, values.get(v, v)) for k, v in self.body]).encode("utf-8")
+        else:
+            body = None
+        return path, body
+
+
+def _substitute(obj: Any, values: Dict[str, str]) -> Any:
+    """JSON 구조 안의 문자열 값 중 values에 있는 것을 치환"""
+    if isinstance(obj, dict):
+        return {k: _substitute(v, values) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_substitute(v, values) for v in obj]
+    if isinstance(obj, str):
+        return values.get(obj, obj)
+    return obj
+
+
+class DetailRequestRecorder:
+    """상세 화면 진입 시 발생하는 데이터 요청을 관찰하여 RecordedEndpoint로 기록"""
+
+    def __init__(self, url_pattern: str, logger):
+        self.url_pattern = url_pattern
+        self.logger = logger
+        self._last = None
+        # 공고번호를 치환할 수 없는 요청이면 이후 기록도 하지 않음
+        self.rejected = False
+
+    def attach(self, page):
+        page.on("request", self._on_request)
+
+    def _on_request(self, request):
+        if self.url_pattern and self.url_pattern in request.url and request.resource_type in ("xhr", "fetch"):
+            self._last = (request.method, request.url, dict(request.headers), request.post_data)
+
+    def record(self, notice_code_full: str) -> Optional[RecordedEndpoint]:
+        """마지막으로 관찰한 상세 요청을 템플릿화 (관찰된 요청이 없거나 공고번호를 치환하지 못하면 None)"""
+        if not self._last or self.rejected:
+            return None
+        method, url, headers, post_data = self._last
+        code, degree = BidFactory.split_notice_code(notice_code_full)
+        endpoint = RecordedEndpoint.from_request(method, url, headers, post_data, code, degree)
+        if not endpoint.is_templated():
+            self.rejected = True
+            self.logger.warning(f"Detail endpoint has no notice code parameter ({code}), replay disabled: {method} {url}")
+            return None
+        self.logger.info(f"Detail endpoint recorded: {method} {url}")
+        return endpoint
+
+
+class DetailReplayClient:
+    """
+    기록된 상세 요청을 브라우저 없이 재생하여 Raw Data 생성
+    - Keep-Alive 연결 풀과 스레드 풀(concurrency)로 동시 요청 수를 제한합니다.
+    - 응답 JSON은 설정의 필드 템플릿으로 변환한 뒤, 브라우저 경로와 같은 병합 규칙을 적용합니다.
+    """
+
+    def __init__(self, endpoint: RecordedEndpoint, config: Dict, logger, rate: Optional[RateController] = None):
+        self.endpoint = endpoint
+        self.logger = logger
+        # 브라우저 경로와 같은 속도 제어를 공유 (없으면 제한 없음)
+        self.rate = rate or RateController({'enabled': False}, logger)
+        self.concurrency = max(1, config.get('concurrency', 4))
+        self.record_key = config.get('record_key', '')
+        self.fields: Dict[str, str] = config.get('fields', {})
+        self.attachments_key = config.get('attachments_key', '')
+        self.attachment_name = config.get('attachment_name', '')
+        self.attachment_url = config.get('attachment_url', '')
+
+        parts = urlsplit(endpoint.url)
+        self.pool = KeepAliveHttpPool(f"{parts.scheme}://{parts.netloc}", size=self.concurrency,
+                                      timeout=config.get('timeout', 30))
+        self.merger = NuriDetailExtractor(logger)
+        self.cookie_header = ""
+
+    @staticmethod
+    def maps_attachments(config: Dict) -> bool:
+        """첨부파일 목록 Key/파일명 컬럼이 설정되었는지 (없으면 모든 재생 결과의 첨부파일이 비어 있음)"""
+        return bool(config.get('attachments_key') and config.get('attachment_name'))
+
+    def set_cookies(self, cookies: List[Dict[str, Any]]):
+        """BrowserContext.cookies() 결과를 Cookie 헤더로 변환 (세션 공유)"""
+        self.cookie_header = "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+
+    @timed("replay.fetch")
+    def fetch(self, list_data: Dict[str, Any]) -> Dict[str, Any]:
+        """상세 1건 요청 -> Raw Data (extract_all과 같은 형태)"""
+        code, degree = BidFactory.split_notice_code(list_data.get('notice_code_full', ''))
+        path, body = self.endpoint.build(code, degree)
+
+        headers = dict(self.endpoint.headers)
+        if self.cookie_header:
+            headers["Cookie"] = self.cookie_header
+
+        self.rate.acquire()
+        started = time.monotonic()
+        try:
+            resp = self.pool.request(self.endpoint.method, path, body=body, headers=headers)
+        except Exception:
+            self.rate.on_failure("connection")
+            raise
+        self.rate.on_response(resp.status, time.monotonic() - started)
+        if resp.status != 200:
+            raise RuntimeError(f"detail replay HTTP {resp.status}")
+        return self.to_raw_data(list_data, json.loads(resp.text()))
+
+    def fetch_many(self, tasks: List[Tuple[int, Dict[str, Any]]]) -> List[Tuple[int, Optional[Dict[str, Any]]]]:
+        """(인덱스, 목록 데이터) 목록을 동시에 요청. 실패한 건은 None"""
+        def run(task):
+            index, list_data = task
+            try:
+                return index, self.fetch(list_data)
+            except Exception as e:
+                self.logger.error(f"Detail replay failed for {list_data.get('notice_code_full')}: {e}")
+                return index, None
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return list(executor.map(run, tasks))
+
+    def to_raw_data(self, list_data: Dict[str, Any], payload: Any) -> Dict[str, Any]:
+        """상세 응답 JSON -> Raw Data"""
+        record = self._find_record(payload)
+        detail_data = {}
+        for key, value in render_fields(self.fields, record).items():
+            # 브라우저 경로와 같은 길이 제한 적용
+            max_len = NuriDetailExtractor.FIELD_CONFIG.get(key, ([], 0))[1]
+            detail_data[key] = NuriDetailExtractor.clean_value(value, max_len)
+        header_title = detail_data.pop('title', '')
+
+        attachment_names, attachment_urls = [], []
+        if self.attachments_key and self.attachment_name:
+            for item in find_records(payload, self.attachments_key) or []:
+                name = str(item.get(self.attachment_name) or "").strip()
+                if name:
+                    attachment_names.append(name)
+                    # 상대 경로는 상세 요청 URL 기준으로 변환
+                    url = str(item.get(self.attachment_url) or "").strip() if self.attachment_url else ""
+                    attachment_urls.append(urljoin(self.endpoint.url, url) if url else "")
+
+        return self.merger.merge(list_data, detail_data, header_title, attachment_names, attachment_urls)
+
+    def _find_record(self, payload: Any) -> Dict[str, Any]:
+        if self.record_key and isinstance(payload, dict):
+            found = payload.get(self.record_key)
+            if isinstance(found, dict):
+                return found
+            if isinstance(found, list) and found:
+                return found[0]
+        # 지정이 없으면 최상위에서 처음 나오는 딕셔너리(없으면 최상위 자체)
+        if isinstance(payload, dict):
+            for value in payload.values():
+                if isinstance(value, dict):
+                    return value
+            return payload
+        return {}
+
+    def close(self):
+        self.pool.close()
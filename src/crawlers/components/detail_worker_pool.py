@@ -0,0 +1,128 @@
+from typing import List, Dict, Any, Optional, Tuple
+from src.core.page_context import PageContext
+from src.models.bid_notice import BidNotice
+from src.crawlers.components.nuri_navigator import NuriNavigator, GRID_ROWS_SELECTOR
+from src.crawlers.components.wait_engine import WaitEngine
+from src.crawlers.components.nuri_parser import NuriParser
+
+class DetailWorker:
+    """상세 페이지 전용 작업 탭 (탭마다 독립된 Navigator와 목록 상태를 가짐)"""
+
+    def __init__(self, worker_id: int, ctx: PageContext, logger, waits: Optional[WaitEngine] = None):
+        self.worker_id = worker_id
+        self.ctx = ctx
+        self.nav = NuriNavigator(ctx, logger, waits)
+        # 탭이 현재 보고 있는 목록 페이지 (0: 미동기화)
+        self.list_page = 0
+
+    @property
+    def page(self):
+        return self.ctx.current
+
+
+class DetailWorkerPool:
+    """
+    목록 탭과 분리된 N개의 작업 탭으로 상세 페이지를 병렬 처리
+    - 목록 탭(메인)은 그리드 조회/페이지 이동만 담당합니다.
+    - 각 작업 탭은 동일한 검색 상태를 유지하며, 배치 단위로 상세 링크를 동시에 클릭한 뒤
+      화면 전환을 순서대로 수거합니다. (Sync API에서 네트워크 대기를 겹치는 방식)
+    - 한 탭의 실패는 해당 탭만 재동기화하며 다른 탭이나 목록 탭에 영향을 주지 않습니다.
+    """
+
+    def __init__(self, ctx: PageContext, size: int, config: Dict, parser: NuriParser, logger,
+                 waits: Optional[WaitEngine] = None):
+        self.ctx = ctx
+        self.size = max(1, size)
+        self.config = config
+        self.parser = parser
+        self.logger = logger
+        # 작업 탭들이 지연시간 통계를 공유
+        self.waits = waits or WaitEngine({}, logger)
+        self.workers: List[DetailWorker] = []
+
+    def start(self):
+        """작업 탭 생성 및 검색 상태 초기화"""
+        for worker_id in range(self.size):
+            worker = DetailWorker(worker_id, self.ctx.open_worker(), self.logger, self.waits)
+            self.workers.append(worker)
+            try:
+                self._reset(worker)
+            except Exception as e:
+                self.logger.warning(f"[Worker {worker_id}] Initial setup failed: {e}")
+        self.logger.info(f"Detail worker pool started with {self.size} tabs.")
+
+    def process(self, list_page: int, tasks: List[Tuple[int, Dict[str, Any]]]) -> List[Tuple[int, Optional[BidNotice]]]:
+        """
+        tasks: (목록 인덱스, 목록 데이터) 리스트
+        return: (목록 인덱스, 파싱 결과 또는 None) 리스트 (인덱스 순)
+        """
+        results: List[Tuple[int, Optional[BidNotice]]] = []
+
+        for batch_start in range(0, len(tasks), self.size):
+            batch = tasks[batch_start:batch_start + self.size]
+
+            # 1단계: 각 탭에서 상세 링크 클릭 (전환은 기다리지 않음)
+            dispatched = []
+            for worker, (index, list_data) in zip(self.workers, batch):
+                try:
+                    self._sync_to_page(worker, list_page)
+                    link = self._find_row_link(worker, index, list_data.get('notice_code_full', ''))
+                    if link is None or not worker.nav.click_detail_link(link):
+                        raise RuntimeError("detail link not clickable")
+                    dispatched.append((worker, index, list_data))
+                except Exception as e:
+                    self.logger.error(f"[Worker {worker.worker_id}] Dispatch failed at index {index}: {e}")
+                    worker.list_page = 0
+                    results.append((index, None))
+
+            # 2단계: 탭별로 화면 전환 대기 후 추출, 목록 복귀
+            for worker, index, list_data in dispatched:
+                results.append((index, self._collect(worker, index, list_data)))
+
+        results.sort(key=lambda r: r[0])
+        return results
+
+    def _collect(self, worker: DetailWorker, index: int, list_data: Dict[str, Any]) -> Optional[BidNotice]:
+        try:
+            if not worker.nav.wait_for_detail_page():
+                raise RuntimeError("detail page not loaded")
+            bid = self.parser.parse_detail(worker.page, list_data)
+            worker.nav.go_back_to_list()
+            return bid
+        except Exception as e:
+            # 해당 탭만 재동기화 대상으로 표시
+            self.logger.error(f"[Worker {worker.worker_id}] Row {index} failed: {e}")
+            worker.list_page = 0
+            return None
+
+    def _find_row_link(self, worker: DetailWorker, index: int, notice_code_full: str):
+        """작업 탭의 같은 인덱스 행이 목록 탭과 같은 공고인지 확인 후 링크 반환"""
+        row = worker.nav.get_row(index)
+        row.wait_for(state="visible", timeout=15000)
+
+        # 페이지 이동 직후에는 이전 그리드가 남아 있을 수 있으므로 공고번호가 일치할 때까지 대기
+        if not notice_code_full or self.waits.row_cell_text(
+                worker.page, GRID_ROWS_SELECTOR, index, NuriParser.LIST_COLUMNS['notice_code'], notice_code_full, timeout=5000):
+            return NuriParser.row_link(row)
+
+        self.logger.warning(f"[Worker {worker.worker_id}] Row {index} mismatch. Expected {notice_code_full}.")
+        return None
+
+    def _sync_to_page(self, worker: DetailWorker, list_page: int):
+        """작업 탭을 목록 탭과 같은 페이지로 이동"""
+        if worker.list_page == list_page:
+            return
+        if worker.list_page == 0:
+            self._reset(worker)
+
+        if not worker.nav.jump_to_page(list_page):
+            raise RuntimeError(f"cannot reach page {list_page}")
+        worker.list_page = list_page
+
+    def _reset(self, worker: DetailWorker):
+        """작업 탭을 검색 결과 1페이지 상태로 초기화"""
+        worker.list_page = 0
+        worker.nav.go_to_main(self.config['system']['crawler']['base_url'])
+        worker.nav.go_to_bid_list()
+        worker.nav.set_search_conditions(self.config.get('search', {}))
+        worker.list_page = 1
@@ -0,0 +1,89 @@
+import json
+import threading
+import xml.etree.ElementTree as ET
+from typing import Dict, Any, List, Optional
+from src.crawlers.components.nuri_parser import NuriParser
+from src.crawlers.components.record_template import render_fields, find_records
+
+class GridResponseCapture:
+    """
+    WebSquare 그리드(grdBidPbancList)를 채우는 XHR 응답을 가로채 목록 데이터로 변환
+    - 검색/페이지 이동마다 응답을 받아 최신 목록(세대 번호 포함)으로 보관합니다.
+    - 응답의 모든 컬럼은 'columns' 키에 원본 그대로 보존합니다. (to_basic_data에서 빠지므로 지문/스냅샷에는 영향 없음)
+    - 응답을 해석하지 못하면 아무 것도 보관하지 않으며, 호출 측은 DOM 파싱으로 대체합니다.
+    """
+
+    def __init__(self, config: Dict, logger):
+        self.logger = logger
+        self.url_pattern = config.get('url_pattern', 'BidPbancList')
+        self.list_key = config.get('list_key', '')
+        # 목록 데이터 Key : 응답 컬럼 템플릿 (예: "{bidPbancNo}-{bidPbancOrd}")
+        self.fields: Dict[str, str] = config.get('fields', {})
+
+        self._lock = threading.Lock()
+        self._rows: Optional[List[Dict[str, Any]]] = None
+        self._generation = 0
+        self._consumed = 0
+
+    def attach(self, page):
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        if self.url_pattern not in response.url or response.request.resource_type not in ("xhr", "fetch"):
+            return
+        try:
+            rows = self.parse_payload(response.text())
+        except Exception as e:
+            self.logger.warning(f"Grid payload ignored ({response.url}): {e}")
+            return
+        if rows is None:
+            return
+
+        with self._lock:
+            self._rows = rows
+            self._generation += 1
+
+    def take(self) -> Optional[List[Dict[str, Any]]]:
+        """아직 사용하지 않은 최신 목록 반환 (없으면 None)"""
+        with self._lock:
+            if self._rows is None or self._consumed == self._generation:
+                return None
+            self._consumed = self._generation
+            return self._rows
+
+    def parse_payload(self, body: str) -> Optional[List[Dict[str, Any]]]:
+        """JSON/XML 응답 본문 -> 목록 데이터 리스트"""
+        body = body.strip()
+        if body.startswith("<"):
+            records = self._records_from_xml(body)
+        else:
+            records = find_records(json.loads(body), self.list_key)
+        if records is None:
+            return None
+        return [self.to_list_data(record) for record in records]
+
+    def to_list_data(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """응답 레코드 1건 -> DOM 목록 데이터와 같은 형태 + 원본 컬럼 (link 제외)"""
+        texts = render_fields(self.fields, record)
+
+        data = NuriParser.empty_list_data()
+        data.update(NuriParser.build_list_data(texts))
+        # 번호만 있고 차수가 없는 경우 남는 구분자 정리
+        data["notice_code"] = data["notice_code"].strip("-")
+        data["columns"] = dict(record)
+        return data
+
+    def _records_from_xml(self, body: str) -> Optional[List[Dict[str, Any]]]:
+        """WebSquare XML 응답: 말단 필드로만 구성된 같은 이름의 반복 요소를 레코드로 간주"""
+        root = ET.fromstring(body)
+        for parent in root.iter():
+            if self.list_key and parent.tag != self.list_key:
+                continue
+            children = list(parent)
+            if children and all(self._is_xml_record(c) for c in children) and len({c.tag for c in children}) == 1:
+                return [{field.tag: (field.text or "") for field in child} for child in children]
+        return None
+
+    @staticmethod
+    def _is_xml_record(element) -> bool:
+        return len(element) > 0 and all(len(field) == 0 for field in element)
@@ -0,0 +1,54 @@
+import hashlib
+from typing import Dict, Any, Tuple, Optional
+from src.crawlers.components.bid_factory import BidFactory
+
+# 지문에 포함하는 목록(그리드) 필드 (to_basic_data Key)
+FINGERPRINT_FIELDS = ('notice_code_full', 'title', 'process_type', 'category', 'date_posted')
+
+
+class KnownNoticeIndex:
+    """
+    이미 저장된 공고의 (공고번호, 차수) -> 목록 지문 인덱스
+    - 목록에서 보이는 필드가 그대로인 행은 상세 진입을 건너뜁니다.
+    - 지문이 달라졌거나 처음 보는 행만 상세를 다시 수집합니다.
+    """
+
+    def __init__(self, known: Optional[Dict[Tuple[str, str], Optional[str]]] = None):
+        self.known = known or {}
+        self.skipped = 0
+        self.changed = 0
+        self.new = 0
+
+    def __len__(self) -> int:
+        return len(self.known)
+
+    @staticmethod
+    def fingerprint(list_data: Dict[str, Any]) -> str:
+        """목록 필드 지문 (16자리 hex)"""
+        text = "\x1f".join(str(list_data.get(key) or "").strip() for key in FINGERPRINT_FIELDS)
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+    def should_fetch(self, list_data: Dict[str, Any]) -> bool:
+        """상세 수집 대상이면 True (건너뛴 행/변경 행/신규 행 집계 포함)"""
+        key = BidFactory.split_notice_code(list_data.get('notice_code_full', ''))
+        if key not in self.known:
+            self.new += 1
+            return True
+        if self.known[key] != self.fingerprint(list_data):
+            self.changed += 1
+            return True
+        self.skipped += 1
+        return False
+
+    def remember(self, list_data: Dict[str, Any]):
+        """이번 실행에서 수집한 행을 인덱스에 반영 (같은 실행 안의 중복 방지)"""
+        key = BidFactory.split_notice_code(list_data.get('notice_code_full', ''))
+        self.known[key] = self.fingerprint(list_data)
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            'skipped': self.skipped,
+            'fetched': self.changed + self.new,
+            'changed': self.changed,
+            'new': self.new,
+        }
@@ -1,5 +1,64 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple, Optional
 from playwright.sync_api import Page
+from src.crawlers.components.detail_html import parse_detail_html
+from src.crawlers.components.snapshot_store import HTML_KEY
+from src.utils.metrics import timed
+
+TITLE_SELECTOR = "#mf_wfm_cntsHeader_spnHeaderTitle"
+ATTACHMENT_LABEL = "첨부파일"
+ATTACHMENT_LINK_XPATH = f"//th[contains(., '{ATTACHMENT_LABEL}')]/following-sibling::td//a"
+# 상세 HTML 스냅샷 기본 영역
+DETAIL_CONTAINER_SELECTOR = "#mf_wfm_container"
+
+# 상세 페이지 스냅샷 스크립트 (evaluate 1회)
+# - pairs: 문서 순서의 [th 텍스트, 바로 뒤 형제 td 텍스트] (XPath following-sibling::td 의 첫 요소와 동일)
+# - title: 헤더 제목 (보이지 않으면 null)
+# - attachments: 첨부파일 th 뒤 형제 td 안의 링크 텍스트 (문서 순서, 중복 제거)
+# - attachment_urls: 같은 순서의 링크 주소 (http(s) 링크가 아니면 빈 문자열)
+# - html: containerSelector가 있으면 보이는 헤더 + 상세 영역 outerHTML (오프라인 재파싱용 스냅샷)
+DETAIL_SNAPSHOT_JS = """([titleSelector, attachmentLabel, containerSelector]) => {
+    const nextTd = (th) => {
+        let el = th.nextElementSibling;
+        while (el && el.tagName !== 'TD') el = el.nextElementSibling;
+        return el;
+    };
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+
+    const pairs = [];
+    const links = new Set();
+    for (const th of document.querySelectorAll('th')) {
+        const label = th.textContent;
+        const td = nextTd(th);
+        if (td) pairs.push([label, td.innerText]);
+
+        if (label.includes(attachmentLabel)) {
+            for (let sib = td; sib; sib = sib.nextElementSibling) {
+                if (sib.tagName === 'TD') sib.querySelectorAll('a').forEach(a => links.add(a));
+            }
+        }
+    }
+    const ordered = Array.from(links).sort(
+        (a, b) => (a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING) ? -1 : 1
+    );
+
+    const header = document.querySelector(titleSelector);
+    const headerVisible = !!header && isVisible(header);
+    let html = null;
+    if (containerSelector) {
+        const container = document.querySelector(containerSelector) || document.body;
+        html = (headerVisible && !container.contains(header) ? header.outerHTML : '') + container.outerHTML;
+    }
+    return {
+        pairs: pairs,
+        title: headerVisible ? header.innerText : null,
+        attachments: ordered.map(a => a.innerText),
+        attachment_urls: ordered.map(a => /^https?:/i.test(a.href) && !(a.getAttribute('href') || '').startsWith('#') ? a.href : ''),
+        html: html
+    };
+}"""
 
 class NuriDetailExtractor:
     """HTML 페이지에서 데이터를 추출하여 딕셔너리(Raw Data)로 반환하는 클래스"""
@@ -29,11 +88,50 @@ class NuriDetailExtractor:
 
     def __init__(self, logger):
         self.logger = logger
+        # 상세 HTML 스냅샷을 남길 영역 셀렉터 (None이면 남기지 않음)
+        self.snapshot_container: Optional[str] = None
+        # 저장된 HTML 파싱 백엔드 (auto: lxml이 있으면 lxml, 없으면 html.parser)
+        self.html_backend = "auto"
 
+    @timed("extractor.extract_all")
     def extract_all(self, page: Page, list_data: Dict[str, str]) -> Dict[str, Any]:
         """
         상세 페이지 정보 추출 및 목록 데이터 병합
         - list_data: 목록에서 수집한 기본 정보 (제목, 날짜, 상태, 공고번호 등)
+        - 페이지에서는 th/td 쌍, 제목, 첨부파일만 한 번에 수집하고 라벨 매칭은 Python에서 처리합니다.
+        - snapshot_container가 있으면 같은 evaluate에서 상세 HTML도 받아 Raw Data의 HTML_KEY에 싣습니다.
+        """
+        snapshot = page.evaluate(DETAIL_SNAPSHOT_JS, [TITLE_SELECTOR, ATTACHMENT_LABEL, self.snapshot_container])
+        return self.with_html(self.extract_from_snapshot(snapshot, list_data), snapshot)
+
+    @staticmethod
+    def with_html(raw_data: Dict[str, Any], snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        if snapshot.get('html'):
+            raw_data[HTML_KEY] = snapshot['html']
+        return raw_data
+
+    @timed("extractor.extract_from_html")
+    def extract_from_html(self, html: str, list_data: Dict[str, str], base_url: str = "",
+                          backend: Optional[str] = None) -> Dict[str, Any]:
+        """저장된 상세 HTML -> Raw Data (브라우저 없이, extract_all과 같은 규칙)"""
+        snapshot = parse_detail_html(html, base_url, TITLE_SELECTOR.lstrip('#'), ATTACHMENT_LABEL,
+                                     backend or self.html_backend)
+        return self.extract_from_snapshot(snapshot, list_data)
+
+    @timed("extractor.extract_from_snapshot")
+    def extract_from_snapshot(self, snapshot: Dict[str, Any], list_data: Dict[str, str]) -> Dict[str, Any]:
+        """DETAIL_SNAPSHOT_JS 결과 -> Raw Data"""
+        detail_data = self.resolve_fields(snapshot['pairs'])
+        header_title = self.clean_title(snapshot['title']) if snapshot.get('title') else ""
+        urls = snapshot.get('attachment_urls') or [''] * len(snapshot['attachments'])
+        attachments = [(name.strip(), url) for name, url in zip(snapshot['attachments'], urls) if name.strip()]
+        return self.merge(list_data, detail_data, header_title,
+                          [name for name, _ in attachments], [url for _, url in attachments])
+
+    @timed("extractor.extract_all_by_locators")
+    def extract_all_by_locators(self, page: Page, list_data: Dict[str, str]) -> Dict[str, Any]:
+        """
+        라벨마다 Locator를 조회하는 기존 방식 (결과 비교 및 벤치마크 기준용)
         """
         
         # 상세 페이지 필드 추출
@@ -41,8 +139,47 @@ class NuriDetailExtractor:
 
         # 제목 추출
         header_title = self._extract_title(page)
-        
-        # 데이터 병합 (상세 페이지 데이터 + 목록 데이터)
+
+        # 첨부파일 추출
+        attachment_names = self._extract_attachment_names(page)
+
+        return self.merge(list_data, detail_data, header_title, attachment_names)
+
+    @classmethod
+    def resolve_fields(cls, pairs: List[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        (th 텍스트, td 텍스트) 목록을 한 번 순회하며 FIELD_CONFIG 라벨 매칭
+        - 라벨 목록의 앞쪽 라벨이 우선이며, 같은 라벨이면 문서 순서상 먼저 나온 쌍을 사용합니다.
+        """
+        program = cls.compile_fields()
+        best: Dict[str, Tuple[int, str]] = {}
+        for th_text, td_text in pairs:
+            for key, labels, max_len in program:
+                rank = best[key][0] if key in best else len(labels)
+                for i in range(rank):
+                    if labels[i] in th_text:
+                        best[key] = (i, td_text)
+                        break
+
+        return {
+            key: cls.clean_value(best[key][1], max_len) if key in best else ""
+            for key, _, max_len in program
+        }
+
+    @classmethod
+    def compile_fields(cls) -> Tuple[Tuple[str, Tuple[str, ...], int], ...]:
+        """FIELD_CONFIG를 순회용 튜플 (Key, 라벨 목록, 최대길이)로 변환 (FIELD_CONFIG가 바뀌면 다시 변환)"""
+        compiled = cls.__dict__.get('_compiled')
+        if compiled is None or compiled[0] is not cls.FIELD_CONFIG:
+            program = tuple((key, tuple(labels), max_len) for key, (labels, max_len) in cls.FIELD_CONFIG.items())
+            compiled = (cls.FIELD_CONFIG, program)
+            cls._compiled = compiled
+        return compiled[1]
+
+    def merge(self, list_data: Dict[str, Any], detail_data: Dict[str, str],
+              header_title: str, attachment_names: List[str],
+              attachment_urls: Optional[List[str]] = None) -> Dict[str, Any]:
+        """데이터 병합 (상세 페이지 데이터 + 목록 데이터)"""
         final_data = list_data.copy()
 
         for key, value in detail_data.items():
@@ -61,8 +198,8 @@ class NuriDetailExtractor:
         if not final_data.get('client_name'):
             final_data['client_name'] = final_data.get('client_name_detail') or final_data.get('manager_dept', '')
 
-        # 첨부파일 추출
-        final_data['attachment_names'] = self._extract_attachment_names(page)
+        final_data['attachment_names'] = attachment_names
+        final_data['attachment_urls'] = attachment_urls or [''] * len(attachment_names)
         
         return final_data
     
@@ -74,14 +211,18 @@ class NuriDetailExtractor:
         return result
 
     def _extract_title(self, page: Page) -> str:
-        h2 = page.locator("#mf_wfm_cntsHeader_spnHeaderTitle")
+        h2 = page.locator(TITLE_SELECTOR)
         if h2.is_visible():
-            return h2.inner_text().replace("입찰공고진행상세", "").strip()
+            return self.clean_title(h2.inner_text())
         return ""
 
+    @staticmethod
+    def clean_title(text: str) -> str:
+        return text.replace("입찰공고진행상세", "").strip()
+
     def _extract_attachment_names(self, page: Page) -> List[str]:
         file_names = []
-        links = page.locator("//th[contains(., '첨부파일')]/following-sibling::td//a").all()
+        links = page.locator(ATTACHMENT_LINK_XPATH).all()
         for link in links:
             txt = link.inner_text().strip()
             if txt:
@@ -93,12 +234,17 @@ class NuriDetailExtractor:
         for label in labels:
             loc = page.locator(f"//th[contains(., '{label}')]/following-sibling::td")
             if loc.count() > 0:
-                txt = loc.first.inner_text().strip()
-                # 노이즈 제거
-                if "\n" in txt:
-                    txt = txt.split("\n")[0].strip()
-                # 길이 제한 (0이면 제한 없음)
-                if max_len > 0:
-                    return txt[:max_len]
-                return txt
-        return ""
\ No newline at end of file
+                return self.clean_value(loc.first.inner_text(), max_len)
+        return ""
+
+    @staticmethod
+    def clean_value(text: str, max_len: int) -> str:
+        txt = text.strip()
+        # 노이즈 제거
+        if "\n" in txt:
+            txt = txt.split("\n")[0].strip()
+        # 길이 제한 (0이면 제한 없음)
+        if max_len > 0:
+            return txt[:max_len]
+        return txt
+
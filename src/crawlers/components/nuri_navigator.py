@@ -1,27 +1,121 @@
-import time
+from typing import Dict, Any, List, Optional
 from playwright.sync_api import Page, Locator
 from src.core.page_context import PageContext
+from src.crawlers.components.grid_response_capture import GridResponseCapture
+from src.crawlers.components.wait_engine import WaitEngine
+from src.utils.metrics import timed
+
+GRID_SELECTOR = "table[id*='grdBidPbancList_body_table']"
+GRID_ROWS_SELECTOR = f"{GRID_SELECTOR} tbody tr"
+DETAIL_HEADER_SELECTOR = "#mf_wfm_cntsHeader_spnHeaderTitle"
+POPUP_CLOSE_SELECTOR = ".w2window_close, .w2window_close_icon, button[title='닫기']"
+PAGE_LABEL_SELECTOR = ".w2pageList_label"
+SELECTED_PAGE_SELECTOR = ".w2pageList_label_selected"
+PAGELIST_ID = "mf_wfm_container_pagelist"
+NEXT_GROUP_SELECTOR = f"#{PAGELIST_ID}_next_btn"
+PREV_GROUP_SELECTOR = f"#{PAGELIST_ID}_prev_btn"
+ROWS_PER_PAGE_SELECTOR = "select[id*='RecordCountPerPage'], select[id*='PageSize'], select[title*='목록수']"
+
+# 그룹 화살표 이동 최대 횟수 (무한 루프 방지)
+MAX_GROUP_HOPS = 200
+
+# WebSquare pageList 컴포넌트 API로 페이지 직접 이동 (컴포넌트가 없으면 false)
+PAGELIST_JUMP_JS = """([id, page]) => {
+    try {
+        const comp = window[id] || (window.$p && $p.getComponentById && $p.getComponentById(id));
+        if (!comp || typeof comp.setSelectedIndex !== 'function') return false;
+        const old = comp.getSelectedIndex ? comp.getSelectedIndex() : null;
+        comp.setSelectedIndex(page);
+        if (typeof comp.trigger === 'function') {
+            comp.trigger('onviewchange', [{ oldSelectedIndex: old, newSelectedIndex: page }]);
+        }
+        return true;
+    } catch (e) {
+        return false;
+    }
+}"""
+
+# 현재 보이는 페이지 번호 목록과 선택된 번호
+PAGE_LABELS_JS = """([labelSelector, selectedSelector]) => {
+    const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const labels = Array.from(document.querySelectorAll(labelSelector))
+        .filter(visible).map(el => parseInt(el.innerText.trim(), 10)).filter(n => !isNaN(n));
+    const selected = document.querySelector(selectedSelector);
+    return { labels: labels, selected: selected ? parseInt(selected.innerText.trim(), 10) : null };
+}"""
+
+# 페이지 번호 목록의 첫 번호가 바뀌었는지 (그룹 이동 확인)
+PAGE_GROUP_CHANGED_JS = """([labelSelector, prevFirst]) => {
+    const first = document.querySelector(labelSelector);
+    return !!first && parseInt(first.innerText.trim(), 10) !== prevFirst;
+}"""
+
+# 날짜 입력칸 readonly 해제 스크립트
+UNLOCK_DATE_INPUT_JS = """el => { 
+    el.removeAttribute('readonly'); 
+    el.classList.remove('udcDateReadOnly');
+    el.readOnly = false;
+}"""
+
+# 검색 조건 드롭다운 (설정 Key : 화면 라벨)
+SEARCH_DROPDOWNS = {
+    "category": "공고분류",
+    "progress": "진행상태",
+    "notice_type": "공고구분",
+    "notice_kind": "공고종류",
+    "contract_method": "계약방법",
+    "selection_method": "낙찰방법"
+}
+
+class PageMoveFailed(RuntimeError):
+    """다음 페이지가 있지만 이동을 확인하지 못함 (타임아웃/오류, 마지막 페이지와 구분)"""
+
 
 class NuriNavigator:
-    def __init__(self, context: PageContext, logger):
+    def __init__(self, context: PageContext, logger, waits: Optional[WaitEngine] = None):
         self.ctx = context
         self.logger = logger
+        self.waits = waits or WaitEngine({}, logger)
+        self.grid_capture: Optional[GridResponseCapture] = None
 
     @property
     def page(self) -> Page:
         return self.ctx.current
 
+    def enable_grid_capture(self, config: dict):
+        """그리드 XHR 응답 가로채기 모드 활성화 (검색 전에 호출해야 첫 응답부터 수집)"""
+        self.grid_capture = GridResponseCapture(config, self.logger)
+        self.grid_capture.attach(self.page)
+        self.logger.info(f"Grid response capture enabled (pattern: {self.grid_capture.url_pattern})")
+
+    def take_captured_rows(self, expected_count: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        가로챈 최신 그리드 데이터 반환
+        - 행 수가 화면과 다르거나 새 응답이 없으면 None (DOM 파싱으로 대체)
+        """
+        if not self.grid_capture:
+            return None
+        rows = self.grid_capture.take()
+        if rows is None:
+            return None
+        if len(rows) != expected_count:
+            self.logger.warning(f"Captured grid has {len(rows)} rows but DOM has {expected_count}. Falling back to DOM.")
+            return None
+        return rows
+
+    @timed("navigator.go_to_main")
     def go_to_main(self, url: str):
         self.logger.info(f"Navigating to {url}")
+        self.waits.throttle()
         self.page.goto(url)
         self.page.wait_for_load_state("networkidle")
         self._close_popups()
 
     def _close_popups(self):
-        time.sleep(1.0)
+        self.waits.loading_done(self.page)
         # 최대 5개의 팝업이 있다고 가정하고 순차적으로 닫기 시도
         for _ in range(5):
-            close_buttons = self.page.locator(".w2window_close, .w2window_close_icon, button[title='닫기']")
+            close_buttons = self.page.locator(POPUP_CLOSE_SELECTOR)
             
             count = close_buttons.count()
             if count == 0:
@@ -33,22 +127,26 @@ class NuriNavigator:
                 btn = close_buttons.nth(i)
                 if btn.is_visible():
                     btn.click(force=True)
-                    time.sleep(0.5)
+                    self.waits.until_state("popup", btn, "hidden", timeout=3000)
 
+    @timed("navigator.go_to_bid_list")
     def go_to_bid_list(self):
         """입찰공고 목록 메뉴로 이동"""
         self.logger.info("Moving to Bid Notice List...")
         try:
             # 상단 메뉴 Hover
             self.page.locator("#mf_wfm_gnb_wfm_gnbMenu_genDepth1_1_btn_menuLvl1").hover()
-            time.sleep(0.5)
-            # 하위 메뉴 클릭
-            self.page.get_by_role("link", name="입찰공고목록").click()
+            # 하위 메뉴가 펼쳐지면 클릭
+            menu = self.page.get_by_role("link", name="입찰공고목록")
+            self.waits.until_state("menu", menu, "visible", timeout=5000)
+            self.waits.throttle()
+            menu.click()
             self.page.wait_for_load_state("networkidle")
         except Exception as e:
             self.logger.error(f"Menu navigation failed: {e}")
             raise e
 
+    @timed("navigator.set_search_conditions")
     def set_search_conditions(self, config: dict):
         """검색 조건 설정"""
         self.logger.info("Applying search conditions...")
@@ -75,16 +173,12 @@ class NuriNavigator:
                         
                         target_locator.click(force=True)
                         
-                        target_locator.evaluate("""el => { 
-                            el.removeAttribute('readonly'); 
-                            el.classList.remove('udcDateReadOnly');
-                            el.readOnly = false;
-                        }""")
+                        target_locator.evaluate(UNLOCK_DATE_INPUT_JS)
                         
                         target_locator.clear()
                         target_locator.type(date_value, delay=10)
                         target_locator.press("Tab")
-                        time.sleep(0.2)
+                        self.waits.input_value(target_locator, date_value)
 
                     # 공고게시일자 행 찾기
                     date_row = self.page.locator("tr").filter(has_text="공고게시일자")
@@ -103,16 +197,7 @@ class NuriNavigator:
                     self.logger.warning(f"Failed to click date preset: {preset}")
 
             # 드롭다운
-            dropdowns = {
-                "category": "공고분류",
-                "progress": "진행상태",
-                "notice_type": "공고구분",
-                "notice_kind": "공고종류",
-                "contract_method": "계약방법",
-                "selection_method": "낙찰방법"
-            }
-
-            for key, label in dropdowns.items():
+            for key, label in SEARCH_DROPDOWNS.items():
                 val = config.get(key)
                 if val and val != "전체":
                     try:
@@ -121,83 +206,198 @@ class NuriNavigator:
                     except Exception as e:
                         self.logger.warning(f"Failed to set dropdown {label}: {e}")
 
+            # 페이지당 조회 건수 (클수록 페이지 수와 이동 횟수가 줄어듦)
+            self._set_rows_per_page(config.get('rows_per_page'))
+
             # 검색 버튼 클릭
+            signature = self.waits.grid_signature(self.page, GRID_ROWS_SELECTOR)
+            self.waits.throttle()
             self.page.get_by_role("button", name="검색", exact=True).click()
             self.page.wait_for_load_state("networkidle")
-            time.sleep(1.0)
+            # 조회 결과가 이전 목록과 같을 수 있으므로 그리드 변화가 없으면 로딩 마스크만 확인 (속도 감소 신호 아님)
+            if not self.waits.grid_changed(self.page, GRID_ROWS_SELECTOR, signature, name="search", penalize=False):
+                self.waits.loading_done(self.page)
 
         except Exception as e:
             self.logger.error(f"Error setting conditions: {e}")
 
+    def _set_rows_per_page(self, value):
+        """페이지당 조회 건수 선택 ('max'면 가장 큰 옵션)"""
+        if not value:
+            return
+        try:
+            select = self.page.locator(ROWS_PER_PAGE_SELECTOR).first
+            if not select.is_visible():
+                self.logger.warning("Rows-per-page selector not found.")
+                return
+            options = [o.strip() for o in select.evaluate("el => Array.from(el.options).map(o => o.text)")]
+            numeric = [o for o in options if o.isdigit()]
+            label = max(numeric, key=int) if str(value).lower() == 'max' and numeric else str(value)
+            select.select_option(label=label)
+            self.logger.info(f"Rows per page set to {label}.")
+        except Exception as e:
+            self.logger.warning(f"Failed to set rows per page ({value}): {e}")
+
+    def current_page(self) -> Optional[int]:
+        """현재 선택된 목록 페이지 번호 (페이지 목록이 없으면 None)"""
+        return self.page.evaluate(PAGE_LABELS_JS, [PAGE_LABEL_SELECTOR, SELECTED_PAGE_SELECTOR])['selected']
+
+    def is_on_list(self) -> bool:
+        """목록 그리드가 보이는 상태인지"""
+        try:
+            return self.page.locator(GRID_SELECTOR).first.is_visible()
+        except Exception:
+            return False
+
+    @timed("navigator.jump_to_page")
+    def jump_to_page(self, target_page: int) -> bool:
+        """
+        목록을 target_page로 바로 이동 (이동 횟수가 페이지 깊이에 비례하지 않도록)
+        1. WebSquare pageList API (setSelectedIndex + onviewchange)
+        2. 그룹 화살표로 대상 번호가 보일 때까지 이동 후 번호 클릭
+        """
+        try:
+            if self.current_page() == target_page:
+                return True
+            self.logger.info(f"Jumping to page {target_page}...")
+            signature = self.waits.grid_signature(self.page, GRID_ROWS_SELECTOR)
+
+            # 1. pageList 컴포넌트 API
+            self.waits.throttle()
+            if self.page.evaluate(PAGELIST_JUMP_JS, [PAGELIST_ID, target_page]):
+                if self.waits.selected_page(self.page, SELECTED_PAGE_SELECTOR, target_page):
+                    self.waits.grid_changed(self.page, GRID_ROWS_SELECTOR, signature, name="page_change")
+                    return True
+                self.logger.warning("Pagelist API did not move the grid. Falling back to group arrows.")
+
+            # 2. 그룹 화살표 + 번호
+            return self._jump_by_groups(target_page)
+
+        except Exception as e:
+            self.logger.error(f"Page jump error: {e}")
+            return False
+
+    def _jump_by_groups(self, target_page: int) -> bool:
+        for _ in range(MAX_GROUP_HOPS):
+            state = self.page.evaluate(PAGE_LABELS_JS, [PAGE_LABEL_SELECTOR, SELECTED_PAGE_SELECTOR])
+            labels = state['labels']
+            if state['selected'] == target_page:
+                return True
+            if not labels:
+                return False
+
+            signature = self.waits.grid_signature(self.page, GRID_ROWS_SELECTOR)
+            if target_page in labels:
+                self.waits.throttle()
+                self.page.locator(f"{PAGE_LABEL_SELECTOR}:text-is('{target_page}')").first.click(force=True)
+                return self._wait_page_change(target_page, signature)
+
+            arrow = self.page.locator(NEXT_GROUP_SELECTOR if target_page > max(labels) else PREV_GROUP_SELECTOR)
+            if not arrow.is_visible():
+                self.logger.warning(f"Page {target_page} is out of range (visible: {labels[0]}~{labels[-1]}).")
+                return False
+            self.waits.throttle()
+            arrow.click(force=True)
+            self.waits.until("page_group", self.page, PAGE_GROUP_CHANGED_JS, [PAGE_LABEL_SELECTOR, labels[0]])
+            self.waits.loading_done(self.page)
+
+        self.logger.error(f"Too many group moves while jumping to page {target_page}.")
+        return False
+
+    @timed("navigator.move_to_next_page")
     def move_to_next_page(self, current_page: int) -> bool:
-        """페이지네이션 처리"""
+        """페이지네이션 처리 (False: 다음 페이지 없음, 이동을 확인하지 못하면 PageMoveFailed)"""
         next_page = current_page + 1
         self.logger.info(f"Attempting to move to page {next_page}...")
 
         try:
+            signature = self.waits.grid_signature(self.page, GRID_ROWS_SELECTOR)
+            self.waits.throttle()
+
             # 숫자 버튼
             next_btn = self.page.locator(f".w2pageList_label:text-is('{next_page}')").first
             if next_btn.is_visible():
                 next_btn.click(force=True)
-                return True
+                return self._confirm_page_change(next_page, signature)
             
             # 화살표 버튼
-            arrow = self.page.locator("#mf_wfm_container_pagelist_next_btn")
+            arrow = self.page.locator(NEXT_GROUP_SELECTOR)
             if arrow.is_visible():
                 self.logger.info("Clicking next group arrow...")
                 arrow.click(force=True)
-                time.sleep(2.0)
-                self.page.wait_for_load_state("networkidle")
 
                 # 이동 확인 (현재 선택된 페이지 번호 확인)
-                curr_selected = self.page.locator(".w2pageList_label_selected").first
-                if curr_selected.is_visible() and curr_selected.inner_text().strip() == str(next_page):
-                    return True
+                if self.waits.selected_page(self.page, SELECTED_PAGE_SELECTOR, next_page):
+                    return self._confirm_page_change(next_page, signature)
                 
                 # 버튼 다시 찾기
                 next_btn_after = self.page.locator(f".w2pageList_label:text-is('{next_page}')").first
                 if next_btn_after.is_visible():
                     next_btn_after.click(force=True)
-                    return True
+                    return self._confirm_page_change(next_page, signature)
+                # 다음 그룹 화살표가 있었으므로 마지막 페이지가 아님
+                raise PageMoveFailed(f"page {next_page} did not appear after the group arrow")
 
             return False
+        except PageMoveFailed:
+            raise
         except Exception as e:
-            self.logger.error(f"Pagination error: {e}")
+            raise PageMoveFailed(f"pagination error: {e}") from e
+
+    def _confirm_page_change(self, page_no: int, signature) -> bool:
+        """다음 페이지 클릭 후 이동 확인 (확인하지 못하면 마지막 페이지와 구분하도록 예외)"""
+        if not self._wait_page_change(page_no, signature):
+            raise PageMoveFailed(f"page {page_no} change was not confirmed in time")
+        return True
+
+    def _wait_page_change(self, page_no: int, signature) -> bool:
+        """선택 페이지 번호와 그리드 갱신 대기 (둘 다 확인되어야 True, 이전 목록을 읽지 않도록)"""
+        if not self.waits.selected_page(self.page, SELECTED_PAGE_SELECTOR, page_no):
             return False
+        return self.waits.grid_changed(self.page, GRID_ROWS_SELECTOR, signature, name="page_change")
 
+    def get_row(self, index: int) -> Locator:
+        """목록 그리드의 index번째 행"""
+        return self.page.locator(GRID_ROWS_SELECTOR).nth(index)
+
+    @timed("navigator.enter_detail_page")
     def enter_detail_page(self, link_element) -> bool:
         """상세 페이지 진입"""
-        detail_header = "#mf_wfm_cntsHeader_spnHeaderTitle"
-
         try:
-            # 클릭 전 요소 안정성 확보
-            if not link_element.is_visible():
-                self.logger.warning("Link element not visible.")
+            if not self.click_detail_link(link_element):
                 return False
-            
-            # 클릭
-            try: link_element.evaluate("el => el.click()")
-            except: link_element.click(force=True)
-            
-            # 화면 전환 대기
-            for _ in range(10):
-                try:
-                    header = self.page.locator(detail_header)
-                    if header.is_visible() and "상세" in header.inner_text():
-                        return True
-                except: pass
-                time.sleep(0.5)
-            
-            # 타임아웃
-            self.logger.error("Timeout waiting for detail page header.")
-            return False
+            return self.wait_for_detail_page()
 
         except Exception as e:
             self.logger.error(f"Error entering detail: {e}")
             return False
 
+    def click_detail_link(self, link_element) -> bool:
+        """상세 링크 클릭만 수행 (화면 전환은 기다리지 않음)"""
+        # 클릭 전 요소 안정성 확보
+        if not link_element.is_visible():
+            self.logger.warning("Link element not visible.")
+            return False
+
+        # 클릭
+        self.waits.throttle()
+        try: link_element.evaluate("el => el.click()")
+        except: link_element.click(force=True)
+        return True
+
+    def wait_for_detail_page(self) -> bool:
+        """상세 화면 전환 대기 (헤더 텍스트)"""
+        if self.waits.text_contains("detail", self.page, DETAIL_HEADER_SELECTOR, "상세", timeout=5000):
+            return True
+
+        # 타임아웃
+        self.logger.error("Timeout waiting for detail page header.")
+        return False
+
+    @timed("navigator.go_back_to_list")
     def go_back_to_list(self):
         """목록으로 복귀"""
+        self.waits.throttle()
         self.page.go_back()
-        self.page.locator("table[id*='grdBidPbancList_body_table']").first.wait_for(state="visible", timeout=10000)
-        time.sleep(0.5)
\ No newline at end of file
+        self.page.locator(GRID_SELECTOR).first.wait_for(state="visible", timeout=10000)
+        self.waits.loading_done(self.page)
\ No newline at end of file
@@ -1,17 +1,69 @@
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List
 from playwright.sync_api import Page, Locator
 from src.models.bid_notice import BidNotice
 from src.crawlers.components.nuri_detail_extractor import NuriDetailExtractor
 from src.crawlers.components.bid_factory import BidFactory
+from src.crawlers.components.snapshot_store import DetailSnapshotStore
+from src.utils.metrics import timed
+
+# 그리드 전체 스냅샷 스크립트 (행마다 가시성, 셀 텍스트, 링크 존재 여부를 한 번에 수집)
+GRID_SNAPSHOT_JS = """([selector, titleColumn]) => Array.from(document.querySelectorAll(selector)).map((tr, index) => {
+    const cells = Array.from(tr.querySelectorAll('td'));
+    const titleCell = cells[titleColumn];
+    return {
+        index: index,
+        visible: !!(tr.offsetWidth || tr.offsetHeight || tr.getClientRects().length),
+        has_link: !!(titleCell && titleCell.querySelector('a')),
+        cells: cells.map(td => td.innerText)
+    };
+})"""
 
 class NuriParser:
+    # 목록 그리드 컬럼 인덱스 (Key : td 순번)
+    LIST_COLUMNS = {
+        'notice_code': 1,
+        'title': 2,
+        'process_type': 3,
+        'category': 4,
+        'date_posted': 19,
+    }
+    TITLE_COLUMN = 2
+
     def __init__(self, logger):
         self.logger = logger
         self.extractor = NuriDetailExtractor(logger)
+        self.snapshots: Optional[DetailSnapshotStore] = None
+
+    def enable_snapshots(self, store: DetailSnapshotStore, container: str):
+        """상세 파싱 시 container 영역 HTML을 스냅샷 저장소에 보관"""
+        self.snapshots = store
+        self.extractor.snapshot_container = container
+
+    @timed("parser.snapshot_grid")
+    def snapshot_grid(self, page: Page, rows_selector: str) -> List[Dict[str, Any]]:
+        """
+        그리드 전체를 evaluate 1회로 스냅샷
+        - return: 행별 {index, visible, has_link, cells}
+        """
+        return page.evaluate(GRID_SNAPSHOT_JS, [rows_selector, self.TITLE_COLUMN])
+
+    @staticmethod
+    def parse_snapshot_row(snapshot_row: Dict[str, Any]) -> Dict[str, Any]:
+        """스냅샷 행 -> 목록 데이터 (link는 호출 측에서 인덱스로 지정)"""
+        cells = snapshot_row.get('cells', [])
+        texts = {key: cells[idx] if idx < len(cells) else "" for key, idx in NuriParser.LIST_COLUMNS.items()}
+        data = NuriParser.empty_list_data()
+        data.update(NuriParser.build_list_data(texts))
+        return data
+
+    @staticmethod
+    def row_link(row: Locator) -> Locator:
+        """목록 행의 상세 링크 (Locator 생성만 하므로 브라우저 호출 없음)"""
+        return row.locator("td").nth(NuriParser.TITLE_COLUMN).locator("a").first
 
-    def parse_list_row(self, row: Locator) -> Dict[str, Any]:
-        """목록 행 파싱"""
-        data = {
+    @staticmethod
+    def empty_list_data() -> Dict[str, Any]:
+        return {
             "notice_code": "",
             "title": "",
             "link": None,
@@ -19,40 +71,48 @@ class NuriParser:
             "category": "",
             "process_type": ""
         }
-        try:
-            cells = row.locator("td")
-            
-            # 공고번호 추출
-            data["notice_code"] = cells.nth(1).inner_text().strip()
-            
-            # 제목 추출
-            title_cell = cells.nth(2)
-            data["title"] = title_cell.inner_text().strip()
-            data["link"] = title_cell.locator("a").first
-            
-            # 공고구분, 공고분류 추출
-            data["process_type"] = cells.nth(3).inner_text().strip()
-            data["category"] = cells.nth(4).inner_text().strip()
-            
-            # 공고일자 추출
-            date_posted = cells.nth(19).inner_text().strip()
-            if date_posted:
-                date_posted = date_posted.replace("/", "-")
-            data["date_posted"] = date_posted
-            
-            return data
 
-        except Exception as e:
-            self.logger.error(f"Error parsing list row: {e}")
-            return data
+    @staticmethod
+    def build_list_data(texts: Dict[str, str]) -> Dict[str, Any]:
+        """컬럼별 원문 텍스트 -> 목록 데이터 정제 (link 제외)"""
+        data = {key: (texts.get(key) or "").strip() for key in NuriParser.LIST_COLUMNS}
+
+        # 공고일자 포맷 통일
+        if data["date_posted"]:
+            data["date_posted"] = data["date_posted"].replace("/", "-")
+        return data
+
+    @staticmethod
+    def to_basic_data(row_data: Dict[str, Any]) -> Dict[str, Any]:
+        """목록 행 데이터 중 상세 파싱에 넘길 기본 정보"""
+        return {
+            'title': row_data['title'],
+            'notice_code_full': row_data['notice_code'],
+            'date_posted': row_data['date_posted'],
+            'category': row_data['category'],
+            'process_type': row_data['process_type']
+        }
 
+    @timed("parser.parse_detail")
     def parse_detail(self, page: Page, list_data: Dict[str, Any]) -> Optional[BidNotice]:
         """상세 페이지 파싱"""
         try:
             # HTML에서 Raw Data 추출
             raw_data = self.extractor.extract_all(page, list_data)
+            if self.snapshots:
+                self.snapshots.keep(raw_data, list_data, page.url)
             
             # 객체 생성
+            return self.build_notice(raw_data)
+
+        except Exception as e:
+            self.logger.error(f"Detail parsing failed: {e}")
+            return None
+
+    @timed("parser.build_notice")
+    def build_notice(self, raw_data: Dict[str, Any]) -> Optional[BidNotice]:
+        """Raw Data -> BidNotice (브라우저/HTTP 재생 경로 공통)"""
+        try:
             bid_notice = BidFactory.create_bid_notice(raw_data)
             
             # 파싱 성공 로그
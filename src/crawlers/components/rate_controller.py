@@ -0,0 +1,101 @@
+import time
+import threading
+from typing import Dict, Any, Callable, Optional
+
+# 포털 과부하로 보는 HTTP 상태 코드
+THROTTLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RateController:
+    """
+    AIMD 토큰 버킷 요청 속도 제어 (sync/async 공용, 스레드 안전)
+    - 화면 이동/상세 요청마다 토큰을 하나씩 사용하며, 토큰이 없으면 다음 토큰까지 대기합니다.
+    - 응답이 healthy_latency 이내로 성공하면 초당 약 increase만큼 속도를 올리고(가산 증가),
+      타임아웃/HTTP 429·5xx/오류 대화상자가 나오면 decrease 배로 줄입니다(승산 감소).
+    - 감소는 cooldown초에 한 번만 적용하여 같은 장애로 연속 감소하지 않게 합니다.
+    """
+
+    def __init__(self, config: Dict, logger, clock: Callable[[], float] = time.monotonic):
+        self.logger = logger
+        self.clock = clock
+        self.enabled = config.get('enabled', True)
+        self.min_rate = config.get('min_rate', 0.2)
+        self.max_rate = config.get('max_rate', 10.0)
+        self.rate = min(self.max_rate, max(self.min_rate, config.get('initial_rate', 2.0)))
+        self.burst = max(1.0, config.get('burst', 2))
+        self.increase = config.get('increase', 0.1)
+        self.decrease = config.get('decrease', 0.5)
+        self.healthy_latency = config.get('healthy_latency', 3.0)
+        self.cooldown = config.get('cooldown', 5.0)
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self._last_backoff: Optional[float] = None
+        self.state = "increase"
+        self.counts = {'acquired': 0, 'successes': 0, 'failures': 0, 'backoffs': 0}
+        self.last_failure = ""
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간(초) 반환"""
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            self.counts['acquired'] += 1
+            # 음수 토큰은 앞선 예약분이므로 그만큼 더 기다림
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def on_success(self, latency: float):
+        """정상 응답 (지연이 healthy_latency 이내일 때만 속도 증가)"""
+        with self._lock:
+            self.counts['successes'] += 1
+            if latency > self.healthy_latency:
+                self.state = "hold"
+                return
+            # 현재 속도 기준 1초 분량의 성공마다 increase만큼 증가
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+            self.state = "increase"
+
+    def on_failure(self, reason: str):
+        """타임아웃/429·5xx/오류 대화상자 (cooldown 안에서는 한 번만 감소)"""
+        with self._lock:
+            self.counts['failures'] += 1
+            self.last_failure = reason
+            now = self.clock()
+            if self._last_backoff is not None and now - self._last_backoff < self.cooldown:
+                return
+            self._last_backoff = now
+            previous = self.rate
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            # 남아 있는 토큰도 비워 즉시 느려지도록
+            self._tokens = min(self._tokens, 0.0)
+            self.counts['backoffs'] += 1
+            self.state = "backoff"
+        self.logger.warning(f"Rate backoff ({reason}): {previous:.2f} -> {self.rate:.2f} req/s")
+
+    def on_response(self, status: int, latency: float):
+        """HTTP 응답 상태로 성공/실패 판정"""
+        if status in THROTTLE_STATUSES:
+            self.on_failure(f"http_{status}")
+        else:
+            self.on_success(latency)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 속도와 상태"""
+        with self._lock:
+            return {'enabled': self.enabled, 'rate': round(self.rate, 3), 'state': self.state,
+                    'tokens': round(self._tokens, 3), 'last_failure': self.last_failure, **self.counts}
+
+    def log_summary(self):
+        s = self.snapshot()
+        self.logger.info(f"Rate control: {s['rate']} req/s ({s['state']}), {s['acquired']} requests, "
+                         f"{s['failures']} failures, {s['backoffs']} backoffs")
@@ -0,0 +1,30 @@
+from typing import Dict, Any, List, Optional
+
+class _SafeDict(dict):
+    """템플릿에 없는 컬럼은 빈 문자열로 치환"""
+    def __missing__(self, key):
+        return ""
+
+
+def render_fields(fields: Dict[str, str], record: Dict[str, Any]) -> Dict[str, str]:
+    """
+    응답 레코드를 필드 템플릿으로 변환
+    - fields: 결과 Key : 템플릿 (예: {"notice_code": "{bidPbancNo}-{bidPbancOrd}"})
+    """
+    values = _SafeDict({k: "" if v is None else str(v) for k, v in record.items()})
+    return {key: template.format_map(values) for key, template in fields.items()}
+
+
+def find_records(payload: Any, list_key: str = "") -> Optional[List[Dict[str, Any]]]:
+    """list_key가 지정되면 해당 키, 아니면 가장 먼저 발견되는 '딕셔너리 리스트'를 레코드 목록으로 간주"""
+    if isinstance(payload, dict):
+        if list_key and isinstance(payload.get(list_key), list):
+            return payload[list_key]
+        for value in payload.values():
+            found = find_records(value, list_key)
+            if found is not None:
+                return found
+        return None
+    if isinstance(payload, list) and not list_key and (not payload or isinstance(payload[0], dict)):
+        return payload
+    return None
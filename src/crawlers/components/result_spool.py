@@ -0,0 +1,153 @@
+import os
+import json
+import sqlite3
+import threading
+from typing import Tuple, List, Iterable, Dict, Any, Optional
+from src.models.bid_notice import BidNotice
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoint (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    page INTEGER NOT NULL,
+    idx INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS notices (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    notice_code TEXT NOT NULL,
+    degree TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS retries (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL
+);
+"""
+
+
+class ResultSpool:
+    """
+    체크포인트와 수집 결과를 함께 보관하는 로컬 스풀 (SQLite WAL)
+    - CrawlStateStore와 같은 load/save/clear 인터페이스이며, save()에 넘긴 공고는 체크포인트와
+      같은 트랜잭션으로 기록됩니다. (행마다 파일 전체를 다시 쓰지 않음)
+    - 재시도 대기 중인 행도 체크포인트와 같은 트랜잭션으로 기록합니다.
+    - 스풀 행 번호는 save()가 반환하고 공고의 spool_seq에도 기록하며, 저장소 저장이 확인된 공고는
+      그 번호로 mark_flushed()에서 지웁니다. 재시작 시 남은 공고는 pending()으로 재생합니다.
+    - 첨부파일 다운로드처럼 기록 후 채워지는 값은 refresh()로 다시 기록합니다.
+    - synchronous=NORMAL(WAL)에서는 커밋마다 fsync하지 않고 WAL 체크포인트 시점에 모아서 동기화합니다.
+    """
+
+    def __init__(self, path: str, logger, synchronous: str = "NORMAL"):
+        self.path = path
+        self.logger = logger
+        self._lock = threading.Lock()
+        # 저장 확인 콜백이 저장 스레드에서 호출될 수 있음
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.executescript(SCHEMA)
+
+    # --- 체크포인트 (CrawlStateStore 호환) ---
+    def load(self) -> Tuple[int, int]:
+        """(페이지, 인덱스) 반환"""
+        with self._lock:
+            row = self._conn.execute("SELECT page, idx FROM checkpoint WHERE id = 1").fetchone()
+        return (row[0], row[1]) if row else (1, 0)
+
+    def load_retries(self) -> List[Dict[str, Any]]:
+        """기록된 재시도 대기 행"""
+        with self._lock:
+            rows = self._conn.execute("SELECT payload FROM retries ORDER BY rowid").fetchall()
+        return [json.loads(payload) for payload, in rows]
+
+    def save(self, page: int, index: int, notices: Iterable[BidNotice] = (),
+             retries: Optional[List[Dict[str, Any]]] = None) -> List[int]:
+        """
+        체크포인트 갱신과 공고 추가(, 재시도 대기 행 교체)를 한 트랜잭션으로 기록 (retries가 None이면 유지)
+        - 추가한 공고의 스풀 행 번호를 반환하고 각 공고의 spool_seq에도 기록합니다.
+        """
+        notices = list(notices)
+        seqs = []
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN")
+            try:
+                for bid in notices:
+                    cur.execute("INSERT INTO notices (notice_code, degree, payload) VALUES (?, ?, ?)",
+                                (bid.notice_code, bid.degree, bid.model_dump_json()))
+                    seqs.append(cur.lastrowid)
+                if retries is not None:
+                    cur.execute("DELETE FROM retries")
+                    cur.executemany("INSERT INTO retries (key, payload) VALUES (?, ?)",
+                                    [(r['key'], json.dumps(r, ensure_ascii=False)) for r in retries])
+                cur.execute("INSERT INTO checkpoint (id, page, idx) VALUES (1, ?, ?) "
+                            "ON CONFLICT(id) DO UPDATE SET page = excluded.page, idx = excluded.idx",
+                            (page, index))
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+        for bid, seq in zip(notices, seqs):
+            bid.spool_seq = seq
+        return seqs
+
+    def clear(self):
+        """정상 종료 시 체크포인트와 재시도 대기 행 삭제 (저장되지 않은 공고는 유지)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM checkpoint")
+            self._conn.execute("DELETE FROM retries")
+        self.logger.info("Crawling finished successfully. Checkpoint cleared.")
+
+    # --- 결과 스풀 ---
+    def pending(self) -> List[BidNotice]:
+        """저장 확인 전에 중단된 공고 (재시작 시 저장소로 재생, spool_seq 기록됨)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT seq, payload FROM notices ORDER BY seq").fetchall()
+        notices = []
+        for seq, payload in rows:
+            bid = BidNotice.model_validate_json(payload)
+            bid.spool_seq = seq
+            notices.append(bid)
+        return notices
+
+    def refresh(self, notices: Iterable[BidNotice]):
+        """기록 후 바뀐 공고(첨부파일 다운로드 정보 등)를 스풀에 다시 기록"""
+        rows = [(bid.model_dump_json(), bid.spool_seq) for bid in notices if bid.spool_seq is not None]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("UPDATE notices SET payload = ? WHERE seq = ?", rows)
+
+    def mark_flushed(self, notices: List[BidNotice]):
+        """저장이 확인된 공고를 스풀에서 제거"""
+        self.ack([bid.spool_seq for bid in notices if bid.spool_seq is not None])
+
+    def ack(self, seqs: List[int]):
+        """스풀 행 번호로 공고 제거"""
+        if not seqs:
+            return
+        with self._lock:
+            self._conn.executemany("DELETE FROM notices WHERE seq = ?", [(s,) for s in seqs])
+
+    def compact(self):
+        """WAL을 본 파일에 반영하고 비움 (남은 공고가 없으면 파일 공간도 회수)"""
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            if not self._conn.execute("SELECT 1 FROM notices LIMIT 1").fetchone():
+                self._conn.execute("VACUUM")
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM notices").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_state_store(path: str, spool_config: Optional[Dict], logger):
+    """spool.enabled면 ResultSpool, 아니면 JSON 체크포인트 파일"""
+    from src.crawlers.components.crawl_state import CrawlStateStore
+    if spool_config and spool_config.get('enabled'):
+        spool_path = spool_config.get('path') or os.path.splitext(path)[0] + ".spool.db"
+        return ResultSpool(spool_path, logger, spool_config.get('synchronous', 'NORMAL'))
+    return CrawlStateStore(path, logger)
@@ -0,0 +1,112 @@
+import time
+from typing import Dict, Any, List, Callable, Optional
+from src.utils.metrics import METRICS
+
+
+class RetryEntry:
+    """재시도 대기 중인 행 (공고번호-차수 기준)"""
+
+    def __init__(self, key: str, page: int, index: int, list_data: Dict[str, Any]):
+        self.key = key
+        self.page = page
+        self.index = index
+        self.list_data = list_data
+        self.failures = 0
+        self.next_at = 0.0
+        self.error = ""
+
+
+class RowRetryQueue:
+    """
+    실패한 행의 재시도 대기열
+    - 공고번호별로 실패 횟수를 세고, backoff × 2^(실패-1)초(상한 backoff_max) 뒤에 다시 시도합니다.
+    - max_retries번 재시도해도 실패하면 포기하고 기록만 남깁니다.
+    - 페이지 처리가 끝날 때 기한이 된 같은 페이지 행을, 실행 마지막에 남은 행 전체를 재시도합니다.
+    - 변경된 대기열은 take_changes()로 꺼내 체크포인트와 함께 기록하고, 재시작 시 restore()로 되살립니다.
+    """
+
+    def __init__(self, max_retries: int, backoff: float, backoff_max: float, logger,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.logger = logger
+        self.clock = clock
+        self._entries: Dict[str, RetryEntry] = {}
+        self.gave_up: List[str] = []
+        self.recovered = 0
+        # 마지막 take_changes() 이후 대기열 변경 여부
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, page: int, index: int, list_data: Dict[str, Any], error: str = "") -> bool:
+        """실패 기록 (재시도 예정이면 True, 횟수를 넘겨 포기하면 False)"""
+        key = list_data['notice_code_full']
+        entry = self._entries.get(key) or RetryEntry(key, page, index, list_data)
+        entry.page, entry.index, entry.list_data = page, index, list_data
+        entry.failures += 1
+        entry.error = error
+        self._dirty = True
+
+        if entry.failures > self.max_retries:
+            self._entries.pop(key, None)
+            self.gave_up.append(key)
+            METRICS.inc("rows.gave_up")
+            self.logger.error(f"Giving up {key} after {entry.failures} failures: {error}")
+            return False
+
+        delay = min(self.backoff_max, self.backoff * (2 ** (entry.failures - 1)))
+        entry.next_at = self.clock() + delay
+        self._entries[key] = entry
+        METRICS.inc("rows.retry_queued")
+        self.logger.warning(f"Row {key} queued for retry {entry.failures}/{self.max_retries} in {delay:.1f}s.")
+        return True
+
+    def resolve(self, key: str):
+        """재시도 성공"""
+        if self._entries.pop(key, None) is not None:
+            self._dirty = True
+            self.recovered += 1
+            METRICS.inc("rows.recovered")
+
+    def due(self, page: Optional[int] = None) -> List[RetryEntry]:
+        """기한이 된 항목 (page 지정 시 해당 페이지만, 인덱스 순)"""
+        now = self.clock()
+        return sorted((e for e in self._entries.values() if e.next_at <= now and (page is None or e.page == page)),
+                      key=lambda e: (e.page, e.index))
+
+    def pages(self) -> List[int]:
+        return sorted({e.page for e in self._entries.values()})
+
+    def entries(self, page: int) -> List[RetryEntry]:
+        """해당 페이지의 남은 항목 (기한 무관, 인덱스 순)"""
+        return sorted((e for e in self._entries.values() if e.page == page), key=lambda e: e.index)
+
+    def wait_time(self, entries: List[RetryEntry]) -> float:
+        """가장 이른 항목의 기한까지 남은 시간(초)"""
+        if not entries:
+            return 0.0
+        return max(0.0, min(e.next_at for e in entries) - self.clock())
+
+    def take_changes(self) -> Optional[List[Dict[str, Any]]]:
+        """마지막 호출 이후 바뀌었으면 남은 항목 전체를 기록용 딕셔너리로 반환 (변경 없으면 None)"""
+        if not self._dirty:
+            return None
+        self._dirty = False
+        return [{'key': e.key, 'page': e.page, 'index': e.index, 'list_data': e.list_data,
+                 'failures': e.failures, 'error': e.error} for e in self._entries.values()]
+
+    def restore(self, items: List[Dict[str, Any]]):
+        """기록된 항목 복원 (실패 횟수 유지, 대기 시간은 이어갈 수 없으므로 바로 재시도 대상)"""
+        for item in items:
+            entry = RetryEntry(item['key'], item['page'], item['index'], item['list_data'])
+            entry.failures = item.get('failures', 1)
+            entry.error = item.get('error', "")
+            self._entries[entry.key] = entry
+        if items:
+            self.logger.info(f"Restored {len(items)} rows waiting for retry.")
+
+    def summary(self) -> Dict[str, int]:
+        return {'recovered': self.recovered, 'gave_up': len(self.gave_up), 'pending': len(self._entries)}
@@ -0,0 +1,216 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Any, List, Iterator, Optional
+from src.crawlers.components.bid_factory import BidFactory
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    notice_code TEXT NOT NULL,
+    degree TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    segment TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    url TEXT NOT NULL DEFAULT '',
+    list_data TEXT NOT NULL,
+    captured_at REAL NOT NULL,
+    UNIQUE (notice_code, degree, sha256)
+);
+CREATE INDEX IF NOT EXISTS ix_snapshots_sha256 ON snapshots (sha256);
+"""
+
+SNAPSHOT_COLUMNS = "notice_code, degree, sha256, segment, offset, length, url, list_data, captured_at"
+
+# Raw Data 에 실어 보내는 상세 HTML Key (NuriDetailExtractor.extract_all 참고)
+HTML_KEY = "detail_html"
+
+
+class DetailSnapshot:
+    """저장된 상세 스냅샷 1건의 위치와 목록 데이터"""
+
+    def __init__(self, notice_code: str, degree: str, sha256: str, segment: str, offset: int, length: int,
+                 url: str, list_data: Dict[str, Any], captured_at: float):
+        self.notice_code = notice_code
+        self.degree = degree
+        self.sha256 = sha256
+        self.segment = segment
+        self.offset = offset
+        self.length = length
+        self.url = url
+        self.list_data = list_data
+        self.captured_at = captured_at
+
+
+class DetailSnapshotStore:
+    """
+    상세 화면 HTML 스냅샷 세그먼트 저장소
+    - 본문은 zlib 압축 후 세그먼트 파일(<dir>/seg-*.dat)에 이어 쓰고, segment_mb를 넘으면 새 파일로 넘어갑니다.
+    - 색인(<dir>/index.db)은 (공고번호, 차수, 내용 SHA-256)마다 세그먼트 위치와 목록 데이터를 기록합니다.
+    - 같은 내용은 공고가 달라도 한 번만 쓰고, 공고별로는 마지막에 본 내용이 최신입니다.
+    - 세그먼트 파일 이름에 프로세스별 식별자가 들어가므로 구간 분할 프로세스가 같은 디렉터리를 함께 써도 됩니다.
+    """
+
+    def __init__(self, root: str, logger, segment_bytes: int = 64 * 2 ** 20, compress_level: int = 6):
+        self.root = root
+        self.logger = logger
+        self.segment_bytes = segment_bytes
+        self.compress_level = compress_level
+        os.makedirs(root, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(root, "index.db"), timeout=30,
+                                     check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        self._writer = f"{time.strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+        self._segment_no = 0
+        self._segment: Optional[str] = None
+        self._file = None
+        self.counts = {'written': 0, 'deduplicated': 0, 'bytes': 0}
+
+    @classmethod
+    def from_config(cls, config: Dict, logger) -> "DetailSnapshotStore":
+        return cls(config.get('dir', 'snapshots'), logger,
+                   segment_bytes=int(config.get('segment_mb', 64) * 2 ** 20),
+                   compress_level=config.get('compress_level', 6))
+
+    def keep(self, raw_data: Dict[str, Any], list_data: Dict[str, Any], url: str = ""):
+        """Raw Data 에 실린 상세 HTML을 꺼내 저장 (HTML이 없으면 무시, 저장 실패는 수집을 막지 않음)"""
+        html = raw_data.pop(HTML_KEY, None)
+        if not html:
+            return
+        try:
+            self.put(list_data, html, url)
+        except Exception as e:
+            self.logger.warning(f"Failed to store detail snapshot ({list_data.get('notice_code_full')}): {e}")
+
+    def put(self, list_data: Dict[str, Any], html: str, url: str = "") -> bool:
+        """스냅샷 저장 (새 내용을 세그먼트에 썼으면 True, 같은 내용이 이미 있으면 False)"""
+        code, degree = BidFactory.split_notice_code(list_data.get('notice_code_full', ''))
+        data = html.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        plain = {k: v for k, v in list_data.items() if v is None or isinstance(v, (str, int, float, bool))}
+
+        with self._lock:
+            found = self._conn.execute("SELECT segment, offset, length FROM snapshots WHERE sha256 = ? LIMIT 1",
+                                       (sha256,)).fetchone()
+            written = found is None
+            segment, offset, length = found or self._append(zlib.compress(data, self.compress_level))
+
+            cur = self._conn.cursor()
+            cur.execute("BEGIN")
+            try:
+                # 같은 공고의 같은 내용은 최신 순번으로 다시 기록
+                cur.execute("DELETE FROM snapshots WHERE notice_code = ? AND degree = ? AND sha256 = ?",
+                            (code, degree, sha256))
+                cur.execute("INSERT INTO snapshots (notice_code, degree, sha256, segment, offset, length, url, "
+                            "list_data, captured_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (code, degree, sha256, segment, offset, length, url,
+                             json.dumps(plain, ensure_ascii=False), time.time()))
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+
+            self.counts['written' if written else 'deduplicated'] += 1
+            if written:
+                self.counts['bytes'] += length
+        return written
+
+    def _append(self, blob: bytes):
+        """현재 세그먼트 끝에 쓰고 (세그먼트, 위치, 길이) 반환"""
+        if self._file is None or self._file.tell() + len(blob) > self.segment_bytes and self._file.tell() > 0:
+            self._roll()
+        offset = self._file.tell()
+        self._file.write(blob)
+        # 색인보다 본문이 먼저 디스크에 닿도록
+        self._file.flush()
+        return self._segment, offset, len(blob)
+
+    def _roll(self):
+        if self._file is not None:
+            self._file.close()
+        self._segment_no += 1
+        self._segment = f"seg-{self._writer}-{self._segment_no:04d}.dat"
+        self._file = open(os.path.join(self.root, self._segment), "ab")
+
+    def get(self, notice_code: str, degree: str) -> Optional[DetailSnapshot]:
+        """공고의 최신 스냅샷"""
+        with self._lock:
+            row = self._conn.execute(f"SELECT {SNAPSHOT_COLUMNS} FROM snapshots WHERE notice_code = ? AND degree = ? "
+                                     "ORDER BY seq DESC LIMIT 1", (notice_code, degree)).fetchone()
+        return self._to_snapshot(row) if row else None
+
+    def latest(self) -> List[DetailSnapshot]:
+        """공고별 최신 스냅샷 (저장 순서)"""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {SNAPSHOT_COLUMNS} FROM snapshots WHERE seq IN "
+                                      "(SELECT MAX(seq) FROM snapshots GROUP BY notice_code, degree) "
+                                      "ORDER BY seq").fetchall()
+        return [self._to_snapshot(row) for row in rows]
+
+    def read(self, snapshot: DetailSnapshot) -> str:
+        """스냅샷 HTML"""
+        reader = SegmentReader(self.root)
+        try:
+            return reader.read(snapshot.segment, snapshot.offset, snapshot.length)
+        finally:
+            reader.close()
+
+    def iter_html(self, snapshots: List[DetailSnapshot]) -> Iterator[str]:
+        """스냅샷 HTML을 순서대로 (세그먼트 파일을 열어 둔 채 읽음)"""
+        reader = SegmentReader(self.root)
+        try:
+            for snapshot in snapshots:
+                yield reader.read(snapshot.segment, snapshot.offset, snapshot.length)
+        finally:
+            reader.close()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(DISTINCT notice_code || '-' || degree) FROM snapshots").fetchone()[0]
+
+    def log_summary(self):
+        c = self.counts
+        self.logger.info(f"Detail snapshots: {c['written']} written ({c['bytes'] / 2 ** 20:.1f}MB compressed), "
+                         f"{c['deduplicated']} unchanged.")
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._conn.close()
+
+    @staticmethod
+    def _to_snapshot(row) -> DetailSnapshot:
+        code, degree, sha256, segment, offset, length, url, list_data, captured_at = row
+        return DetailSnapshot(code, degree, sha256, segment, offset, length, url, json.loads(list_data), captured_at)
+
+
+class SegmentReader:
+    """세그먼트 본문 읽기 (세그먼트별 파일 핸들 재사용, 색인 DB 없이 위치만으로 읽으므로 작업 프로세스에서도 사용)"""
+
+    def __init__(self, root: str):
+        self.root = root
+        self._files = {}
+
+    def read(self, segment: str, offset: int, length: int) -> str:
+        f = self._files.get(segment)
+        if f is None:
+            f = self._files[segment] = open(os.path.join(self.root, segment), "rb")
+        f.seek(offset)
+        return zlib.decompress(f.read(length)).decode("utf-8")
+
+    def close(self):
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
@@ -0,0 +1,305 @@
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, Tuple
+from src.crawlers.components.rate_controller import RateController, THROTTLE_STATUSES
+
+# WebSquare 로딩 마스크(processbar) 셀렉터
+LOADING_MASK_SELECTOR = "[id*='___processbar'], .w2processbar, .w2loading"
+
+# 로딩 마스크가 없거나 모두 숨겨졌는지
+LOADING_DONE_JS = """(maskSelector) => Array.from(document.querySelectorAll(maskSelector))
+    .every(el => !(el.offsetWidth || el.offsetHeight || el.getClientRects().length))"""
+
+# 그리드 상태 서명 (행 수, 첫 행 텍스트)
+GRID_SIGNATURE_JS = """(rowsSelector) => {
+    const rows = document.querySelectorAll(rowsSelector);
+    return [rows.length, rows.length ? rows[0].innerText : ''];
+}"""
+
+# 그리드가 이전 서명과 달라지고 로딩 마스크가 사라졌는지
+GRID_CHANGED_JS = """([rowsSelector, maskSelector, prevCount, prevFirst]) => {
+    const masked = Array.from(document.querySelectorAll(maskSelector))
+        .some(el => el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    if (masked) return false;
+    const rows = document.querySelectorAll(rowsSelector);
+    if (!rows.length) return false;
+    return rows.length !== prevCount || rows[0].innerText !== prevFirst;
+}"""
+
+# 요소가 보이고 텍스트에 특정 문자열을 포함하는지
+TEXT_CONTAINS_JS = """([selector, text]) => {
+    const el = document.querySelector(selector);
+    return !!(el && (el.offsetWidth || el.offsetHeight) && el.innerText.includes(text));
+}"""
+
+# 페이지 목록에서 선택된 번호 확인
+SELECTED_PAGE_JS = """([selector, page]) => {
+    const el = document.querySelector(selector);
+    return !!(el && el.innerText.trim() === String(page));
+}"""
+
+# index번째 행의 셀 텍스트 확인
+ROW_CELL_TEXT_JS = """([rowsSelector, index, column, text]) => {
+    const row = document.querySelectorAll(rowsSelector)[index];
+    const cell = row && row.querySelectorAll('td')[column];
+    return !!(cell && cell.innerText.trim() === text);
+}"""
+
+# 입력값(숫자만 비교)이 반영되었는지
+INPUT_VALUE_JS = """([el, value]) => el.value.replace(/\\D/g, '') === value.replace(/\\D/g, '')"""
+
+# 포털 오류로 보는 대화상자 문구
+ERROR_DIALOG_KEYWORDS = ("오류", "에러", "잠시 후", "지연", "error")
+
+
+class WaitStats:
+    """
+    대기 신호별 관찰 지연시간(초) 보관
+    - 최근 window개의 표본으로 p95를 계산하여 타임아웃과 페이싱 지연을 조정합니다.
+    """
+
+    def __init__(self, window: int = 200):
+        self.window = max(1, window)
+        self._lock = threading.Lock()
+        self._samples: Dict[str, deque] = {}
+        self.timeouts: Dict[str, int] = {}
+
+    def record(self, name: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=self.window)).append(seconds)
+
+    def record_timeout(self, name: str):
+        with self._lock:
+            self.timeouts[name] = self.timeouts.get(name, 0) + 1
+
+    def count(self, name: str) -> int:
+        with self._lock:
+            return len(self._samples.get(name, ()))
+
+    def percentile(self, name: str, q: float = 0.95) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(name, ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(round(q * (len(samples) - 1))))]
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            names = list(self._samples) + [n for n in self.timeouts if n not in self._samples]
+        return {
+            name: {
+                'count': self.count(name),
+                'p50': self.percentile(name, 0.5),
+                'p95': self.percentile(name),
+                'timeouts': self.timeouts.get(name, 0),
+            }
+            for name in names
+        }
+
+
+class _WaitPolicy:
+    """관찰한 p95로 타임아웃/페이싱 지연을 계산 (sync/async 공용)"""
+
+    def __init__(self, config: Dict, logger, stats: Optional[WaitStats] = None):
+        self.logger = logger
+        self.stats = stats or WaitStats(config.get('window', 200))
+        self.default_timeout = config.get('default_timeout', 15000)
+        self.min_timeout = config.get('min_timeout', 2000)
+        self.max_timeout = config.get('max_timeout', 30000)
+        self.timeout_multiplier = config.get('timeout_multiplier', 3.0)
+        self.min_samples = config.get('min_samples', 5)
+        self.pacing_ratio = config.get('pacing_ratio', 0.5)
+        self.pacing_max = config.get('pacing_max', 2.0)
+        # 화면 이동/상세 요청 속도 제어 (대기 결과를 성공/실패 신호로 사용)
+        self.rate = RateController(config.get('rate_control', {}), logger)
+
+    def timeout_for(self, name: str, default: Optional[int] = None) -> int:
+        """신호별 타임아웃(ms) = p95 × 배수 (표본이 부족하면 기본값)"""
+        if self.stats.count(name) < self.min_samples:
+            return default or self.default_timeout
+        p95_ms = self.stats.percentile(name) * 1000
+        return int(min(self.max_timeout, max(self.min_timeout, p95_ms * self.timeout_multiplier)))
+
+    def pacing_for(self, name: str) -> float:
+        """페이싱 지연(초) = 해당 신호 p95 × 비율 (상한 pacing_max, 표본이 없으면 0)"""
+        p95 = self.stats.percentile(name)
+        if p95 is None:
+            return 0.0
+        return min(self.pacing_max, p95 * self.pacing_ratio)
+
+    def _record(self, name: str, seconds: float):
+        self.stats.record(name, seconds)
+        self.rate.on_success(seconds)
+
+    def _record_timeout(self, name: str, penalize: bool = True):
+        self.stats.record_timeout(name)
+        if penalize:
+            self.rate.on_failure(f"timeout:{name}")
+
+    def _on_response(self, response):
+        """HTTP 429/5xx 응답은 속도 감소 신호"""
+        if response.status in THROTTLE_STATUSES:
+            self.rate.on_failure(f"http_{response.status}")
+
+    @staticmethod
+    def _is_error_dialog(message: str) -> bool:
+        return any(keyword in message.lower() for keyword in ERROR_DIALOG_KEYWORDS)
+
+    def log_summary(self):
+        for name, s in self.stats.summary().items():
+            p95 = f"{s['p95'] * 1000:.0f}ms" if s['p95'] is not None else "-"
+            self.logger.info(f"Wait '{name}': {s['count']} samples, p95 {p95}, timeouts {s['timeouts']}")
+        self.rate.log_summary()
+
+
+class WaitEngine(_WaitPolicy):
+    """
+    조건(Predicate) 기반 대기 (playwright.sync_api)
+    - 고정 sleep 대신 DOM 신호(그리드 행 변화, 헤더 텍스트, 선택 페이지 번호, 로딩 마스크)를 기다립니다.
+    - 성공한 대기의 지연시간을 기록하며, 타임아웃은 False로 반환합니다. (예외를 던지지 않음)
+    """
+
+    def until(self, name: str, page, js: str, arg: Any = None, timeout: Optional[int] = None,
+              penalize: bool = True) -> bool:
+        """page.wait_for_function으로 조건 대기 (penalize=False면 타임아웃을 속도 감소 신호로 쓰지 않음)"""
+        started = time.monotonic()
+        try:
+            page.wait_for_function(js, arg=arg, timeout=self.timeout_for(name, timeout), polling="raf")
+        except Exception as e:
+            self._record_timeout(name, penalize)
+            self.logger.warning(f"Wait '{name}' timed out: {str(e).splitlines()[0]}")
+            return False
+        self._record(name, time.monotonic() - started)
+        return True
+
+    def until_state(self, name: str, locator, state: str, timeout: Optional[int] = None) -> bool:
+        """Locator 상태(visible/hidden 등) 대기"""
+        started = time.monotonic()
+        try:
+            locator.wait_for(state=state, timeout=self.timeout_for(name, timeout))
+        except Exception:
+            self._record_timeout(name)
+            self.logger.warning(f"Wait '{name}' timed out (state: {state}).")
+            return False
+        self._record(name, time.monotonic() - started)
+        return True
+
+    def loading_done(self, page, timeout: Optional[int] = None) -> bool:
+        return self.until("loading", page, LOADING_DONE_JS, LOADING_MASK_SELECTOR, timeout)
+
+    def grid_signature(self, page, rows_selector: str) -> Tuple[int, str]:
+        count, first = page.evaluate(GRID_SIGNATURE_JS, rows_selector)
+        return count, first
+
+    def grid_changed(self, page, rows_selector: str, signature: Tuple[int, str], name: str = "grid",
+                     penalize: bool = True) -> bool:
+        return self.until(name, page, GRID_CHANGED_JS, [rows_selector, LOADING_MASK_SELECTOR, *signature],
+                          penalize=penalize)
+
+    def text_contains(self, name: str, page, selector: str, text: str, timeout: Optional[int] = None) -> bool:
+        return self.until(name, page, TEXT_CONTAINS_JS, [selector, text], timeout)
+
+    def selected_page(self, page, selector: str, page_no: int) -> bool:
+        return self.until("page_label", page, SELECTED_PAGE_JS, [selector, page_no])
+
+    def row_cell_text(self, page, rows_selector: str, index: int, column: int, text: str,
+                      timeout: Optional[int] = None) -> bool:
+        return self.until("row_match", page, ROW_CELL_TEXT_JS, [rows_selector, index, column, text], timeout)
+
+    def input_value(self, locator, value: str) -> bool:
+        handle = locator.element_handle()
+        return self.until("input", locator.page, INPUT_VALUE_JS, [handle, value], timeout=2000)
+
+    def pace(self, name: str):
+        """남아 있는 페이싱 지연 (관찰 p95 기반)"""
+        delay = self.pacing_for(name)
+        if delay > 0:
+            time.sleep(delay)
+
+    def throttle(self):
+        """요청을 보내는 동작 전에 호출 (토큰 버킷 대기)"""
+        self.rate.acquire()
+
+    def watch(self, context):
+        """BrowserContext의 429/5xx 응답과 오류 대화상자를 속도 제어에 반영"""
+        def on_dialog(dialog):
+            if self._is_error_dialog(dialog.message):
+                self.rate.on_failure("dialog")
+            dialog.dismiss()
+
+        context.on("response", self._on_response)
+        context.on("dialog", on_dialog)
+
+
+class AsyncWaitEngine(_WaitPolicy):
+    """WaitEngine의 playwright.async_api 버전 (WaitStats 공유 가능)"""
+
+    async def until(self, name: str, page, js: str, arg: Any = None, timeout: Optional[int] = None,
+                    penalize: bool = True) -> bool:
+        started = time.monotonic()
+        try:
+            await page.wait_for_function(js, arg=arg, timeout=self.timeout_for(name, timeout), polling="raf")
+        except Exception as e:
+            self._record_timeout(name, penalize)
+            self.logger.warning(f"Wait '{name}' timed out: {str(e).splitlines()[0]}")
+            return False
+        self._record(name, time.monotonic() - started)
+        return True
+
+    async def until_state(self, name: str, locator, state: str, timeout: Optional[int] = None) -> bool:
+        started = time.monotonic()
+        try:
+            await locator.wait_for(state=state, timeout=self.timeout_for(name, timeout))
+        except Exception:
+            self._record_timeout(name)
+            self.logger.warning(f"Wait '{name}' timed out (state: {state}).")
+            return False
+        self._record(name, time.monotonic() - started)
+        return True
+
+    async def loading_done(self, page, timeout: Optional[int] = None) -> bool:
+        return await self.until("loading", page, LOADING_DONE_JS, LOADING_MASK_SELECTOR, timeout)
+
+    async def grid_signature(self, page, rows_selector: str) -> Tuple[int, str]:
+        count, first = await page.evaluate(GRID_SIGNATURE_JS, rows_selector)
+        return count, first
+
+    async def grid_changed(self, page, rows_selector: str, signature: Tuple[int, str], name: str = "grid",
+                           penalize: bool = True) -> bool:
+        return await self.until(name, page, GRID_CHANGED_JS, [rows_selector, LOADING_MASK_SELECTOR, *signature],
+                                penalize=penalize)
+
+    async def text_contains(self, name: str, page, selector: str, text: str, timeout: Optional[int] = None) -> bool:
+        return await self.until(name, page, TEXT_CONTAINS_JS, [selector, text], timeout)
+
+    async def selected_page(self, page, selector: str, page_no: int) -> bool:
+        return await self.until("page_label", page, SELECTED_PAGE_JS, [selector, page_no])
+
+    async def row_cell_text(self, page, rows_selector: str, index: int, column: int, text: str,
+                            timeout: Optional[int] = None) -> bool:
+        return await self.until("row_match", page, ROW_CELL_TEXT_JS, [rows_selector, index, column, text], timeout)
+
+    async def input_value(self, locator, value: str) -> bool:
+        handle = await locator.element_handle()
+        return await self.until("input", locator.page, INPUT_VALUE_JS, [handle, value], timeout=2000)
+
+    async def pace(self, name: str):
+        delay = self.pacing_for(name)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def throttle(self):
+        delay = self.rate.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def watch(self, context):
+        async def on_dialog(dialog):
+            if self._is_error_dialog(dialog.message):
+                self.rate.on_failure("dialog")
+            await dialog.dismiss()
+
+        context.on("response", self._on_response)
+        context.on("dialog", on_dialog)
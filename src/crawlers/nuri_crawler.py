@@ -1,55 +1,125 @@
 import time
-import json
-import os
-from typing import List, Tuple
+from typing import List, Tuple, Dict, Any, Optional, Iterator
 from src.core.base_crawler import BaseCrawler
 from src.models.bid_notice import BidNotice
-from src.crawlers.components.nuri_navigator import NuriNavigator
+from src.crawlers.components.nuri_navigator import NuriNavigator, GRID_ROWS_SELECTOR, PageMoveFailed
 from src.crawlers.components.nuri_parser import NuriParser
+from src.crawlers.components.detail_worker_pool import DetailWorkerPool
+from src.crawlers.components.bid_factory import BidFactory
+from src.crawlers.components.result_spool import create_state_store
+from src.crawlers.components.detail_replay import DetailRequestRecorder, DetailReplayClient
+from src.crawlers.components.wait_engine import WaitEngine
+from src.crawlers.components.known_index import KnownNoticeIndex
+from src.crawlers.components.retry_queue import RowRetryQueue, RetryEntry
+from src.crawlers.components.attachment_downloader import AttachmentDownloader
+from src.crawlers.components.snapshot_store import DetailSnapshotStore
+from src.crawlers.components.nuri_detail_extractor import DETAIL_CONTAINER_SELECTOR
 
 class NuriCrawler(BaseCrawler):
     """누리장터(Nuri Market) 크롤러 구현체"""
     def __init__(self, config):
         super().__init__(config)
         self.nav = None
+        self.pool = None
+        self.recorder = None
+        self.replay = None
+        self.known: Optional[KnownNoticeIndex] = None
         self.parser = NuriParser(self.logger)
-        self.state_file = "crawling_state.json"
+        self.waits = WaitEngine(config['system'].get('waits', {}), self.logger)
+        pw_config = config['system'].get('playwright', {})
+        self.retries = RowRetryQueue(pw_config.get('max_retries', 3), pw_config.get('retry_backoff', 1.0),
+                                     pw_config.get('retry_backoff_max', 30.0), self.logger)
+        attachments = config['system']['crawler'].get('attachments', {})
+        self.downloader = AttachmentDownloader(attachments, self.logger, self.waits.rate) if attachments.get('enabled') else None
+        # 상세 HTML 스냅샷 (FIELD_CONFIG가 바뀌면 --reparse 로 재수집 없이 다시 파싱)
+        snapshots = config['system']['crawler'].get('snapshots', {})
+        if snapshots.get('enabled'):
+            self.parser.enable_snapshots(DetailSnapshotStore.from_config(snapshots, self.logger),
+                                         snapshots.get('container', DETAIL_CONTAINER_SELECTOR))
+        self.state_file = config['system']['crawler'].get('state_file', "crawling_state.json")
+        # spool.enabled면 체크포인트와 수집 결과를 로컬 스풀에 함께 기록
+        self.state = create_state_store(self.state_file, config['system']['crawler'].get('spool'), self.logger)
+
+    def set_known_index(self, known: Dict[Tuple[str, str], Optional[str]]):
+        """저장된 공고 인덱스 설정 (목록 지문이 같은 행은 상세 수집을 건너뜀)"""
+        self.known = KnownNoticeIndex(known)
+        self.logger.info(f"Incremental mode: {len(self.known)} known notices.")
 
     def _navigate_to_target(self):
         """누리장터 접속 및 검색 조건 설정"""
-        self.nav = NuriNavigator(self.ctx, self.logger)
+        self.nav = NuriNavigator(self.ctx, self.logger, self.waits)
+        # 429/5xx 응답과 오류 대화상자는 요청 속도 감소 신호
+        self.waits.watch(self.context)
         base_url = self.config['system']['crawler']['base_url']
         
         # 접속 및 초기화
         self.nav.go_to_main(base_url)
         self.nav.go_to_bid_list()
         
+        # 그리드 XHR 가로채기 (검색 전에 활성화해야 첫 응답부터 수집)
+        grid_capture = self.config['system']['crawler'].get('grid_capture', {})
+        if grid_capture.get('enabled'):
+            self.nav.enable_grid_capture(grid_capture)
+
+        # 상세 요청 기록 (첫 상세 진입 이후 HTTP 재생 모드로 전환)
+        replay_config = self.config['system']['crawler'].get('detail_replay', {})
+        if replay_config.get('enabled') and not DetailReplayClient.maps_attachments(replay_config):
+            # 첨부파일 없이 저장하면 저장된 첨부파일 행이 지워지므로 재생하지 않음
+            self.logger.warning("Detail replay needs attachments_key/attachment_name. Using browser collection.")
+        elif replay_config.get('enabled'):
+            self.recorder = DetailRequestRecorder(replay_config.get('url_pattern', ''), self.logger)
+            self.recorder.attach(self.context)
+
         # 검색 조건 적용
         self.nav.set_search_conditions(self.config.get('search', {}))
+
+        # 상세 작업 탭 풀 (2개 이상일 때만 사용)
+        workers = self.config['system']['crawler'].get('detail_workers', 1)
+        if workers > 1:
+            self.pool = DetailWorkerPool(self.ctx, workers, self.config, self.parser, self.logger, self.waits)
+            self.pool.start()
     
-    def _restore_search_state(self, target_page: int):
-        """직전 검색 상태를 복원"""
+    def _restore_search_state(self, target_page: int) -> bool:
+        """
+        직전 검색 상태를 복원 (목표 페이지에 도착하면 True)
+        - 목록 화면이 아니면 검색을 다시 적용한 뒤, 목표 페이지로 바로 이동합니다. (페이지 깊이와 무관)
+        """
         self.logger.warning(f"State lost or starting. Restoring to page {target_page}...")
-        
-        # 목표 페이지까지 이동
-        current = 1
-        while current < target_page:
-            if not self.nav.move_to_next_page(current):
-                self.logger.error("Failed to restore page position.")
-                break
-            current += 1
-            # 차단 방지용 미세 딜레이
-            time.sleep(0.01)
-        
-        self.logger.info(f"Restored position to page {current}.")
-        time.sleep(1.0)
+
+        if not self.nav.is_on_list():
+            self.nav.go_to_bid_list()
+            self.nav.set_search_conditions(self.config.get('search', {}))
+
+        if not self.nav.jump_to_page(target_page):
+            self.logger.error("Failed to restore page position.")
+            return False
+
+        self.logger.info(f"Restored position to page {target_page}.")
+        return True
+
+    def _move_to_next_page(self, current_page: int) -> bool:
+        """
+        다음 페이지 이동 (False: 마지막 페이지)
+        - 이동을 확인하지 못하면 목표 페이지로 다시 이동하며, max_retries번 모두 실패하면 예외를 던집니다.
+          (시간 초과를 마지막 페이지로 보고 수집을 끝내거나 체크포인트를 지우지 않도록)
+        """
+        try:
+            return self.nav.move_to_next_page(current_page)
+        except PageMoveFailed as e:
+            self.logger.warning(f"Page move not confirmed: {e}")
+
+        next_page = current_page + 1
+        attempts = max(1, self.config['system'].get('playwright', {}).get('max_retries', 3))
+        for _ in range(attempts):
+            if self._restore_search_state(next_page) and self.waits.loading_done(self.page):
+                return True
+        raise RuntimeError(f"cannot move to page {next_page} after {attempts} attempts")
     
-    def _extract_data(self) -> List[BidNotice]:
-        """전체 페이지 데이터 추출"""
-        all_results = []
-        
-        # 체크포인트 로드
+    def _extract_data(self) -> Iterator[BidNotice]:
+        """전체 페이지 데이터 추출 (페이지 단위로 yield)"""
+        # 체크포인트와 재시도 대기 행 로드
         start_page, start_index = self._load_checkpoint()
+        self.retries.restore(self.state.load_retries())
 
         # 시작 페이지가 1보다 크면 복구 실행
         if start_page > 1:
@@ -62,12 +132,13 @@ class NuriCrawler(BaseCrawler):
         while True:
             self.logger.info(f"=== Processing Page {current_page} (Start Index: {current_index_start}) ===")
             
-            # 페이지 처리
+            # 페이지 처리 (첨부파일은 페이지 단위로 동시에 다운로드)
             results = self._process_page_items(current_page, current_index_start)
-            all_results.extend(results)
+            self._download_attachments(results)
+            yield from results
 
-            # 다음 페이지 이동
-            if not self.nav.move_to_next_page(current_page):
+            # 다음 페이지 이동 (이동 실패는 예외로 끝나며 체크포인트는 유지)
+            if not self._move_to_next_page(current_page):
                 self.logger.info("End of pages.")
                 break
             
@@ -75,103 +146,342 @@ class NuriCrawler(BaseCrawler):
             current_index_start = 0 
             
             self._save_checkpoint(current_page, 0)
-            time.sleep(2.0)
+            self.waits.pace("page_change")
 
-        if os.path.exists(self.state_file):
-            try:
-                os.remove(self.state_file)
-                self.logger.info("Crawling finished successfully. State file deleted.")
-            except Exception as e:
-                self.logger.warning(f"Failed to delete state file: {e}")
-        
-        return all_results
+        # 실패한 행 마지막 재시도
+        retried = list(self._retry_remaining())
+        self._download_attachments(retried)
+        yield from retried
+        s = self.retries.summary()
+        if s['recovered'] or s['gave_up']:
+            self.logger.info(f"Retry summary: recovered {s['recovered']} rows, gave up {s['gave_up']}.")
+
+        self.state.clear()
+
+        if self.known:
+            s = self.known.summary()
+            self.logger.info(f"Incremental summary: skipped {s['skipped']} unchanged rows, "
+                             f"fetched {s['fetched']} (changed {s['changed']}, new {s['new']}).")
     
     def _process_page_items(self, expected_page: int, start_index: int) -> List[BidNotice]:
-        """한 페이지의 아이템들을 처리"""
+        """한 페이지의 아이템들을 처리 (실패한 행은 재시도 대기열로)"""
+        if self.replay:
+            return self._process_page_items_replay(expected_page, start_index)
+        if self.pool:
+            return self._process_page_items_pooled(expected_page, start_index)
+
         results = []
-        grid_selector = "table[id*='grdBidPbancList_body_table']"
 
         try:
-            # 그리드 로딩
-            self.page.locator(f"{grid_selector} tbody tr").first.wait_for(state="visible", timeout=15000)
-            rows = self.page.locator(f"{grid_selector} tbody tr")
-            count = rows.count()
+            # 그리드 로딩 및 스냅샷 (행 데이터는 메모리에서 처리)
+            grid = self._read_grid()
+            count = len(grid)
             self.logger.info(f"Found {count} rows. Starting from index {start_index}.")
 
             for i in range(start_index, count):
-                try:
-                    # DOM 재조회
-                    self.page.locator(f"{grid_selector} tbody tr").first.wait_for(state="visible", timeout=15000)
-                    current_rows = self.page.locator(f"{grid_selector} tbody tr")
-                    
-                    if i >= current_rows.count():
-                        break
-
-                    row = current_rows.nth(i)
-                    if not row.is_visible(): continue
-
-                    row_data = self.parser.parse_list_row(row)
-                    
-                    notice_code_full = row_data['notice_code']
-                    title = row_data['title']
-                    link = row_data['link']
-                    if not link: continue
-                    
-                    self.logger.info(f"Processing [{i+1}/{count}]: {title}")
-
-                    # 상세 진입
-                    if not self.nav.enter_detail_page(link):
-                        continue
+                row_data = grid[i]
+                if not row_data: continue
 
-                    # 파싱
-                    basic_data = {
-                        'title': title, 
-                        'notice_code_full': notice_code_full,
-                        'date_posted': row_data['date_posted'],
-                        'category': row_data['category'],     
-                        'process_type': row_data['process_type']
-                    }
-
-                    bid = self.parser.parse_detail(self.page, basic_data)
-                    if bid:
-                        if "-" in notice_code_full:
-                            code, degree = notice_code_full.split("-", 1)
-                        else:
-                            code, degree = notice_code_full, "00"
-                        bid.notice_code = code
-                        bid.degree = degree
-                        results.append(bid)
-                    
-                    # 목록 복귀
-                    self.nav.go_back_to_list()
-                    
-                    # 성공 시 다음 인덱스 저장
+                list_data = self.parser.to_basic_data(row_data)
+
+                # 저장된 공고와 목록 필드가 같으면 상세 진입 생략
+                if not self._should_fetch(list_data):
                     self._save_checkpoint(expected_page, i + 1)
+                    continue
+
+                self.logger.info(f"Processing [{i+1}/{count}]: {row_data['title']}")
 
+                error = "empty result"
+                try:
+                    bid = self._fetch_row(row_data['link'], list_data)
                 except Exception as e:
                     self.logger.error(f"Row error: {e}")
-                    self._restore_search_state(expected_page)
+                    bid, error = None, str(e)
+                    # 목록 화면을 잃은 경우에만 검색 상태 복원
+                    self._recover_list(expected_page)
+
+                if bid:
+                    results.append(bid)
+                else:
+                    self.retries.push(expected_page, i, list_data, error)
+
+                # 다음 인덱스와 결과 저장 (실패한 행은 재시도 대기열에서 처리)
+                self._save_checkpoint(expected_page, i + 1, [bid] if bid else [])
+
+                # 상세 요청이 기록되면 남은 행은 HTTP 재생으로 처리
+                if bid and self._start_replay(list_data, bid):
+                    results.extend(self._process_page_items_replay(expected_page, i + 1))
+                    return results
+
+        except Exception as e:
+            self.logger.error(f"Page processing error: {e}")
+            return results
+
+        results.extend(self._retry_due(expected_page))
+        return results
+
+    def _fetch_row(self, link, list_data: Dict[str, Any]) -> Optional[BidNotice]:
+        """목록 탭에서 상세 진입 -> 파싱 -> 목록 복귀"""
+        if not self.nav.enter_detail_page(link):
+            raise RuntimeError("detail page not loaded")
+
+        bid = self.parser.parse_detail(self.page, list_data)
+        if bid and self.downloader:
+            self.downloader.capture_urls(self.page, bid)
+        self.nav.go_back_to_list()
+        if bid:
+            self._assign_notice_key(bid, list_data)
+        return bid
+
+    def _download_attachments(self, results: List[BidNotice]):
+        """첨부파일 다운로드 (브라우저 세션 쿠키 사용)"""
+        if self.downloader and results:
+            self.downloader.download_all(results, self.context.cookies())
+            # 스풀에는 다운로드 전에 기록되었으므로 채워진 첨부파일 정보를 다시 기록
+            self.state.refresh(results)
+
+    def _recover_list(self, expected_page: int):
+        """행 실패 후 목록 복귀 (뒤로 가기로 돌아오지 못할 때만 전체 복원)"""
+        if not self.nav.is_on_list():
+            try:
+                self.nav.go_back_to_list()
+            except Exception as e:
+                self.logger.warning(f"Back to list failed: {e}")
+
+        if not self.nav.is_on_list():
+            self._restore_search_state(expected_page)
+        elif self.nav.current_page() != expected_page:
+            self.nav.jump_to_page(expected_page)
+
+    def _retry_due(self, expected_page: int) -> List[BidNotice]:
+        """현재 페이지에서 기한이 된 재시도 행 처리"""
+        entries = self.retries.due(expected_page)
+        return self._retry_entries(expected_page, entries) if entries else []
+
+    def _retry_remaining(self) -> Iterator[BidNotice]:
+        """실행 마지막 재시도 (남은 행이 없거나 모두 포기할 때까지 페이지별로 처리)"""
+        while len(self.retries):
+            for page_no in self.retries.pages():
+                entries = self.retries.entries(page_no)
+                delay = self.retries.wait_time(entries)
+                if delay > 0:
+                    time.sleep(delay)
+                self.logger.info(f"Retrying {len(entries)} rows on page {page_no}.")
+                yield from self._retry_entries(page_no, entries)
+
+    def _retry_entries(self, list_page: int, entries: List[RetryEntry]) -> List[BidNotice]:
+        """재시도 실행 (현재 수집 방식 사용: HTTP 재생 / 작업 탭 풀 / 목록 탭)"""
+        tasks = [(e.index, e.list_data) for e in entries]
+        if self.replay:
+            self.replay.set_cookies(self.context.cookies())
+            fetched = [(index, self.parser.build_notice(raw) if raw else None)
+                       for index, raw in self.replay.fetch_many(tasks)]
+        elif self.pool:
+            fetched = self.pool.process(list_page, tasks)
+        else:
+            fetched = self._refetch_rows(list_page, entries)
+
+        results = []
+        for entry, (_, bid) in zip(entries, fetched):
+            if not bid:
+                self.retries.push(list_page, entry.index, entry.list_data, entry.error)
+                continue
+            self._assign_notice_key(bid, entry.list_data)
+            self.retries.resolve(entry.key)
+            # 체크포인트 위치는 유지하고 결과만 기록
+            self._save_checkpoint(*self._load_checkpoint(), [bid])
+            results.append(bid)
+        return results
+
+    def _refetch_rows(self, list_page: int, entries: List[RetryEntry]) -> List[Tuple[int, Optional[BidNotice]]]:
+        """목록 탭에서 공고번호로 행을 다시 찾아 상세 수집"""
+        self._recover_list(list_page)
+        rows = {row['notice_code']: row for row in self._read_grid() if row}
+
+        fetched = []
+        for entry in entries:
+            row = rows.get(entry.key)
+            if row is None:
+                self.logger.warning(f"Row {entry.key} is no longer on page {list_page}.")
+                fetched.append((entry.index, None))
+                continue
+            try:
+                fetched.append((entry.index, self._fetch_row(row['link'], entry.list_data)))
+            except Exception as e:
+                self.logger.error(f"Retry error: {e}")
+                entry.error = str(e)
+                self._recover_list(list_page)
+                fetched.append((entry.index, None))
+        return fetched
+
+    def _process_page_items_pooled(self, expected_page: int, start_index: int) -> List[BidNotice]:
+        """작업 탭 풀로 한 페이지의 아이템들을 처리 (목록 탭은 이동하지 않음)"""
+        results = []
+
+        try:
+            tasks = self._collect_tasks(start_index)
+            self.logger.info(f"Dispatching {len(tasks)} rows from index {start_index} to {self.pool.size} workers.")
+
+            # 워커 수 단위로 나누어 처리하고, 묶음이 끝날 때마다 체크포인트 저장
+            for batch_start in range(0, len(tasks), self.pool.size):
+                batch = tasks[batch_start:batch_start + self.pool.size]
+                list_data = dict(batch)
+                collected = []
+                for index, bid in self.pool.process(expected_page, batch):
+                    if not bid:
+                        self.retries.push(expected_page, index, list_data[index], "worker failed")
+                        continue
+                    self._assign_notice_key(bid, list_data[index])
+                    collected.append(bid)
+                self._save_checkpoint(expected_page, batch[-1][0] + 1, collected)
+                results.extend(collected)
+
+        except Exception as e:
+            self.logger.error(f"Page processing error: {e}")
+            return results
+
+        results.extend(self._retry_due(expected_page))
+        return results
+
+    def _process_page_items_replay(self, expected_page: int, start_index: int) -> List[BidNotice]:
+        """기록된 상세 요청을 HTTP로 재생하여 한 페이지의 아이템들을 처리 (브라우저는 목록만 유지)"""
+        results = []
+
+        try:
+            tasks = self._collect_tasks(start_index)
+            self.logger.info(f"Replaying {len(tasks)} detail requests from index {start_index}.")
+
+            # 세션 쿠키 갱신 (Playwright 호출은 메인 스레드에서만)
+            self.replay.set_cookies(self.context.cookies())
+
+            list_data = dict(tasks)
+            for index, raw_data in self.replay.fetch_many(tasks):
+                bid = self.parser.build_notice(raw_data) if raw_data else None
+                if not bid:
+                    self.retries.push(expected_page, index, list_data[index], "replay failed")
                     continue
+                self._assign_notice_key(bid, list_data[index])
+                results.append(bid)
+
+            if tasks:
+                self._save_checkpoint(expected_page, tasks[-1][0] + 1, results)
 
         except Exception as e:
             self.logger.error(f"Page processing error: {e}")
-            return []
+            return results
 
+        results.extend(self._retry_due(expected_page))
         return results
 
+    def _start_replay(self, list_data: Dict[str, Any], bid: BidNotice) -> bool:
+        """기록된 상세 요청을 같은 공고로 재생해 브라우저 결과와 같을 때만 재생 클라이언트로 전환"""
+        if not self.recorder or self.replay:
+            return False
+        endpoint = self.recorder.record(list_data['notice_code_full'])
+        if not endpoint:
+            return False
+        # 전환 여부는 첫 기록으로 한 번만 판단 (실패하면 브라우저 수집 유지)
+        self.recorder = None
+
+        replay_config = self.config['system']['crawler'].get('detail_replay', {})
+        client = DetailReplayClient(endpoint, replay_config, self.logger, self.waits.rate)
+        client.set_cookies(self.context.cookies())
+        try:
+            replayed = self.parser.build_notice(client.fetch(list_data))
+        except Exception as e:
+            self.logger.warning(f"Detail replay check failed: {e}")
+            replayed = None
+        mismatch = self._replay_mismatch(bid, replayed)
+        if mismatch:
+            self.logger.warning(f"Detail replay result differs from browser ({mismatch}), keeping browser collection.")
+            client.close()
+            return False
+
+        self.replay = client
+        self.logger.info("Switched detail collection to HTTP replay mode.")
+        return True
+
+    @staticmethod
+    def _replay_mismatch(bid: BidNotice, replayed: Optional[BidNotice]) -> str:
+        """재생 결과와 브라우저 결과에서 다른 필드 이름 (첨부파일명, 양쪽 모두 값이 있는 상세 필드 비교, 같으면 빈 문자열)"""
+        if replayed is None:
+            return "no result"
+        if replayed.title != bid.title:
+            return "title"
+        if [a.file_name for a in replayed.attachments] != [a.file_name for a in bid.attachments]:
+            return "attachments"
+        expected, actual = bid.detail_info.model_dump(), replayed.detail_info.model_dump()
+        for key, value in expected.items():
+            if value is not None and actual.get(key) is not None and actual[key] != value:
+                return key
+        return ""
+
+    def _collect_tasks(self, start_index: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """현재 목록 화면에서 (인덱스, 기본 정보) 목록 수집 (목록 탭은 이동하지 않음, 변경 없는 저장 공고 제외)"""
+        grid = self._read_grid()
+        self.logger.info(f"Found {len(grid)} rows. Starting from index {start_index}.")
+        tasks = [(i, self.parser.to_basic_data(row_data))
+                 for i, row_data in enumerate(grid) if i >= start_index and row_data]
+        return [(i, list_data) for i, list_data in tasks if self._should_fetch(list_data)]
+
+    def _teardown_browser(self):
+        if self.replay:
+            self.replay.close()
+        if self.downloader:
+            self.downloader.log_summary()
+        if self.parser.snapshots:
+            self.parser.snapshots.log_summary()
+            self.parser.snapshots.close()
+        self.waits.log_summary()
+        super()._teardown_browser()
+
+    def _read_grid(self) -> List[Optional[Dict[str, Any]]]:
+        """
+        현재 목록 화면의 행 데이터 (행 인덱스 순)
+        - evaluate 1회로 그리드 전체를 스냅샷하며, 가로챈 XHR 데이터가 화면과 일치하면 우선 사용합니다.
+        - 보이지 않거나 상세 링크가 없는 행은 None
+        - link는 인덱스 기반 Locator이므로 목록 복귀 후 다시 렌더링되어도 유효합니다.
+        """
+        self.page.locator(GRID_ROWS_SELECTOR).first.wait_for(state="visible", timeout=15000)
+        snapshot = self.parser.snapshot_grid(self.page, GRID_ROWS_SELECTOR)
+        captured = self._take_captured_rows(snapshot)
+
+        grid = []
+        for i, snap in enumerate(snapshot):
+            if not snap['visible'] or not snap['has_link']:
+                grid.append(None)
+                continue
+            row_data = dict(captured[i]) if captured else self.parser.parse_snapshot_row(snap)
+            row_data['link'] = NuriParser.row_link(self.nav.get_row(i))
+            grid.append(row_data)
+        return grid
+
+    def _take_captured_rows(self, snapshot: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """가로챈 그리드 데이터가 현재 화면과 일치할 때만 사용 (첫 행 공고번호로 확인)"""
+        captured = self.nav.take_captured_rows(len(snapshot))
+        if not captured:
+            return None
+        first_code = self.parser.parse_snapshot_row(snapshot[0])['notice_code']
+        if captured[0]['notice_code'] != first_code:
+            self.logger.warning(f"Captured grid is stale ({captured[0]['notice_code']} != {first_code}). Falling back to DOM.")
+            return None
+        return captured
+
+    def _assign_notice_key(self, bid: BidNotice, list_data: Dict[str, Any]):
+        """'공고번호-차수' 문자열을 분리하여 주입하고 목록 지문 기록"""
+        bid.notice_code, bid.degree = BidFactory.split_notice_code(list_data['notice_code_full'])
+        bid.list_fingerprint = KnownNoticeIndex.fingerprint(list_data)
+        if self.known is not None:
+            self.known.remember(list_data)
+
+    def _should_fetch(self, list_data: Dict[str, Any]) -> bool:
+        """상세 수집 대상 여부 (증분 모드가 아니면 항상 True)"""
+        return self.known is None or self.known.should_fetch(list_data)
+
     def _load_checkpoint(self) -> Tuple[int, int]:
         """(페이지, 인덱스) 반환"""
-        if os.path.exists(self.state_file):
-            try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('page', 1), data.get('index', 0)
-            except: pass
-        return 1, 0
-
-    def _save_checkpoint(self, page: int, index: int):
-        """페이지와 인덱스 저장"""
-        try:
-            with open(self.state_file, 'w') as f:
-                json.dump({'page': page, 'index': index}, f)
-        except: pass
\ No newline at end of file
+        return self.state.load()
+
+    def _save_checkpoint(self, page: int, index: int, notices: List[BidNotice] = ()):
+        """페이지와 인덱스 저장 (스풀 사용 시 그때까지 수집한 공고도 함께 기록, 바뀐 재시도 대기열도 기록)"""
+        self.state.save(page, index, notices, retries=self.retries.take_changes())
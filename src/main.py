@@ -7,6 +7,13 @@ sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
 from src.utils.cli import parse_args
 from src.utils.config_loader import load_app_config
 from src.core.container import AppContainer
+from src.core.shard_runner import ShardRunner
+from src.core.ledger_worker import LedgerWorker
+from src.core.snapshot_reparser import SnapshotReparser
+from src.core.storage_sink import StorageSink
+from src.core.storage_writer import BackgroundStorageWriter
+from src.crawlers.components.result_spool import ResultSpool
+from src.utils.metrics import METRICS
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,22 +29,83 @@ def run_application():
     except Exception:
         sys.exit(1)
 
+    # 구간별 계측 (종료 시 Prometheus 텍스트 파일 / JSON 요약으로 내보내기)
+    metrics_config = config['system'].get('metrics', {})
+    METRICS.enabled = metrics_config.get('enabled', True)
+    METRICS.reset()
+    result = {'status': 'failed', 'saved': 0}
+
     container = AppContainer(config)
     storage = container.create_storage()
-    crawler = container.create_crawler()
+    # 재파싱/구간 분할 실행에서는 만들지 않음 (크롤러 생성 시 스풀 DB 등을 엶)
+    crawler = None
 
     try:
         logger.info(">>> Starting Nuri Bid Collector <<<")
         
         storage.connect()
         
+        # 저장된 상세 스냅샷 재파싱 (브라우저 없이)
+        if args.reparse:
+            saved = SnapshotReparser(config).run(storage)
+            result.update(status='done', saved=saved)
+            logger.info(f">>> Re-parse Finished. Saved {saved} records <<<")
+            return
+
         if checkpoint := storage.get_last_checkpoint():
             logger.info(f"Resuming from checkpoint: {checkpoint}")
 
-        results = crawler.run()
+        # 증분 수집: 저장된 공고 중 목록 필드가 같은 행은 상세 수집 생략
+        known = storage.load_known_index() if config['system']['crawler'].get('skip_known') else None
+
+        # 구간 분할 실행 (구간별 프로세스, 구간이 끝날 때마다 저장, 구간 계측은 이 프로세스에 합산)
+        if container.is_sharded():
+            if container.is_distributed():
+                # DB 작업 원장에서 구간을 임대 (여러 컨테이너/노드가 같은 범위를 나누어 수집)
+                saved = LedgerWorker(config, container.create_task_ledger(storage)).run(storage, known)
+            else:
+                saved = ShardRunner(config).run(storage, known, only=args.shard)
+            METRICS.inc("notices_collected", saved)
+            result.update(status='done', saved=saved)
+            logger.info(f">>> Sharded Job Finished. Saved {saved} records <<<")
+            return
+
+        crawler = container.create_crawler()
+        if known is not None:
+            crawler.set_known_index(known)
+
+        # 로컬 스풀: 저장이 확인된 공고만 스풀에서 제거
+        spool = crawler.state if isinstance(crawler.state, ResultSpool) else None
+        on_saved = spool.mark_flushed if spool else None
+
+        # 수집되는 대로 배치 저장 (중간에 실패해도 저장된 데이터는 유지)
+        storage_config = config['system'].get('storage', {})
+        if storage_config.get('background'):
+            # 저장은 작업 스레드에서 진행하고, 크롤러 teardown에서 남은 항목까지 저장
+            sink = BackgroundStorageWriter(storage, storage_config, on_saved=on_saved)
+            crawler.add_teardown_hook(sink.close)
+        else:
+            sink = StorageSink(storage, storage_config, on_saved=on_saved)
+        try:
+            # 이전 실행에서 저장 전에 중단된 공고는 다시 수집하지 않고 스풀에서 재생
+            if spool:
+                replayed = spool.pending()
+                if replayed:
+                    logger.info(f"Replaying {len(replayed)} spooled notices from the previous run.")
+                for bid in replayed:
+                    sink.add(bid)
+            for bid in crawler.run():
+                METRICS.inc("notices_collected")
+                sink.add(bid)
+        finally:
+            sink.close()
+
+        if spool:
+            spool.compact()
+            spool.close()
         
-        if results:
-            storage.save(results)
+        result.update(status='done', saved=sink.saved)
+        if sink.saved:
             logger.info(">>> Job Completed Successfully <<<")
         else:
             logger.warning("No data collected.")
@@ -47,6 +115,15 @@ def run_application():
         sys.exit(1)
     finally:
         storage.close()
+        if METRICS.enabled:
+            try:
+                # 속도 제어 상태는 이 프로세스에서 수집한 경우에만 (구간 프로세스별 상태는 각자 소멸)
+                if crawler is not None:
+                    result['rate_control'] = crawler.waits.rate.snapshot()
+                METRICS.export(metrics_config.get('prometheus_file', ''), metrics_config.get('summary_file', ''),
+                               extra=result)
+            except Exception as e:
+                logger.warning(f"Failed to export metrics: {e}")
         logger.info("Application shutdown.")
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ class BidAttachment(BaseModel):
     file_name: str = Field(..., description="파일명")
     file_size: Optional[str] = Field(None, description="파일크기 (예: 14.5KB)")
     download_url: Optional[str] = Field(None, description="다운로드 링크")
+    sha256: Optional[str] = Field(None, description="파일 내용 SHA-256 (첨부파일 저장소 경로 키)")
 
 # 상세 정보
 class BidDetail(BaseModel):
@@ -61,6 +62,10 @@ class BidNotice(BaseModel):
     bid_method: Optional[str] = None        # 입찰방식
     succ_method: Optional[str] = None       # 낙찰방법
 
+    # 수집 메타
+    list_fingerprint: Optional[str] = None  # 목록 필드 지문 (증분 수집 시 변경 여부 판단)
+    spool_seq: Optional[int] = Field(None, exclude=True, description="로컬 스풀 행 번호 (직렬화/저장 제외)")
+
     # 포함 관계
     detail_info: Optional[BidDetail] = None 
     attachments: List[BidAttachment] = []
@@ -0,0 +1,168 @@
+import logging
+from datetime import datetime
+from typing import List, Dict, Any, Tuple
+from sqlalchemy import select, delete, update, bindparam, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.dialects import mysql, sqlite
+
+from src.models.bid_notice import BidNotice
+from src.storage.entities import BidNoticeEntity, BidNoticeDetailEntity, BidAttachmentEntity
+from src.storage.mysql_mapper import MySqlBidMapper, ATTACHMENT_PROVENANCE
+from src.utils.metrics import timed
+
+NOTICE_TABLE = BidNoticeEntity.__table__
+DETAIL_TABLE = BidNoticeDetailEntity.__table__
+ATTACHMENT_TABLE = BidAttachmentEntity.__table__
+
+# 첨부파일 자연 키 외 갱신 대상 컬럼 (내용 해시에 포함되지 않는 다운로드 정보)
+ATTACHMENT_VALUE_COLUMNS = ATTACHMENT_PROVENANCE
+
+
+class BulkUpserter:
+    """
+    SQLAlchemy Core 기반 벌크 Upsert
+    - bid_notices / bid_notice_details: 다중 행 INSERT ... ON DUPLICATE KEY UPDATE
+      (SQLite는 ON CONFLICT DO UPDATE)
+    - bid_attachments: 공고 단위 집합 비교로 추가/변경/삭제 행만 반영 (전체 삭제 후 재삽입 없음)
+      유지되는 행의 file_size/download_url/sha256은 새 값이 None이면 덮어쓰지 않습니다.
+    - 저장된 content_hash와 같은 공고는 공고/상세/첨부 테이블에 쓰지 않으며, 바뀐 공고만 updated_at을 갱신합니다.
+      (해시에 포함되지 않는 목록 지문과 첨부파일 다운로드 정보는 달라진 경우에만 따로 갱신)
+    - chunk_size 건마다 별도 트랜잭션으로 커밋합니다.
+    """
+
+    def __init__(self, engine: Engine, mapper: MySqlBidMapper, chunk_size: int = 500, logger=None):
+        self.engine = engine
+        self.mapper = mapper
+        self.chunk_size = max(1, chunk_size)
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+    @timed("storage.upsert")
+    def upsert(self, data: List[BidNotice]) -> Dict[str, int]:
+        """
+        {'inserted', 'updated', 'unchanged'} 건수 반환
+        (같은 키가 여러 번 있으면 마지막 것만 저장)
+        """
+        unique = {(bid.notice_code, bid.degree): bid for bid in data}
+        items = list(unique.values())
+        stats = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+
+        for start in range(0, len(items), self.chunk_size):
+            chunk = items[start:start + self.chunk_size]
+            rows = [self.mapper.to_rows(bid) for bid in chunk]
+            with self.engine.begin() as conn:
+                changed = self.skip_unchanged(conn, rows, stats)
+                self._upsert_rows(conn, NOTICE_TABLE, [master for master, _, _ in changed])
+                self._upsert_rows(conn, DETAIL_TABLE, [detail for _, detail, _ in changed if detail])
+                self._reconcile_attachments(conn, {
+                    (master['notice_code'], master['degree']): attachments for master, _, attachments in changed
+                })
+        return stats
+
+    def skip_unchanged(self, conn, rows: List[Tuple], stats: Dict[str, int]) -> List[Tuple]:
+        """
+        신규/변경 행만 반환 (ORM merge 저장 경로에서도 사용)
+        - 변경 없는 행은 목록 지문과, 새 다운로드 정보가 있으면 첨부파일 값만 갱신합니다. (파일명 구성은 같으므로 값 갱신만)
+        """
+        changed, unchanged = self._changed_rows(conn, rows, stats)
+        with_provenance = [row for row in unchanged
+                           if any(a[c] is not None for a in row[2] for c in ATTACHMENT_VALUE_COLUMNS)]
+        self._reconcile_attachments(conn, {
+            (master['notice_code'], master['degree']): attachments for master, _, attachments in with_provenance
+        })
+        return changed
+
+    def _changed_rows(self, conn, rows: List[Tuple], stats: Dict[str, int]) -> Tuple[List[Tuple], List[Tuple]]:
+        """
+        저장된 content_hash와 비교하여 (신규/변경 행, 변경 없는 행) 반환
+        - 신규/변경 행은 updated_at을 설정하고, 변경 없는 행은 목록 지문만 갱신합니다.
+        """
+        key_columns = tuple_(NOTICE_TABLE.c.notice_code, NOTICE_TABLE.c.degree)
+        keys = [(master['notice_code'], master['degree']) for master, _, _ in rows]
+        query = (select(NOTICE_TABLE.c.notice_code, NOTICE_TABLE.c.degree, NOTICE_TABLE.c.content_hash,
+                        NOTICE_TABLE.c.list_fingerprint)
+                 .where(key_columns.in_(keys)))
+        stored = {(code, degree): (content_hash, fingerprint)
+                  for code, degree, content_hash, fingerprint in conn.execute(query)}
+
+        now = datetime.now()
+        changed, unchanged, fingerprints = [], [], []
+        for row in rows:
+            master = row[0]
+            key = (master['notice_code'], master['degree'])
+            if key not in stored:
+                stats['inserted'] += 1
+            elif stored[key][0] == master['content_hash']:
+                stats['unchanged'] += 1
+                fingerprint = master['list_fingerprint']
+                if fingerprint is not None and fingerprint != stored[key][1]:
+                    fingerprints.append({'_code': key[0], '_degree': key[1], 'list_fingerprint': fingerprint})
+                unchanged.append(row)
+                continue
+            else:
+                stats['updated'] += 1
+            master['updated_at'] = now
+            changed.append(row)
+
+        if fingerprints:
+            # 목록 지문이 남아 있지 않으면 증분 수집이 매번 상세를 다시 방문함
+            stmt = (update(NOTICE_TABLE)
+                    .where(NOTICE_TABLE.c.notice_code == bindparam('_code'),
+                           NOTICE_TABLE.c.degree == bindparam('_degree'))
+                    .values(list_fingerprint=bindparam('list_fingerprint')))
+            conn.execute(stmt, fingerprints)
+        return changed, unchanged
+
+    def _upsert_rows(self, conn, table, rows: List[Dict[str, Any]]):
+        if not rows:
+            return
+        keys = [c.name for c in table.primary_key.columns]
+        value_columns = [c for c in rows[0] if c not in keys]
+
+        if conn.dialect.name == "mysql":
+            stmt = mysql.insert(table)
+            stmt = stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in value_columns})
+        elif conn.dialect.name == "sqlite":
+            stmt = sqlite.insert(table)
+            stmt = stmt.on_conflict_do_update(index_elements=keys, set_={c: stmt.excluded[c] for c in value_columns})
+        else:
+            raise NotImplementedError(f"Bulk upsert is not supported for dialect: {conn.dialect.name}")
+
+        conn.execute(stmt, rows)
+
+    def _reconcile_attachments(self, conn, desired: Dict[Tuple[str, str], List[Dict[str, Any]]]):
+        """공고별 첨부파일을 파일명 기준으로 비교하여 필요한 행만 INSERT/UPDATE/DELETE"""
+        if not desired:
+            return
+        existing: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        key_columns = tuple_(ATTACHMENT_TABLE.c.notice_code, ATTACHMENT_TABLE.c.degree)
+        query = select(ATTACHMENT_TABLE).where(key_columns.in_(list(desired)))
+        for row in conn.execute(query).mappings():
+            existing[(row['notice_code'], row['degree'], row['file_name'])] = dict(row)
+
+        inserts, updates, keep_ids = [], [], set()
+        for attachments in desired.values():
+            for attach in attachments:
+                current = existing.get((attach['notice_code'], attach['degree'], attach['file_name']))
+                if current is None:
+                    inserts.append(attach)
+                    continue
+                if current['id'] in keep_ids:
+                    # 같은 공고에 같은 파일명이 여러 개면 추가 행으로 저장
+                    inserts.append(attach)
+                    continue
+                keep_ids.add(current['id'])
+                # 값이 없는(None) 컬럼은 저장된 값 유지 (HTML 재파싱처럼 다운로드 정보가 없는 경로가 출처를 지우지 않도록)
+                values = {c: current[c] if attach[c] is None else attach[c] for c in ATTACHMENT_VALUE_COLUMNS}
+                if any(current[c] != values[c] for c in ATTACHMENT_VALUE_COLUMNS):
+                    updates.append({'_id': current['id'], **values})
+
+        stale_ids = [row['id'] for row in existing.values() if row['id'] not in keep_ids]
+        if stale_ids:
+            conn.execute(delete(ATTACHMENT_TABLE).where(ATTACHMENT_TABLE.c.id.in_(stale_ids)))
+        if updates:
+            stmt = (update(ATTACHMENT_TABLE)
+                    .where(ATTACHMENT_TABLE.c.id == bindparam('_id'))
+                    .values({c: bindparam(c) for c in ATTACHMENT_VALUE_COLUMNS}))
+            conn.execute(stmt, updates)
+        if inserts:
+            conn.execute(ATTACHMENT_TABLE.insert(), inserts)
@@ -31,7 +31,10 @@ class BidNoticeEntity(Base):
     succ_method = Column(String(50))
 
     # 메타 데이터
+    list_fingerprint = Column(String(16))
+    content_hash = Column(String(32))
     collected_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime)
 
     # 관계 설정 (Cascade Delete)
     detail = relationship("BidNoticeDetailEntity", back_populates="notice", uselist=False, cascade="all, delete-orphan")
@@ -102,5 +105,27 @@ class BidAttachmentEntity(Base):
     file_name = Column(String(255), nullable=False)
     file_size = Column(String(50))
     download_url = Column(Text)
+    sha256 = Column(String(64), index=True)
 
-    notice = relationship("BidNoticeEntity", back_populates="attachments")
\ No newline at end of file
+    notice = relationship("BidNoticeEntity", back_populates="attachments")
+
+class CrawlTaskEntity(Base):
+    """[Ledger Table] 분산 수집 작업 단위 (공고게시일자 구간)"""
+    __tablename__ = 'crawl_tasks'
+    __table_args__ = {'comment': '크롤링 작업 원장'}
+
+    task_id = Column(String(64), primary_key=True)
+    # 같은 수집 범위(시작-종료:단위)의 작업 묶음
+    run_key = Column(String(64), nullable=False, index=True)
+    start_date = Column(String(8), nullable=False)
+    end_date = Column(String(8), nullable=False)
+
+    # pending / running / done / failed
+    status = Column(String(10), nullable=False, default='pending', index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    owner = Column(String(100))
+    lease_expires_at = Column(DateTime)
+
+    saved_count = Column(Integer, default=0)
+    error = Column(Text)
+    updated_at = Column(DateTime)
@@ -1,9 +1,38 @@
+import hashlib
+from typing import Dict, Any, List, Optional, Tuple
+from pydantic_core import to_json
 from src.models.bid_notice import BidNotice, BidDetail, BidAttachment
 from src.storage.entities import BidNoticeEntity, BidNoticeDetailEntity, BidAttachmentEntity
 
+# 내용 해시에서 제외하는 수집 메타 필드 (목록 지문, 첨부파일 다운로드 정보)
+# 다운로드 정보는 수집 경로(재파싱/HTTP 재생은 None)에 따라 달라지므로 공고 변경으로 보지 않음
+ATTACHMENT_PROVENANCE = ('file_size', 'download_url', 'sha256')
+HASH_EXCLUDE = {'list_fingerprint': True, 'attachments': {'__all__': set(ATTACHMENT_PROVENANCE)}}
+
+
+def _sorted(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: values[key] for key in sorted(values)}
+
+
 class MySqlBidMapper:
     """Pydantic DTO를 MySQL Entity로 변환하는 Mapper 클래스"""
 
+    @staticmethod
+    def content_hash(dto: BidNotice) -> str:
+        """
+        공고 내용 해시 (상세/첨부파일 포함, 32자리 hex)
+        - 같은 내용이면 항상 같은 값이 나오도록 키 정렬, 첨부파일은 파일명 순으로 정규화합니다.
+        - 첨부파일은 파일명만 포함합니다. (크기/URL/SHA-256은 HASH_EXCLUDE, 벌크 저장에서 따로 반영)
+        - 직렬화 결과는 json.dumps(ensure_ascii=False, sort_keys=True, separators=(",", ":"))와 같은 바이트입니다.
+          (pydantic_core.to_json은 키 순서를 유지하므로 각 단계 키를 정렬해서 넘김)
+        """
+        data = dto.model_dump(mode="json", exclude=HASH_EXCLUDE)
+        attachments = sorted(data['attachments'], key=lambda a: a['file_name'])
+        data['attachments'] = [_sorted(a) for a in attachments]
+        if data['detail_info'] is not None:
+            data['detail_info'] = _sorted(data['detail_info'])
+        return hashlib.blake2b(to_json(_sorted(data)), digest_size=16).hexdigest()
+
     def to_entity(self, dto: BidNotice) -> BidNoticeEntity:
         """DTO -> Master Entity 변환"""
         entity = self._create_master_entity(dto)
@@ -27,9 +56,24 @@ class MySqlBidMapper:
             
         return entity
     
+    def to_rows(self, dto: BidNotice) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """DTO -> (Master 행, Detail 행 또는 None, 첨부파일 행 목록) 컬럼 딕셔너리 (Core 벌크 저장용)"""
+        master = self._master_values(dto)
+        detail = None
+        if dto.detail_info:
+            detail = self._detail_values(dto.notice_code, dto.degree, dto.detail_info)
+        attachments = [
+            self._attachment_values(dto.notice_code, dto.degree, attach)
+            for attach in dto.attachments
+        ]
+        return master, detail, attachments
+
     def _create_master_entity(self, dto: BidNotice) -> BidNoticeEntity:
         """BidNotice DTO -> BidNoticeEntity (Master)"""
-        return BidNoticeEntity(
+        return BidNoticeEntity(**self._master_values(dto))
+
+    def _master_values(self, dto: BidNotice) -> Dict[str, Any]:
+        return dict(
             notice_code=dto.notice_code,
             degree=dto.degree,
             title=dto.title,
@@ -42,12 +86,17 @@ class MySqlBidMapper:
             opening_dt=dto.opening_dt,
             contract_method=dto.contract_method,
             bid_method=dto.bid_method,
-            succ_method=dto.succ_method
+            succ_method=dto.succ_method,
+            list_fingerprint=dto.list_fingerprint,
+            content_hash=self.content_hash(dto)
         )
 
     def _create_detail_entity(self, code: str, degree: str, detail: BidDetail) -> BidNoticeDetailEntity:
         """Detail DTO -> Detail Entity"""
-        return BidNoticeDetailEntity(
+        return BidNoticeDetailEntity(**self._detail_values(code, degree, detail))
+
+    def _detail_values(self, code: str, degree: str, detail: BidDetail) -> Dict[str, Any]:
+        return dict(
             notice_code=code,
             degree=degree,
             doc_number=detail.doc_number,
@@ -69,10 +118,14 @@ class MySqlBidMapper:
 
     def _create_attachment_entity(self, code: str, degree: str, attach: BidAttachment) -> BidAttachmentEntity:
         """Attachment DTO -> Attachment Entity"""
-        return BidAttachmentEntity(
+        return BidAttachmentEntity(**self._attachment_values(code, degree, attach))
+
+    def _attachment_values(self, code: str, degree: str, attach: BidAttachment) -> Dict[str, Any]:
+        return dict(
             notice_code=code,
             degree=degree,
             file_name=attach.file_name,
             file_size=attach.file_size,
-            download_url=attach.download_url
+            download_url=attach.download_url,
+            sha256=attach.sha256
         )
\ No newline at end of file
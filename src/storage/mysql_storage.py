@@ -1,22 +1,37 @@
 import os
 import logging
-from typing import List, Dict, Optional
-from sqlalchemy import create_engine, func
+from typing import List, Dict, Optional, Tuple
+from sqlalchemy import create_engine, func, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.core.base_storage import BaseStorage
 from src.models.bid_notice import BidNotice
-from src.storage.entities import Base, BidNoticeEntity
+from src.storage.entities import Base, BidNoticeEntity, BidAttachmentEntity
 from src.storage.mysql_mapper import MySqlBidMapper
+from src.storage.bulk_upsert import BulkUpserter
+from src.utils.metrics import timed, METRICS
+
+# create_all 이후 기존 테이블에 추가된 컬럼 (컬럼명 : DDL 타입)
+ADDED_NOTICE_COLUMNS = {
+    'list_fingerprint': 'VARCHAR(16)',
+    'content_hash': 'VARCHAR(32)',
+    'updated_at': 'DATETIME',
+}
+ADDED_ATTACHMENT_COLUMNS = {
+    'sha256': 'VARCHAR(64)',
+}
 
 class MySqlStorage(BaseStorage):
-    def __init__(self, db_url: str):
+    def __init__(self, db_url: str, bulk_upsert: bool = True, chunk_size: int = 500):
         self.db_url = db_url
         self.engine = None
         self.SessionLocal = None
         self.logger = logging.getLogger(self.__class__.__name__)
         self.mapper = MySqlBidMapper()
+        self.bulk_upsert = bulk_upsert
+        self.chunk_size = chunk_size
+        self.upserter: Optional[BulkUpserter] = None
 
     def connect(self):
         """DB 연결 및 테이블 생성"""
@@ -32,28 +47,47 @@ class MySqlStorage(BaseStorage):
                 echo=False
             )
             Base.metadata.create_all(bind=self.engine)
+            self._migrate()
             self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+            self.upserter = BulkUpserter(self.engine, self.mapper, self.chunk_size, self.logger)
             self.logger.info(f"Connected to DB successfully.")
         except SQLAlchemyError as e:
             self.logger.critical(f"Failed to connect to DB: {e}")
             raise e
 
+    @timed("storage.save")
     def save(self, data: List[BidNotice]):
         """
         데이터 저장 (Upsert 전략)
-        Pydantic 모델 -> ORM 엔티티 변환 후 Merge
+        - bulk_upsert: Core 다중 행 INSERT ... ON DUPLICATE KEY UPDATE (chunk_size 단위 커밋)
+        - 그 외: Pydantic 모델 -> ORM 엔티티 변환 후 Merge (한 트랜잭션)
+        - 두 경로 모두 content_hash가 같은 공고는 쓰지 않고, 바뀐 공고만 updated_at을 갱신합니다.
         """
         if not data:
             self.logger.info("No data to save.")
             return
 
+        if self.bulk_upsert:
+            try:
+                self._log_stats(self.upserter.upsert(data))
+                return
+            except SQLAlchemyError as e:
+                self.logger.error(f"Bulk upsert failed: {e}", exc_info=True)
+                raise e
+
         session: Session = self.SessionLocal()
         try:
-            for item in data:
-                entity = self.mapper.to_entity(item)
+            unique = {(item.notice_code, item.degree): item for item in data}
+            stats = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+            # 변경 판정과 지문/다운로드 정보 갱신도 세션 트랜잭션에서 실행
+            changed = self.upserter.skip_unchanged(
+                session.connection(), [self.mapper.to_rows(item) for item in unique.values()], stats)
+            for master, _, _ in changed:
+                entity = self.mapper.to_entity(unique[(master['notice_code'], master['degree'])])
+                entity.updated_at = master['updated_at']
                 session.merge(entity)
             session.commit()
-            self.logger.info(f"Successfully saved/updated {len(data)} records.")
+            self._log_stats(stats)
 
         except SQLAlchemyError as e:
             session.rollback()
@@ -62,6 +96,49 @@ class MySqlStorage(BaseStorage):
         finally:
             session.close()
 
+    def _log_stats(self, stats: Dict[str, int]):
+        for key, value in stats.items():
+            METRICS.inc(f"storage.{key}", value)
+        self.logger.info(f"Batch saved: inserted {stats['inserted']}, updated {stats['updated']}, "
+                         f"unchanged {stats['unchanged']} (skipped).")
+
+    def _migrate(self):
+        """기존 테이블에 추가된 컬럼과 그 컬럼의 인덱스 반영 (create_all은 기존 테이블을 변경하지 않음)"""
+        for entity, added in ((BidNoticeEntity, ADDED_NOTICE_COLUMNS), (BidAttachmentEntity, ADDED_ATTACHMENT_COLUMNS)):
+            table = entity.__tablename__
+            inspector = inspect(self.engine)
+            columns = {c['name'] for c in inspector.get_columns(table)}
+            for name, ddl_type in added.items():
+                if name in columns:
+                    continue
+                with self.engine.begin() as conn:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl_type}"))
+                self.logger.info(f"Added column {table}.{name}.")
+
+            # 엔티티에 선언된 인덱스 중 추가 컬럼에 대한 것 (이전에 컬럼만 추가된 DB 포함)
+            indexes = {i['name'] for i in inspector.get_indexes(table)}
+            for index in entity.__table__.indexes:
+                if index.name not in indexes and any(c.name in added for c in index.columns):
+                    index.create(bind=self.engine)
+                    self.logger.info(f"Added index {index.name}.")
+
+    @timed("storage.load_known_index")
+    def load_known_index(self) -> Dict[Tuple[str, str], Optional[str]]:
+        """저장된 공고의 (공고번호, 차수) -> 목록 지문 (키 컬럼만 조회)"""
+        session: Session = self.SessionLocal()
+        try:
+            rows = session.query(
+                BidNoticeEntity.notice_code, BidNoticeEntity.degree, BidNoticeEntity.list_fingerprint
+            ).yield_per(10000)
+            index = {(code, degree): fingerprint for code, degree, fingerprint in rows}
+            self.logger.info(f"Loaded {len(index)} known notices.")
+            return index
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to load known index: {e}")
+            return {}
+        finally:
+            session.close()
+
     def get_last_checkpoint(self) -> Optional[Dict]:
         """가장 최근에 수집된 공고의 날짜 조회"""
         session: Session = self.SessionLocal()
@@ -0,0 +1,105 @@
+import logging
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Any, Callable
+from sqlalchemy import select, update, func, or_, and_
+from sqlalchemy.engine import Engine
+from sqlalchemy.dialects import mysql, sqlite
+
+from src.storage.entities import CrawlTaskEntity
+
+TASK_TABLE = CrawlTaskEntity.__table__
+
+
+class CrawlTaskLedger:
+    """
+    DB 기반 작업 원장 (여러 프로세스/노드가 구간을 나누어 수집)
+    - claim(): pending/failed 작업이나 임대가 만료된 running 작업을 하나 가져옵니다.
+      MySQL은 SELECT ... FOR UPDATE SKIP LOCKED로 다른 노드가 잡은 행을 건너뛰며,
+      상태/시도 횟수를 조건으로 UPDATE하므로 잠금이 없는 SQLite에서도 같은 작업을 두 번 가져가지 않습니다.
+    - 작업 중에는 renew()로 임대를 연장하고, 임대가 끝난 작업은 다른 노드가 다시 가져갑니다.
+    - 소유자가 일치할 때만 complete()/fail()이 반영됩니다.
+    - 임대 시각은 노드마다 다를 수 있는 로컬 시계 대신 DB 시각(NOW())을 기준으로 합니다.
+    """
+
+    def __init__(self, engine: Engine, lease_seconds: int = 300, max_attempts: int = 3, logger=None):
+        self.engine = engine
+        self.lease = timedelta(seconds=max(1, lease_seconds))
+        self.max_attempts = max(1, max_attempts)
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+    def register(self, run_key: str, shards: List[Dict[str, str]]):
+        """작업 등록 (이미 있는 작업은 유지)"""
+        rows = [{'task_id': s['id'], 'run_key': run_key, 'start_date': s['start_date'],
+                 'end_date': s['end_date'], 'status': 'pending', 'attempts': 0} for s in shards]
+        if not rows:
+            return
+        with self.engine.begin() as conn:
+            if conn.dialect.name == "mysql":
+                stmt = mysql.insert(TASK_TABLE).prefix_with("IGNORE")
+            elif conn.dialect.name == "sqlite":
+                stmt = sqlite.insert(TASK_TABLE).on_conflict_do_nothing(index_elements=['task_id'])
+            else:
+                raise NotImplementedError(f"Task ledger is not supported for dialect: {conn.dialect.name}")
+            conn.execute(stmt, rows)
+
+    def claim(self, run_key: str, owner: str) -> Optional[Dict[str, Any]]:
+        """작업 하나를 임대 (가져갈 작업이 없으면 None)"""
+        t = TASK_TABLE.c
+        while True:
+            with self.engine.begin() as conn:
+                now = self.db_now(conn)
+                query = (select(TASK_TABLE)
+                         .where(t.run_key == run_key, t.attempts < self.max_attempts,
+                                or_(t.status.in_(('pending', 'failed')),
+                                    and_(t.status == 'running', t.lease_expires_at < now)))
+                         .order_by(t.task_id)
+                         .limit(1)
+                         .with_for_update(skip_locked=True))
+                row = conn.execute(query).mappings().first()
+                if row is None:
+                    return None
+
+                result = conn.execute(
+                    update(TASK_TABLE)
+                    .where(t.task_id == row['task_id'], t.status == row['status'], t.attempts == row['attempts'])
+                    .values(status='running', owner=owner, attempts=t.attempts + 1,
+                            lease_expires_at=now + self.lease, error=None, updated_at=now))
+                if result.rowcount == 1:
+                    if row['status'] == 'running':
+                        self.logger.warning(f"Reclaimed expired task {row['task_id']} (previous owner: {row['owner']}).")
+                    return {**dict(row), 'status': 'running', 'owner': owner, 'attempts': row['attempts'] + 1}
+            # 다른 노드가 먼저 가져감 -> 다음 후보 조회
+
+    def renew(self, task_id: str, owner: str) -> bool:
+        """임대 연장 (이미 다른 노드가 가져갔으면 False)"""
+        return self._update_owned(task_id, owner, lambda now: dict(lease_expires_at=now + self.lease, updated_at=now))
+
+    def complete(self, task_id: str, owner: str, saved: int = 0) -> bool:
+        return self._update_owned(task_id, owner, lambda now: dict(status='done', saved_count=saved,
+                                                                   lease_expires_at=None, updated_at=now))
+
+    def fail(self, task_id: str, owner: str, error: str = "") -> bool:
+        return self._update_owned(task_id, owner, lambda now: dict(status='failed', error=error[:1000],
+                                                                   lease_expires_at=None, updated_at=now))
+
+    def _update_owned(self, task_id: str, owner: str, values: Callable[[datetime], Dict[str, Any]]) -> bool:
+        """소유 중인 작업 갱신 (values: DB 시각 -> 갱신할 컬럼)"""
+        t = TASK_TABLE.c
+        with self.engine.begin() as conn:
+            result = conn.execute(update(TASK_TABLE)
+                                  .where(t.task_id == task_id, t.owner == owner, t.status == 'running')
+                                  .values(**values(self.db_now(conn))))
+        return result.rowcount == 1
+
+    @staticmethod
+    def db_now(conn) -> datetime:
+        """DB 시각 (드라이버가 문자열로 돌려주면 변환)"""
+        now = conn.execute(select(func.now())).scalar()
+        return datetime.fromisoformat(now) if isinstance(now, str) else now
+
+    def progress(self, run_key: str) -> Dict[str, int]:
+        """상태별 작업 수"""
+        t = TASK_TABLE.c
+        with self.engine.connect() as conn:
+            rows = conn.execute(select(t.status, func.count()).where(t.run_key == run_key).group_by(t.status))
+            return {status: count for status, count in rows}
@@ -15,4 +15,17 @@ def parse_args():
         help="Path to the configuration directory"
     )
     
+    parser.add_argument(
+        "--shard",
+        action="append",
+        default=None,
+        help="Run only the given date shard ID (e.g. 20260201-20260201). Repeatable. Requires sharding mode"
+    )
+
+    parser.add_argument(
+        "--reparse",
+        action="store_true",
+        help="Re-parse saved detail snapshots without a browser and upsert the results"
+    )
+    
     return parser.parse_args()
\ No newline at end of file
@@ -0,0 +1,104 @@
+import http.client
+import queue
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# 서버가 처리했더라도 다시 보내도 되는 메서드
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# 유휴 연결을 서버가 먼저 닫았을 때의 오류 (요청이 처리되지 않았으므로 POST도 재전송 가능)
+_STALE_CONNECTION_ERRORS = (ConnectionResetError, ConnectionAbortedError, BrokenPipeError,
+                            http.client.RemoteDisconnected)
+
+class HttpResponse:
+    """응답 요약 (본문은 모두 읽은 상태)"""
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return self.body.decode(encoding, errors="replace")
+
+
+class KeepAliveHttpPool:
+    """
+    단일 호스트용 Keep-Alive HTTP 연결 풀 (표준 라이브러리 http.client 기반)
+    - 최대 size개의 연결을 재사용하며, 풀이 비어 있으면 반납될 때까지 대기합니다.
+    - 재사용한 유휴 연결이 끊겨 있었거나 멱등 메서드이면 새 연결로 한 번 재시도합니다.
+      (그 밖의 POST 실패나 타임아웃은 중복 요청이 될 수 있으므로 그대로 올립니다)
+    """
+
+    def __init__(self, base_url: str, size: int = 4, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname
+        self.port = parts.port
+        self.timeout = timeout
+        self.size = max(1, size)
+
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self.connections_opened = 0
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        self.connections_opened += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        headers = dict(headers or {})
+        headers.setdefault("Connection", "keep-alive")
+
+        with self._slots:
+            conn, reused = self._checkout()
+            try:
+                status, resp_headers, data = self._send(conn, method, path, body, headers)
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                if not self._retryable(method, e, reused):
+                    raise
+                conn = self._new_connection()
+                try:
+                    status, resp_headers, data = self._send(conn, method, path, body, headers)
+                except BaseException:
+                    conn.close()
+                    raise
+            except BaseException:
+                conn.close()
+                raise
+
+            if resp_headers.get("connection", "").lower() == "close":
+                conn.close()
+            else:
+                self._idle.put(conn)
+            return HttpResponse(status, resp_headers, data)
+
+    @staticmethod
+    def _retryable(method: str, error: Exception, reused: bool) -> bool:
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return reused and isinstance(error, _STALE_CONNECTION_ERRORS)
+
+    def _checkout(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """(연결, 유휴 연결 재사용 여부)"""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._new_connection(), False
+
+    @staticmethod
+    def _send(conn, method, path, body, headers) -> Tuple[int, Dict[str, str], bytes]:
+        conn.request(method, path, body=body, headers=headers)
+        resp = conn.getresponse()
+        data = resp.read()
+        return resp.status, {k.lower(): v for k, v in resp.getheaders()}, data
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
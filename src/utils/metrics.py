@@ -0,0 +1,212 @@
+import os
+import json
+import time
+import inspect
+import threading
+import functools
+from bisect import bisect_left
+from typing import Dict, Any, Optional, Tuple
+
+# 구간별 소요 시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count", "max")
+
+    def __init__(self, size: int):
+        # 마지막 칸은 +Inf
+        self.counts = [0] * (size + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+
+class MetricsRegistry:
+    """
+    실행 구간별 계측 (카운터 + 소요 시간 히스토그램)
+    - timed()/observe()는 perf_counter 2회와 잠금 안의 정수 갱신만 하므로 상시 켜 두어도 됩니다.
+    - 실행이 끝나면 Prometheus 텍스트 파일(node_exporter textfile 형식)과 JSON 요약으로 내보냅니다.
+    - 작업 프로세스의 계측은 snapshot()으로 넘겨받아 부모 프로세스에서 merge()로 합칩니다.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.enabled = True
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, _Histogram] = {}
+        self._counters: Dict[str, int] = {}
+        self.started = time.time()
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+        self.started = time.time()
+
+    def inc(self, name: str, value: int = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float):
+        if not self.enabled:
+            return
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = _Histogram(len(self.buckets))
+            hist.counts[index] += 1
+            hist.sum += seconds
+            hist.count += 1
+            if seconds > hist.max:
+                hist.max = seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """카운터/히스토그램 원본 값 (프로세스 간 전달용, pickle 가능)"""
+        with self._lock:
+            return {
+                'buckets': self.buckets,
+                'counters': dict(self._counters),
+                'histograms': {name: {'counts': list(h.counts), 'sum': h.sum, 'count': h.count, 'max': h.max}
+                               for name, h in self._histograms.items()},
+            }
+
+    def merge(self, snapshot: Dict[str, Any]):
+        """다른 레지스트리의 snapshot() 합산 (버킷 경계가 같아야 함)"""
+        if tuple(snapshot['buckets']) != self.buckets:
+            raise ValueError("cannot merge metrics with different buckets")
+        with self._lock:
+            for name, value in snapshot['counters'].items():
+                self._counters[name] = self._counters.get(name, 0) + value
+            for name, other in snapshot['histograms'].items():
+                hist = self._histograms.get(name)
+                if hist is None:
+                    hist = self._histograms[name] = _Histogram(len(self.buckets))
+                hist.counts = [a + b for a, b in zip(hist.counts, other['counts'])]
+                hist.sum += other['sum']
+                hist.count += other['count']
+                hist.max = max(hist.max, other['max'])
+
+    def timed(self, name: str):
+        """함수/코루틴 소요 시간 기록 데코레이터 (예외는 '<name>.errors' 카운터)"""
+        def decorator(func):
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await func(*args, **kwargs)
+                    started = time.perf_counter()
+                    try:
+                        return await func(*args, **kwargs)
+                    except BaseException:
+                        self.inc(f"{name}.errors")
+                        raise
+                    finally:
+                        self.observe(name, time.perf_counter() - started)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                except BaseException:
+                    self.inc(f"{name}.errors")
+                    raise
+                finally:
+                    self.observe(name, time.perf_counter() - started)
+            return wrapper
+        return decorator
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON 요약 (구간별 건수/합계/평균/최대/p50·p95 근사, 카운터, 분당 수집 건수)"""
+        elapsed = max(1e-9, time.time() - self.started)
+        with self._lock:
+            stages = {name: self._stage_summary(h) for name, h in sorted(self._histograms.items())}
+            counters = dict(sorted(self._counters.items()))
+        return {
+            'started_at': time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_minute': round(counters.get('notices_collected', 0) * 60 / elapsed, 2),
+            'counters': counters,
+            'stages': stages,
+        }
+
+    def _stage_summary(self, hist: _Histogram) -> Dict[str, Any]:
+        return {
+            'count': hist.count,
+            'sum': round(hist.sum, 4),
+            'avg': round(hist.sum / hist.count, 4) if hist.count else 0.0,
+            'max': round(hist.max, 4),
+            'p50': self._bucket_quantile(hist, 0.5),
+            'p95': self._bucket_quantile(hist, 0.95),
+        }
+
+    def _bucket_quantile(self, hist: _Histogram, q: float) -> Optional[float]:
+        """분위수가 속한 버킷의 상한 (마지막 버킷이면 최대값)"""
+        if not hist.count:
+            return None
+        target, seen = q * hist.count, 0
+        for i, count in enumerate(hist.counts):
+            seen += count
+            if seen >= target:
+                return self.buckets[i] if i < len(self.buckets) else round(hist.max, 4)
+        return round(hist.max, 4)
+
+    def to_prometheus(self, prefix: str = "nuri") -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+
+        lines.append(f"# HELP {prefix}_stage_seconds Time spent per crawl stage.")
+        lines.append(f"# TYPE {prefix}_stage_seconds histogram")
+        for name, hist in histograms:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), hist.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {hist.sum:.6f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {hist.count}')
+
+        lines.append(f"# HELP {prefix}_events_total Crawl event counters.")
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, value in counters:
+            lines.append(f'{prefix}_events_total{{event="{name}"}} {value}')
+
+        summary = self.summary()
+        lines.append(f"# HELP {prefix}_rows_per_minute Notices collected per minute in this run.")
+        lines.append(f"# TYPE {prefix}_rows_per_minute gauge")
+        lines.append(f"{prefix}_rows_per_minute {summary['rows_per_minute']}")
+        lines.append(f"# TYPE {prefix}_run_elapsed_seconds gauge")
+        lines.append(f"{prefix}_run_elapsed_seconds {summary['elapsed_seconds']}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, prometheus_file: str = "", summary_file: str = "", extra: Optional[Dict[str, Any]] = None):
+        """파일로 내보내기 (임시 파일 작성 후 교체하여 수집기가 반쯤 쓴 파일을 읽지 않도록)"""
+        if prometheus_file:
+            self._write(prometheus_file, self.to_prometheus())
+        if summary_file:
+            self._write(summary_file, json.dumps({**self.summary(), **(extra or {})}, ensure_ascii=False, indent=2))
+
+    @staticmethod
+    def _write(path: str, text: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+
+# 프로세스 전역 레지스트리
+METRICS = MetricsRegistry()
+timed = METRICS.timed
@@ -0,0 +1,232 @@
+import os
+import sys
+import hashlib
+import logging
+import time
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.models.bid_notice import BidNotice, BidAttachment
+from src.crawlers.components.attachment_downloader import AttachmentDownloader, format_size
+
+logger = logging.getLogger("test")
+SPEC = b"spec-sheet " * 1000
+FILES = {"/a/spec.pdf": SPEC, "/b/spec-copy.pdf": SPEC, "/c/drawing.dwg": b"drawing" * 50}
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Range 요청을 지원하는 테스트 파일 서버"""
+    ranges = []
+    gets = []
+
+    def do_GET(self):
+        RangeHandler.gets.append(self.path)
+        if self.path.startswith("/slow/"):
+            time.sleep(0.2)
+            self.path = self.path[len("/slow"):]
+        body = FILES.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        status, start = 200, 0
+        if self.headers.get("Range"):
+            start = int(self.headers["Range"].split("=")[1].rstrip("-"))
+            RangeHandler.ranges.append((self.path, start))
+            status = 206
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        self.wfile.write(body[start:])
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+def make_bid(code: str, base: str, paths) -> BidNotice:
+    return BidNotice(notice_code=code, degree="000", title=code, status="게시",
+                     attachments=[BidAttachment(file_name=os.path.basename(p), download_url=base + p) for p in paths])
+
+def test_same_content_is_stored_once(server, tmp_path):
+    """내용이 같은 첨부파일은 URL이 달라도 한 번만 저장되고, 필드가 채워져야 한다."""
+    # Given
+    downloader = AttachmentDownloader({'dir': str(tmp_path), 'concurrency': 3}, logger)
+    bids = [make_bid("R1", server, ["/a/spec.pdf", "/c/drawing.dwg"]),
+            make_bid("R2", server, ["/b/spec-copy.pdf", "/a/spec.pdf"])]
+
+    # When
+    downloader.download_all(bids)
+
+    # Then
+    sha = hashlib.sha256(SPEC).hexdigest()
+    attachments = [a for bid in bids for a in bid.attachments]
+    assert all(a.sha256 for a in attachments)
+    assert {a.sha256 for a in attachments if "spec" in a.file_name} == {sha}
+    assert bids[0].attachments[0].file_size == format_size(len(SPEC)) == "10.7KB"
+    stored = [f for root, _, files in os.walk(tmp_path) if ".partial" not in root for f in files]
+    assert sorted(stored) == sorted({sha, hashlib.sha256(FILES["/c/drawing.dwg"]).hexdigest()})
+
+def test_resumes_partial_download(server, tmp_path):
+    """중단된 파일은 Range 요청으로 이어받고 전체 해시가 같아야 한다."""
+    # Given
+    downloader = AttachmentDownloader({'dir': str(tmp_path)}, logger)
+    url = server + "/a/spec.pdf"
+    with open(downloader.store.partial_path(url), 'wb') as f:
+        f.write(SPEC[:4000])
+    RangeHandler.ranges.clear()
+
+    # When
+    sha, size = downloader.fetch(url)
+
+    # Then
+    assert RangeHandler.ranges == [("/a/spec.pdf", 4000)]
+    assert (sha, size) == (hashlib.sha256(SPEC).hexdigest(), len(SPEC))
+    with open(downloader.store.path_for(sha), 'rb') as f:
+        assert f.read() == SPEC
+
+def test_failed_download_keeps_url(server, tmp_path):
+    downloader = AttachmentDownloader({'dir': str(tmp_path)}, logger)
+    bid = make_bid("R1", server, ["/missing.pdf"])
+    downloader.download_all([bid])
+    assert bid.attachments[0].sha256 is None
+    assert bid.attachments[0].download_url.endswith("/missing.pdf")
+    assert downloader.counts['failed'] == 1
+
+def test_concurrent_fetches_of_same_url_download_once(server, tmp_path):
+    """여러 공고가 같은 URL을 동시에 받으면 한 번만 요청하고 나머지는 결과를 재사용해야 한다."""
+    # Given: 같은 양식 파일을 공유하는 공고 12건
+    downloader = AttachmentDownloader({'dir': str(tmp_path), 'concurrency': 8}, logger)
+    bids = [make_bid(f"R{i}", server, ["/a/spec.pdf"]) for i in range(12)]
+    RangeHandler.gets.clear()
+
+    # When
+    downloader.download_all(bids)
+
+    # Then
+    assert RangeHandler.gets == ["/a/spec.pdf"]
+    assert downloader.counts == {'downloaded': 1, 'reused': 11, 'failed': 0, 'bytes': len(SPEC)}
+    assert {bid.attachments[0].sha256 for bid in bids} == {hashlib.sha256(SPEC).hexdigest()}
+    assert os.listdir(os.path.join(tmp_path, ".partial")) == []
+
+def test_failed_attempt_leaves_resumable_partial(tmp_path):
+    """실패한 시도의 임시 파일은 URL별 이어받기 파일로 돌아가고, 저장소에 이미 있는 내용은 임시 파일만 지워야 한다."""
+    from src.crawlers.components.attachment_downloader import AttachmentStore
+
+    # Given
+    store = AttachmentStore(str(tmp_path))
+    url = "http://example.com/a.pdf"
+    with open(store.partial_path(url), 'wb') as f:
+        f.write(b"half")
+
+    # When: 이어받기 파일을 가져간 시도가 실패
+    attempt = store.begin(url)
+    resumed_elsewhere = store.begin(url)
+    store.suspend(url, attempt)
+
+    # Then
+    assert attempt != resumed_elsewhere and not os.path.exists(resumed_elsewhere)
+    with open(store.partial_path(url), 'rb') as f:
+        assert f.read() == b"half"
+
+    # When: 같은 내용을 두 시도가 각각 완료
+    sha = hashlib.sha256(b"full").hexdigest()
+    for _ in range(2):
+        partial = store.begin("http://example.com/b.pdf")
+        with open(partial, 'wb') as f:
+            f.write(b"full")
+        store.commit(partial, sha)
+
+    # Then
+    with open(store.path_for(sha), 'rb') as f:
+        assert f.read() == b"full"
+
+class RecordingRate:
+    """RateController 대역 (보고된 지연 기록)"""
+    def __init__(self):
+        self.latencies = []
+
+    def acquire(self):
+        pass
+
+    def on_success(self, latency):
+        self.latencies.append(latency)
+
+    def on_response(self, status, latency):
+        self.latencies.append(latency)
+
+def test_reports_real_response_latency(server, tmp_path):
+    """속도 제어기에는 실제 응답 지연이 보고되어야 한다."""
+    rate = RecordingRate()
+    downloader = AttachmentDownloader({'dir': str(tmp_path)}, logger, rate=rate)
+
+    downloader.fetch(server + "/slow/a/spec.pdf")
+
+    assert len(rate.latencies) == 1
+    assert rate.latencies[0] >= 0.2
+
+class FakeDownloadInfo:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def value(self):
+        raise TimeoutError("Timeout 100ms exceeded while waiting for event \"download\"")
+
+class NavigatingPage:
+    """첨부파일 링크 클릭이 다운로드 대신 다른 화면으로 이동하는 페이지 대역"""
+    def __init__(self):
+        self.url = "https://example.test/detail"
+        self.clicks = 0
+        self.backs = 0
+
+    def locator(self, selector):
+        return self
+
+    def filter(self, has_text):
+        return self
+
+    @property
+    def first(self):
+        return self
+
+    def click(self):
+        self.clicks += 1
+        self.url = "https://example.test/other"
+
+    def expect_download(self, timeout):
+        return FakeDownloadInfo()
+
+    def go_back(self):
+        self.backs += 1
+        self.url = "https://example.test/detail"
+
+    def wait_for_load_state(self, state):
+        pass
+
+def test_capture_restores_detail_page_after_navigation(tmp_path):
+    """링크 클릭이 화면을 이동시키면 상세 화면으로 되돌리고 남은 링크는 클릭하지 않아야 한다."""
+    # Given
+    page = NavigatingPage()
+    bid = BidNotice(notice_code="R1", degree="000", title="R1", status="게시",
+                    attachments=[BidAttachment(file_name="a.hwp"), BidAttachment(file_name="b.hwp")])
+    downloader = AttachmentDownloader({'dir': str(tmp_path), 'capture_timeout': 100}, logger)
+
+    # When
+    downloader.capture_urls(page, bid)
+
+    # Then
+    assert page.url == "https://example.test/detail"
+    assert (page.clicks, page.backs) == (1, 1)
+    assert all(a.download_url is None for a in bid.attachments)
@@ -0,0 +1,202 @@
+import os
+import sys
+import pytest
+from sqlalchemy import select, func
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.models.bid_notice import BidNotice, BidDetail, BidAttachment
+from src.storage.mysql_storage import MySqlStorage
+from src.storage.entities import BidNoticeEntity, BidNoticeDetailEntity, BidAttachmentEntity
+
+@pytest.fixture
+def storage(tmp_path):
+    """SQLite 파일 DB로 벌크 Upsert 경로 검증 (ON CONFLICT DO UPDATE)"""
+    storage = MySqlStorage(f"sqlite:///{tmp_path / 'bulk.db'}", bulk_upsert=True, chunk_size=2)
+    storage.connect()
+    yield storage
+    storage.close()
+
+def make_bid(code: str, title: str, files) -> BidNotice:
+    return BidNotice(
+        notice_code=code, degree="000", title=title, status="게시",
+        detail_info=BidDetail(client_name="아파트", budget_amt=1000),
+        attachments=[BidAttachment(file_name=name, file_size=size) for name, size in files],
+    )
+
+def rows(storage, query):
+    with storage.engine.connect() as conn:
+        return conn.execute(query).all()
+
+def test_bulk_upsert_inserts_and_updates(storage):
+    """신규 공고는 삽입되고, 같은 키는 값이 갱신되며 행이 늘어나지 않아야 한다."""
+    # Given
+    storage.save([make_bid(f"B{i}", f"공고 {i}", [("a.pdf", "1KB")]) for i in range(5)])
+
+    # When
+    storage.save([make_bid("B1", "공고 1 (변경)", [("a.pdf", "1KB")])])
+
+    # Then
+    assert rows(storage, select(func.count()).select_from(BidNoticeEntity))[0][0] == 5
+    assert rows(storage, select(func.count()).select_from(BidNoticeDetailEntity))[0][0] == 5
+    title = rows(storage, select(BidNoticeEntity.title).where(BidNoticeEntity.notice_code == "B1"))[0][0]
+    assert title == "공고 1 (변경)"
+
+def test_attachments_reconciled_by_file_name(storage):
+    """첨부파일은 유지/변경/추가/삭제 대상만 반영되고, 유지된 행의 ID는 바뀌지 않아야 한다."""
+    # Given
+    storage.save([make_bid("B1", "공고", [("keep.pdf", "1KB"), ("resize.pdf", "1KB"), ("drop.pdf", "1KB")])])
+    keep_id = rows(storage, select(BidAttachmentEntity.id).where(BidAttachmentEntity.file_name == "keep.pdf"))[0][0]
+
+    # When
+    storage.save([make_bid("B1", "공고", [("keep.pdf", "1KB"), ("resize.pdf", "2KB"), ("new.pdf", "3KB")])])
+
+    # Then
+    saved = rows(storage, select(BidAttachmentEntity.id, BidAttachmentEntity.file_name, BidAttachmentEntity.file_size)
+                 .order_by(BidAttachmentEntity.file_name))
+    assert [(name, size) for _, name, size in saved] == [("keep.pdf", "1KB"), ("new.pdf", "3KB"), ("resize.pdf", "2KB")]
+    assert saved[0][0] == keep_id
+
+def test_unchanged_notices_are_not_rewritten(storage):
+    """내용 해시가 같은 공고는 쓰지 않고, 바뀐 공고만 updated_at이 갱신되어야 한다."""
+    # Given
+    storage.save([make_bid("B1", "공고 1", [("a.pdf", "1KB")]), make_bid("B2", "공고 2", [("a.pdf", "1KB")])])
+    before = dict(rows(storage, select(BidNoticeEntity.notice_code, BidNoticeEntity.updated_at)))
+
+    # When
+    stats = storage.upserter.upsert([
+        make_bid("B1", "공고 1", [("a.pdf", "1KB")]),
+        make_bid("B2", "공고 2", [("a.pdf", "1KB"), ("b.pdf", "1KB")]),
+        make_bid("B3", "공고 3", []),
+    ])
+
+    # Then
+    after = dict(rows(storage, select(BidNoticeEntity.notice_code, BidNoticeEntity.updated_at)))
+    assert stats == {"inserted": 1, "updated": 1, "unchanged": 1}
+    assert after["B1"] == before["B1"]
+    assert after["B2"] > before["B2"]
+
+def test_content_hash_matches_json_dumps_serialization():
+    """내용 해시는 이전 json.dumps(sort_keys) 직렬화와 같아야 한다. (저장된 해시와 호환)"""
+    import json
+    import hashlib
+    from datetime import datetime
+    from src.storage.mysql_mapper import MySqlBidMapper, HASH_EXCLUDE
+
+    # Given: 제어문자/따옴표/역슬래시/이모지/줄 구분자, 상세 없음, 첨부 순서 뒤섞임
+    bids = [
+        make_bid("B1", "공고 \"따옴표\" \\ 역슬래시\n\t탭 \x01 😀  ", [("b.pdf", "2KB"), ("a.pdf", None)]),
+        BidNotice(notice_code="B2", degree="001", title="상세 없음", status="게시",
+                  date_posted=datetime(2026, 2, 3, 10, 0), list_fingerprint="ignored"),
+    ]
+
+    def legacy(dto):
+        data = dto.model_dump(mode="json", exclude=HASH_EXCLUDE)
+        data['attachments'] = sorted(data['attachments'], key=lambda a: (a['file_name'], a.get('file_size') or ''))
+        text = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    # Then
+    assert [MySqlBidMapper.content_hash(b) for b in bids] == [legacy(b) for b in bids]
+
+def test_reparsed_attachments_keep_download_provenance(storage):
+    """다운로드 정보가 없는(None) 재파싱 결과는 저장된 크기/URL/SHA-256을 지우지 않아야 한다."""
+    # Given: 첨부파일을 내려받아 저장한 공고
+    downloaded = make_bid("B1", "공고", [("a.pdf", "14KB"), ("b.pdf", "1KB")])
+    downloaded.attachments[0].download_url = "https://nuri.g2b.go.kr/files/a.pdf"
+    downloaded.attachments[0].sha256 = "ab" * 32
+    storage.save([downloaded])
+
+    # When: HTML 스냅샷 재파싱 결과 (제목 변경, 첨부 값 없음 / b.pdf 크기만 바뀜)
+    reparsed = make_bid("B1", "공고 (재파싱)", [("a.pdf", None), ("b.pdf", "2KB")])
+    storage.save([reparsed])
+
+    # Then
+    saved = rows(storage, select(BidAttachmentEntity.file_name, BidAttachmentEntity.file_size,
+                                 BidAttachmentEntity.download_url, BidAttachmentEntity.sha256)
+                 .order_by(BidAttachmentEntity.file_name))
+    assert saved == [("a.pdf", "14KB", "https://nuri.g2b.go.kr/files/a.pdf", "ab" * 32), ("b.pdf", "2KB", None, None)]
+
+def test_migrate_adds_sha256_column_with_index(tmp_path):
+    """sha256 컬럼이 없던 기존 DB는 컬럼과 엔티티에 선언된 인덱스를 함께 추가해야 한다."""
+    import sqlite3
+    from sqlalchemy import inspect
+
+    # Given: sha256 컬럼/인덱스가 없는 이전 스키마
+    path = tmp_path / "old.db"
+    old = MySqlStorage(f"sqlite:///{path}")
+    old.connect()
+    old.close()
+    conn = sqlite3.connect(path)
+    conn.execute("DROP INDEX ix_bid_attachments_sha256")
+    conn.execute("ALTER TABLE bid_attachments DROP COLUMN sha256")
+    conn.commit()
+    conn.close()
+
+    # When
+    storage = MySqlStorage(f"sqlite:///{path}")
+    storage.connect()
+
+    # Then
+    inspector = inspect(storage.engine)
+    assert "sha256" in {c['name'] for c in inspector.get_columns("bid_attachments")}
+    assert "ix_bid_attachments_sha256" in {i['name'] for i in inspector.get_indexes("bid_attachments")}
+    storage.close()
+
+def test_unchanged_notice_still_updates_list_fingerprint(storage):
+    """내용이 같아도 목록 지문이 바뀌면 지문은 저장되어야 한다 (증분 수집이 매번 다시 방문하지 않도록)."""
+    # Given
+    bid = make_bid("B1", "공고", [("a.pdf", "1KB")])
+    bid.list_fingerprint = "aaaa"
+    storage.save([bid])
+    before = rows(storage, select(BidNoticeEntity.updated_at))[0][0]
+
+    # When
+    same = make_bid("B1", "공고", [("a.pdf", "1KB")])
+    same.list_fingerprint = "bbbb"
+    stats = storage.upserter.upsert([same])
+
+    # Then
+    assert stats == {"inserted": 0, "updated": 0, "unchanged": 1}
+    assert rows(storage, select(BidNoticeEntity.list_fingerprint, BidNoticeEntity.updated_at))[0] == ("bbbb", before)
+
+def test_download_provenance_does_not_mark_notice_updated(storage):
+    """다운로드 정보만 다른 수집(재파싱 <-> 다운로드 수집)을 번갈아 저장해도 변경으로 보지 않되, 새 정보는 반영해야 한다."""
+    # Given: 다운로드 정보 없이 저장된 공고
+    storage.save([make_bid("B1", "공고", [("a.pdf", None)])])
+    before = rows(storage, select(BidNoticeEntity.updated_at))[0][0]
+
+    downloaded = make_bid("B1", "공고", [("a.pdf", "14KB")])
+    downloaded.attachments[0].download_url = "https://nuri.g2b.go.kr/files/a.pdf"
+    downloaded.attachments[0].sha256 = "ab" * 32
+
+    # When: 다운로드 수집 -> 재파싱 -> 다운로드 수집
+    stats = [storage.upserter.upsert([bid]) for bid in (downloaded, make_bid("B1", "공고", [("a.pdf", None)]), downloaded)]
+
+    # Then
+    assert [s["unchanged"] for s in stats] == [1, 1, 1]
+    assert rows(storage, select(BidNoticeEntity.updated_at))[0][0] == before
+    saved = rows(storage, select(BidAttachmentEntity.file_size, BidAttachmentEntity.download_url, BidAttachmentEntity.sha256))
+    assert saved == [("14KB", "https://nuri.g2b.go.kr/files/a.pdf", "ab" * 32)]
+
+def test_orm_merge_path_skips_unchanged_notices(tmp_path):
+    """bulk_upsert: false 경로도 내용이 같은 공고는 쓰지 않고, 바뀐 공고만 updated_at을 갱신해야 한다."""
+    # Given
+    storage = MySqlStorage(f"sqlite:///{tmp_path / 'merge.db'}", bulk_upsert=False)
+    storage.connect()
+    storage.save([make_bid("B1", "공고 1", [("a.pdf", "1KB")]), make_bid("B2", "공고 2", [])])
+    before = dict(rows(storage, select(BidNoticeEntity.notice_code, BidNoticeEntity.updated_at)))
+
+    # When
+    same = make_bid("B1", "공고 1", [("a.pdf", "1KB")])
+    same.list_fingerprint = "bbbb"
+    storage.save([same, make_bid("B2", "공고 2 (변경)", [])])
+
+    # Then
+    after = {code: (fingerprint, updated_at) for code, fingerprint, updated_at in rows(
+        storage, select(BidNoticeEntity.notice_code, BidNoticeEntity.list_fingerprint, BidNoticeEntity.updated_at))}
+    storage.close()
+    assert before["B1"] is not None
+    assert after["B1"] == ("bbbb", before["B1"])
+    assert after["B2"][1] > before["B2"]
@@ -0,0 +1,217 @@
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.crawlers.components.detail_replay import RecordedEndpoint, DetailReplayClient, DetailRequestRecorder
+from src.crawlers.components.nuri_parser import NuriParser
+from src.crawlers.nuri_crawler import NuriCrawler
+from src.utils.http_pool import KeepAliveHttpPool
+
+# 기록된 상세 응답 (공고번호-차수 : 응답 본문)
+RECORDED_RESPONSES = {
+    f"R26BK{n:04d}-000": {
+        "dlBidPbancDtlM": {
+            "bidPbancNm": f"[테스트] 공사 {n}",
+            "docNo": f"DOC-{n}",
+            "asgnBdgtAmt": "1,000,000원",
+            "dmndInstNm": "테스트아파트",
+            "bidDdlnDt": "2026/02/15 18:00",
+        },
+        "dlAtchFileL": [{"fileNm": "도면.pdf"}, {"fileNm": "시방서.hwp"}],
+    }
+    for n in range(1, 7)
+}
+
+REPLAY_CONFIG = {
+    "concurrency": 2,
+    "record_key": "dlBidPbancDtlM",
+    "fields": {
+        "title": "{bidPbancNm}",
+        "doc_number": "{docNo}",
+        "budget_amt": "{asgnBdgtAmt}",
+        "client_name_detail": "{dmndInstNm}",
+        "bid_end_dt": "{bidDdlnDt}",
+    },
+    "attachments_key": "dlAtchFileL",
+    "attachment_name": "fileNm",
+}
+
+
+class StubDetailHandler(BaseHTTPRequestHandler):
+    """기록된 응답을 돌려주는 상세 엔드포인트 (Keep-Alive 지원)"""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        key = f"{body['dlParam']['bidPbancNo']}-{body['dlParam']['bidPbancOrd']}"
+        self.server.cookies.add(self.headers.get("Cookie"))
+
+        payload = RECORDED_RESPONSES.get(key)
+        data = json.dumps(payload or {}, ensure_ascii=False).encode("utf-8")
+        self.send_response(200 if payload else 404)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubDetailHandler)
+    server.cookies = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def record_endpoint(server) -> RecordedEndpoint:
+    """브라우저에서 관찰했다고 가정한 첫 상세 요청"""
+    url = f"http://127.0.0.1:{server.server_address[1]}/nt/bid/selectBidPbancDtl.do"
+    post_data = json.dumps({"dlParam": {"bidPbancNo": "R26BK0001", "bidPbancOrd": "000", "menuCd": "PNPE001"}})
+    headers = {"content-type": "application/json", "cookie": "stale=1", "content-length": "99"}
+    return RecordedEndpoint.from_request("POST", url, headers, post_data, "R26BK0001", "000")
+
+
+def test_recorded_endpoint_is_templated(stub_server):
+    """기록된 요청 본문의 공고번호/차수는 다른 공고로 치환 가능해야 한다."""
+    endpoint = record_endpoint(stub_server)
+
+    path, body = endpoint.build("R26BK0005", "001")
+
+    assert path == "/nt/bid/selectBidPbancDtl.do"
+    assert json.loads(body) == {"dlParam": {"bidPbancNo": "R26BK0005", "bidPbancOrd": "001", "menuCd": "PNPE001"}}
+    assert "cookie" not in {k.lower() for k in endpoint.headers}, "기록 시점의 쿠키는 재사용하지 않아야 한다."
+
+
+def test_fetch_many_against_stub(stub_server):
+    """동시 재생 결과가 브라우저 경로와 같은 Raw Data 형태로 병합되어야 한다."""
+    # Given
+    client = DetailReplayClient(record_endpoint(stub_server), REPLAY_CONFIG, logging.getLogger("test"))
+    client.set_cookies([{"name": "JSESSIONID", "value": "abc"}, {"name": "WMONID", "value": "xyz"}])
+    tasks = [(i, {"notice_code_full": code, "title": "목록 제목", "date_posted": "2026-02-03"})
+             for i, code in enumerate(list(RECORDED_RESPONSES) + ["R26BK9999-000"])]
+
+    # When
+    try:
+        results = dict(client.fetch_many(tasks))
+    finally:
+        client.close()
+
+    # Then
+    assert results[6] is None, "응답이 없는 공고는 실패(None)로 격리되어야 한다."
+    raw = results[0]
+    assert raw["title"] == "[테스트] 공사 1"
+    assert raw["doc_number"] == "DOC-1"
+    assert raw["client_name"] == "테스트아파트"
+    assert raw["date_posted"] == "2026-02-03", "목록 데이터는 유지되어야 한다."
+    assert raw["attachment_names"] == ["도면.pdf", "시방서.hwp"]
+
+    assert stub_server.cookies == {"JSESSIONID=abc; WMONID=xyz"}
+    assert client.pool.connections_opened <= REPLAY_CONFIG["concurrency"], "연결은 풀 크기 이내로 재사용되어야 한다."
+
+
+def test_endpoint_without_notice_code_is_rejected(stub_server):
+    """공고번호를 치환하지 못한 요청은 재생하지 않아야 한다 (모든 공고가 같은 응답을 받게 됨)."""
+    # Given: 기록한 공고번호와 요청 값이 다름 (예: 내부 키로 조회)
+    url = f"http://127.0.0.1:{stub_server.server_address[1]}/nt/bid/selectBidPbancDtl.do"
+    post_data = json.dumps({"dlParam": {"bidPbancId": "INTERNAL-1", "menuCd": "PNPE001"}})
+    recorder = DetailRequestRecorder("BidPbancDtl", logging.getLogger("test"))
+    recorder._last = ("POST", url, {"content-type": "application/json"}, post_data)
+
+    # When / Then
+    assert record_endpoint(stub_server).is_templated()
+    assert recorder.record("R26BK0001-000") is None
+    assert recorder.rejected
+
+
+def test_replay_result_is_checked_against_browser(stub_server):
+    """첫 재생 결과가 브라우저 결과와 다르면 전환하지 않아야 한다."""
+    # Given
+    client = DetailReplayClient(record_endpoint(stub_server), REPLAY_CONFIG, logging.getLogger("test"))
+    parser = NuriParser(logging.getLogger("test"))
+    list_data = {"notice_code_full": "R26BK0001-000", "title": "목록 제목", "date_posted": "2026-02-03"}
+    try:
+        browser_bid = parser.build_notice(client.fetch(list_data))
+        other_bid = parser.build_notice(client.fetch(dict(list_data, notice_code_full="R26BK0002-000")))
+    finally:
+        client.close()
+
+    # Then
+    assert NuriCrawler._replay_mismatch(browser_bid, browser_bid.model_copy(deep=True)) == ""
+    assert NuriCrawler._replay_mismatch(browser_bid, other_bid) == "title"
+    assert NuriCrawler._replay_mismatch(browser_bid, None) == "no result"
+    no_attachments = browser_bid.model_copy(update={"attachments": []})
+    assert NuriCrawler._replay_mismatch(browser_bid, no_attachments) == "attachments", \
+        "첨부파일이 빠진 재생 결과로 저장된 첨부파일을 지우면 안 된다."
+    assert DetailReplayClient.maps_attachments(REPLAY_CONFIG)
+    assert not DetailReplayClient.maps_attachments(dict(REPLAY_CONFIG, attachments_key=""))
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """응답 후 연결을 끊거나(stale), 응답을 지연(slow)하는 엔드포인트"""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests += 1
+        if self.path == "/slow":
+            time.sleep(0.5)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+        # Keep-Alive 응답 후 서버가 유휴 연결을 닫음
+        self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    server.requests = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_retries_post_only_on_stale_connection(flaky_server):
+    # Given
+    pool = KeepAliveHttpPool(f"http://127.0.0.1:{flaky_server.server_address[1]}", size=1, timeout=0.2)
+
+    # When: 서버가 닫은 유휴 연결로 POST
+    try:
+        assert pool.request("POST", "/fast", body=b"a").status == 200
+        time.sleep(0.1)
+        assert pool.request("POST", "/fast", body=b"b").status == 200
+
+        # Then: 새 연결로 한 번 재전송
+        assert flaky_server.requests == 2
+        assert pool.connections_opened == 2
+
+        # When: 타임아웃된 POST
+        with pytest.raises(OSError):
+            pool.request("POST", "/slow", body=b"c")
+        time.sleep(0.6)
+
+        # Then: 서버가 이미 받았을 수 있으므로 재전송하지 않음
+        assert flaky_server.requests == 3
+    finally:
+        pool.close()
@@ -0,0 +1,130 @@
+import os
+import sys
+import logging
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.core.base_storage import BaseStorage
+from src.core.snapshot_reparser import SnapshotReparser
+from src.crawlers.components.detail_html import parse_detail_html
+from src.crawlers.components.nuri_detail_extractor import NuriDetailExtractor
+from src.crawlers.components.snapshot_store import DetailSnapshotStore, HTML_KEY
+from benchmarks.fixtures import build_detail_html
+
+logger = logging.getLogger("test")
+
+
+class ListStorage(BaseStorage):
+    def __init__(self):
+        self.batches = []
+    def connect(self): pass
+    def save(self, data): self.batches.append(list(data))
+    def get_last_checkpoint(self): return None
+    def close(self): pass
+
+
+def list_data(n: int) -> dict:
+    return {'title': f'목록 제목 {n}', 'notice_code_full': f'R26BK{n:08d}-000', 'date_posted': '2026-02-03',
+            'category': '공사', 'process_type': '등록공고', 'link': object()}
+
+
+def make_config(tmp_path) -> dict:
+    return {'system': {'crawler': {'snapshots': {'dir': str(tmp_path / "snapshots")}},
+                       'storage': {'batch_size': 2}}}
+
+
+def test_parse_detail_html_matches_snapshot_shape():
+    # Given
+    html = build_detail_html(7, attachments=2).replace(
+        "href='#' onclick='return false;'>첨부1", "href='/files/7/1.pdf'>첨부1")
+
+    # When
+    snapshot = parse_detail_html(html, base_url="https://nuri.g2b.go.kr/detail")
+
+    # Then: th 라벨 / 다음 td innerText (<br>은 줄바꿈)
+    pairs = dict(snapshot['pairs'])
+    assert pairs['담당자'] == "홍길동\n(02-000-0000)"
+    assert pairs['배정예산'] == "100,000,007원"
+    assert snapshot['title'] == "[테스트] 승강기 교체 공사 7입찰공고진행상세"
+    assert snapshot['attachments'] == ["첨부0_규격서_7.pdf", "첨부1_규격서_7.pdf"]
+    assert snapshot['attachment_urls'] == ["", "https://nuri.g2b.go.kr/files/7/1.pdf"]
+
+
+def test_extract_from_html_applies_field_config():
+    # When
+    raw = NuriDetailExtractor(logger).extract_from_html(build_detail_html(3), list_data(3))
+
+    # Then
+    assert raw['title'] == "[테스트] 승강기 교체 공사 3"
+    assert raw['manager_name'] == "홍길동"
+    assert raw['base_price'] == "90,000,003원"
+    assert raw['client_name_detail'] == "누리아파트 관리사무소"
+    assert raw['attachment_names'] == [f"첨부{i}_규격서_3.pdf" for i in range(3)]
+
+
+def test_store_deduplicates_and_keeps_latest(tmp_path):
+    # Given: 작은 세그먼트로 여러 파일에 나누어 저장
+    store = DetailSnapshotStore(str(tmp_path), logger, segment_bytes=2048)
+    assert store.put(list_data(1), build_detail_html(1)) is True
+    assert store.put(list_data(2), build_detail_html(2)) is True
+    # 같은 내용 재저장은 본문을 다시 쓰지 않음
+    assert store.put(list_data(1), build_detail_html(1)) is False
+    # 내용이 바뀌면 최신 스냅샷 교체
+    changed = build_detail_html(1).replace("관리사무소 회의실", "단지 정문")
+    assert store.put(list_data(1), changed) is True
+    store.close()
+
+    # When: 다시 열기
+    reopened = DetailSnapshotStore(str(tmp_path), logger)
+    latest = reopened.latest()
+
+    # Then
+    assert [(s.notice_code, s.degree) for s in latest] == [("R26BK00000002", "000"), ("R26BK00000001", "000")]
+    assert "단지 정문" in reopened.read(reopened.get("R26BK00000001", "000"))
+    assert list(reopened.iter_html(latest)) == [build_detail_html(2), changed]
+    assert "link" not in latest[0].list_data
+    assert reopened.count() == 2
+    assert len([f for f in os.listdir(tmp_path) if f.endswith(".dat")]) >= 2
+    reopened.close()
+
+
+def test_keep_pops_html_from_raw_data(tmp_path):
+    # Given
+    store = DetailSnapshotStore(str(tmp_path), logger)
+    raw = {'title': '제목', HTML_KEY: build_detail_html(5)}
+
+    # When
+    store.keep(raw, list_data(5), "https://nuri.g2b.go.kr/")
+    store.keep({'title': '재생 경로'}, list_data(6))
+
+    # Then: HTML은 Raw Data에서 빠지고 저장소에만 남음
+    assert HTML_KEY not in raw
+    assert [s.notice_code for s in store.latest()] == ["R26BK00000005"]
+    assert store.latest()[0].url == "https://nuri.g2b.go.kr/"
+    store.close()
+
+
+def test_reparse_picks_up_field_config_change(tmp_path, monkeypatch):
+    # Given: 수집 시점에는 없던 라벨 동의어 추가
+    config = make_config(tmp_path)
+    store = DetailSnapshotStore.from_config(config['system']['crawler']['snapshots'], logger)
+    for n in range(1, 4):
+        html = build_detail_html(n).replace("<th scope='row'>문서번호</th>", "<th scope='row'>공문번호</th>")
+        store.put(list_data(n), html)
+    store.close()
+    field_config = dict(NuriDetailExtractor.FIELD_CONFIG)
+    field_config['doc_number'] = (["문서번호", "공문번호"], 50)
+    monkeypatch.setattr(NuriDetailExtractor, "FIELD_CONFIG", field_config)
+    storage = ListStorage()
+
+    # When
+    saved = SnapshotReparser(config).run(storage)
+
+    # Then
+    bids = [bid for batch in storage.batches for bid in batch]
+    assert saved == 3
+    assert [len(batch) for batch in storage.batches] == [2, 1]
+    assert [(b.notice_code, b.degree) for b in bids] == [(f"R26BK{n:08d}", "000") for n in range(1, 4)]
+    assert [b.detail_info.doc_number for b in bids] == [f"제2026-{n}호" for n in range(1, 4)]
+    assert all(b.list_fingerprint for b in bids)
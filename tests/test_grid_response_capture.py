@@ -0,0 +1,64 @@
+import os
+import sys
+import json
+import logging
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.crawlers.components.grid_response_capture import GridResponseCapture
+from src.crawlers.components.nuri_parser import NuriParser
+from src.crawlers.components.known_index import KnownNoticeIndex
+
+FIELDS = {
+    "notice_code": "{bidPbancNo}-{bidPbancOrd}",
+    "title": "{bidPbancNm}",
+    "process_type": "{bidPbancPrcsSttsNm}",
+    "category": "{bidClsfNm}",
+    "date_posted": "{pbancPstgDt}",
+}
+
+def make_capture(**config) -> GridResponseCapture:
+    return GridResponseCapture({"fields": FIELDS, **config}, logging.getLogger("test"))
+
+def test_json_payload_to_list_data():
+    """JSON 응답의 레코드가 목록 데이터 형태로 변환되고 원본 컬럼이 보존되어야 한다."""
+    # Given
+    body = json.dumps({
+        "dlSrchParam": {"pageNo": 1},
+        "dlBidPbancLstM": [
+            {"bidPbancNo": "R26BK0001", "bidPbancOrd": "000", "bidPbancNm": " 승강기 교체 공사 ",
+             "bidPbancPrcsSttsNm": "등록공고", "bidClsfNm": "공사", "pbancPstgDt": "2026/02/03", "rgnLmtYn": "Y"}
+        ]
+    })
+
+    # When
+    rows = make_capture().parse_payload(body)
+
+    # Then
+    assert len(rows) == 1
+    row = rows[0]
+    assert row["notice_code"] == "R26BK0001-000"
+    assert row["title"] == "승강기 교체 공사"
+    assert row["date_posted"] == "2026-02-03"
+    assert row["link"] is None
+    assert row["columns"]["rgnLmtYn"] == "Y", "매핑하지 않은 응답 컬럼도 보존되어야 한다."
+    basic = NuriParser.to_basic_data(row)
+    assert "columns" not in basic
+    dom_row = {k: row[k] for k in NuriParser.empty_list_data()}
+    assert KnownNoticeIndex.fingerprint(basic) == KnownNoticeIndex.fingerprint(NuriParser.to_basic_data(dom_row))
+
+def test_xml_payload_with_list_key():
+    """XML 응답은 list_key 하위의 반복 요소를 레코드로 읽어야 한다."""
+    body = """<root><dlBidPbancLstM>
+        <row><bidPbancNo>R26BK0002</bidPbancNo><bidPbancOrd>001</bidPbancOrd><bidPbancNm>도색</bidPbancNm></row>
+        <row><bidPbancNo>R26BK0003</bidPbancNo><bidPbancOrd></bidPbancOrd><bidPbancNm>방수</bidPbancNm></row>
+    </dlBidPbancLstM></root>"""
+
+    rows = make_capture(list_key="dlBidPbancLstM").parse_payload(body)
+
+    assert [r["notice_code"] for r in rows] == ["R26BK0002-001", "R26BK0003"]
+
+def test_unrecognized_payload_returns_none():
+    """목록을 찾지 못하면 None을 반환하여 DOM 파싱으로 대체되어야 한다."""
+    assert make_capture().parse_payload(json.dumps({"result": "ok"})) is None
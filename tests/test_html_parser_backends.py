@@ -0,0 +1,115 @@
+import os
+import sys
+import logging
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.crawlers.components.detail_html import parse_detail_html, available_backends, resolve_backend
+from src.crawlers.components.detail_batch_parser import DetailBatchParser
+from src.crawlers.components.nuri_detail_extractor import NuriDetailExtractor
+from src.crawlers.components.snapshot_store import DetailSnapshotStore
+from benchmarks.fixtures import build_detail_corpus, VARIANTS
+
+logger = logging.getLogger("test")
+
+BASE_URL = "https://nuri.g2b.go.kr/nn/nnb/nnba/"
+CORPUS = build_detail_corpus(len(VARIANTS) * 2)
+
+
+def list_data(n: int) -> dict:
+    return {'title': f'목록 제목 {n}', 'notice_code_full': f'R26BK{n:08d}-000', 'date_posted': '2026-02-03'}
+
+
+@pytest.fixture(scope="module")
+def browser_page():
+    """브라우저 기준 결과 비교용 페이지 (Chromium이 없으면 건너뜀)"""
+    from playwright.sync_api import sync_playwright
+    pw = sync_playwright().start()
+    try:
+        browser = pw.chromium.launch(headless=True)
+    except Exception as e:
+        pw.stop()
+        pytest.skip(f"Chromium is not available: {e}")
+    page = browser.new_page()
+    yield page
+    browser.close()
+    pw.stop()
+
+
+def test_unknown_or_missing_backend_is_rejected():
+    # Then
+    assert "stdlib" in available_backends()
+    assert resolve_backend("auto") in available_backends()
+    with pytest.raises(ValueError):
+        resolve_backend("selectolax")
+
+
+@pytest.mark.skipif("lxml" not in available_backends(), reason="lxml is not installed")
+def test_lxml_matches_stdlib_on_corpus():
+    # When / Then: 모든 변형에서 두 백엔드 결과 동일
+    for n, html in enumerate(CORPUS, 1):
+        lxml_result = parse_detail_html(html, BASE_URL, backend="lxml")
+        stdlib_result = parse_detail_html(html, BASE_URL, backend="stdlib")
+        assert lxml_result == stdlib_result, f"variant {VARIANTS[n % len(VARIANTS)]}"
+
+
+def test_corpus_edge_cases():
+    # Given
+    results = {VARIANTS[n % len(VARIANTS)]: parse_detail_html(html, BASE_URL, backend="stdlib")
+               for n, html in enumerate(CORPUS[:len(VARIANTS)], 1)}
+
+    # Then
+    pairs = {name: dict(r['pairs']) for name, r in results.items()}
+    assert pairs['nested']['담당자'] == "홍길동\n(02-000-0000)"
+    assert pairs['hidden']['업종제한'] == "실내건축공사업"
+    assert pairs['entities']['현장설명회장소'] == "관리사무소\xa0회의실 & 로비 <1층>"
+    assert pairs['comment']['계약방법'] == "제한경쟁"
+    assert '안내' not in pairs['orphan_th']
+    assert pairs['whitespace']['\n  입찰방식  '] == "전자입찰"
+    assert results['no_title']['title'] is None
+    assert results['multi_attach']['attachment_urls'][2:] == [
+        "https://nuri.g2b.go.kr/files/5/extra.hwp", "https://nuri.g2b.go.kr/nn/nnb/nnba/files/5/rel.zip"]
+    assert results['hrefs']['attachment_urls'] == ["https://example.com/a/6.pdf", ""]
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_extract_from_html_matches_browser(browser_page, backend):
+    # Given
+    extractor = NuriDetailExtractor(logger)
+
+    for n, html in enumerate(CORPUS[:len(VARIANTS)], 1):
+        # 상대 링크가 같은 절대 주소가 되도록 BASE_URL 에서 응답
+        browser_page.route(f"{BASE_URL}**", lambda route, body=html: route.fulfill(
+            status=200, content_type="text/html; charset=utf-8", body=body))
+        browser_page.goto(f"{BASE_URL}detail")
+        browser_page.unroute(f"{BASE_URL}**")
+
+        # When
+        expected = extractor.extract_all(browser_page, list_data(n))
+        actual = extractor.extract_from_html(html, list_data(n), browser_page.url, backend=backend)
+
+        # Then
+        assert actual == expected, f"variant {VARIANTS[n % len(VARIANTS)]}"
+
+
+def test_batch_parser_matches_in_process(tmp_path):
+    # Given: 스냅샷 저장소
+    store = DetailSnapshotStore(str(tmp_path), logger)
+    for n, html in enumerate(CORPUS, 1):
+        store.put(list_data(n), html, BASE_URL)
+    snapshots = store.latest()
+    store.close()
+    extractor = NuriDetailExtractor(logger)
+    expected = [extractor.extract_from_html(html, list_data(n), BASE_URL) for n, html in enumerate(CORPUS, 1)]
+
+    # When: 2개 프로세스, 묶음 5건
+    parser = DetailBatchParser(logger, workers=2, chunk_size=5)
+    results = list(parser.parse(str(tmp_path), snapshots))
+
+    # Then: 입력 순서 유지, 결과 동일
+    assert [s.notice_code for s, _ in results] == [s.notice_code for s in snapshots]
+    assert [raw for _, raw in results] == expected
+    assert parser.failed == 0
@@ -0,0 +1,43 @@
+import os
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.crawlers.components.known_index import KnownNoticeIndex
+
+def make_list_data(**overrides) -> dict:
+    data = {
+        "notice_code_full": "R26BK0001-000",
+        "title": "승강기 교체 공사",
+        "process_type": "등록공고",
+        "category": "공사",
+        "date_posted": "2026/02/03",
+    }
+    data.update(overrides)
+    return data
+
+def test_skip_only_unchanged_known_rows():
+    """저장된 지문과 같은 행만 건너뛰고, 변경/신규 행은 수집 대상이어야 한다."""
+    # Given
+    stored = make_list_data()
+    index = KnownNoticeIndex({("R26BK0001", "000"): KnownNoticeIndex.fingerprint(stored)})
+
+    # When
+    unchanged = index.should_fetch(make_list_data())
+    changed = index.should_fetch(make_list_data(process_type="변경공고"))
+    new = index.should_fetch(make_list_data(notice_code_full="R26BK0002-000"))
+
+    # Then
+    assert (unchanged, changed, new) == (False, True, True)
+    assert index.summary() == {"skipped": 1, "fetched": 2, "changed": 1, "new": 1}
+
+def test_rows_without_stored_fingerprint_are_refetched():
+    """지문 컬럼이 비어 있는(이전 버전에서 저장된) 공고는 한 번 다시 수집해야 한다."""
+    # Given
+    index = KnownNoticeIndex({("R26BK0001", "000"): None})
+
+    # When / Then
+    assert index.should_fetch(make_list_data()) is True
+    index.remember(make_list_data())
+    assert index.should_fetch(make_list_data()) is False
@@ -0,0 +1,96 @@
+import os
+import sys
+import json
+import asyncio
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.utils.metrics import MetricsRegistry
+
+def test_timed_records_sync_async_and_errors():
+    """동기/비동기 함수 소요 시간과 예외 횟수가 기록되어야 한다."""
+    # Given
+    metrics = MetricsRegistry(buckets=(0.5, 1.0))
+
+    @metrics.timed("navigator.go_back_to_list")
+    def go_back():
+        return "ok"
+
+    @metrics.timed("parser.parse_detail")
+    async def parse():
+        raise ValueError("broken")
+
+    # When
+    assert go_back() == "ok"
+    with pytest.raises(ValueError):
+        asyncio.run(parse())
+
+    # Then
+    stages = metrics.summary()['stages']
+    assert stages['navigator.go_back_to_list']['count'] == 1
+    assert stages['parser.parse_detail']['count'] == 1
+    assert metrics.summary()['counters'] == {'parser.parse_detail.errors': 1}
+
+def test_prometheus_histogram_is_cumulative():
+    """버킷 값은 누적이고 +Inf 버킷은 전체 건수와 같아야 한다."""
+    # Given
+    metrics = MetricsRegistry(buckets=(0.5, 1.0))
+    for seconds in (0.1, 0.7, 0.8, 3.0):
+        metrics.observe("storage.save", seconds)
+    metrics.inc("notices_collected", 4)
+
+    # When
+    text = metrics.to_prometheus()
+
+    # Then
+    assert 'nuri_stage_seconds_bucket{stage="storage.save",le="0.5"} 1' in text
+    assert 'nuri_stage_seconds_bucket{stage="storage.save",le="1.0"} 3' in text
+    assert 'nuri_stage_seconds_bucket{stage="storage.save",le="+Inf"} 4' in text
+    assert 'nuri_stage_seconds_count{stage="storage.save"} 4' in text
+    assert 'nuri_events_total{event="notices_collected"} 4' in text
+    assert metrics.summary()['stages']['storage.save']['p50'] == 1.0
+
+def test_export_and_disabled(tmp_path):
+    """export는 두 파일을 쓰고, 비활성화하면 아무것도 기록하지 않아야 한다."""
+    # Given
+    metrics = MetricsRegistry()
+    metrics.observe("storage.save", 0.2)
+    prom, summary = tmp_path / "m" / "crawl.prom", tmp_path / "m" / "run.json"
+
+    # When
+    metrics.export(str(prom), str(summary), extra={'status': 'done'})
+    metrics.enabled = False
+    metrics.observe("storage.save", 0.2)
+    metrics.inc("notices_collected")
+
+    # Then
+    assert prom.read_text().startswith("# HELP nuri_stage_seconds")
+    data = json.loads(summary.read_text())
+    assert data['status'] == 'done'
+    assert data['stages']['storage.save']['count'] == 1
+    assert metrics.summary()['stages']['storage.save']['count'] == 1
+    assert metrics.summary()['counters'] == {}
+
+def test_snapshot_merge_across_registries():
+    """작업 프로세스 snapshot()을 합치면 카운터와 히스토그램이 더해져야 한다."""
+    # Given: 부모와 구간 프로세스 레지스트리
+    parent, child = MetricsRegistry(buckets=(0.5, 1.0)), MetricsRegistry(buckets=(0.5, 1.0))
+    parent.inc("notices_collected", 2)
+    parent.observe("parser.parse_detail", 0.2)
+    child.inc("notices_collected", 3)
+    child.inc("rows.gave_up")
+    child.observe("parser.parse_detail", 2.0)
+
+    # When
+    parent.merge(child.snapshot())
+
+    # Then
+    summary = parent.summary()
+    assert summary['counters'] == {'notices_collected': 5, 'rows.gave_up': 1}
+    stage = summary['stages']['parser.parse_detail']
+    assert (stage['count'], stage['sum'], stage['max']) == (2, 2.2, 2.0)
+    assert 'nuri_stage_seconds_bucket{stage="parser.parse_detail",le="+Inf"} 2' in parent.to_prometheus()
+    with pytest.raises(ValueError):
+        parent.merge(MetricsRegistry(buckets=(1.0,)).snapshot())
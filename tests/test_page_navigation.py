@@ -0,0 +1,57 @@
+import os
+import sys
+import logging
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.crawlers.nuri_crawler import NuriCrawler
+from src.crawlers.components.nuri_navigator import PageMoveFailed
+
+
+class FakeNav:
+    """다음 페이지 이동 확인이 시간 초과되고, 목표 페이지 이동은 reachable_after번째 시도부터 성공하는 목록 화면"""
+    def __init__(self, reachable_after: int):
+        self.reachable_after = reachable_after
+        self.jumps = 0
+    def move_to_next_page(self, current_page):
+        raise PageMoveFailed(f"page {current_page + 1} change was not confirmed in time")
+    def is_on_list(self):
+        return True
+    def jump_to_page(self, target_page):
+        self.jumps += 1
+        return self.jumps >= self.reachable_after
+
+
+class FakeWaits:
+    def loading_done(self, page):
+        return True
+
+
+def make_crawler(nav: FakeNav) -> NuriCrawler:
+    crawler = NuriCrawler.__new__(NuriCrawler)
+    crawler.config = {'system': {'playwright': {'max_retries': 3}}}
+    crawler.logger = logging.getLogger("test")
+    crawler.nav, crawler.waits, crawler.page = nav, FakeWaits(), None
+    return crawler
+
+
+def test_slow_page_move_is_retried_not_treated_as_last_page():
+    # Given: 이동 확인 시간 초과, 두 번째 재이동에서 도착
+    nav = FakeNav(reachable_after=2)
+
+    # When / Then: 마지막 페이지(False)가 아니라 이동 성공
+    assert make_crawler(nav)._move_to_next_page(4) is True
+    assert nav.jumps == 2
+
+
+def test_page_move_that_never_succeeds_raises():
+    # Given: 끝내 도착하지 못함
+    nav = FakeNav(reachable_after=99)
+
+    # When / Then: 예외로 수집을 중단 (체크포인트 정리 없이)
+    with pytest.raises(RuntimeError):
+        make_crawler(nav)._move_to_next_page(4)
+    assert nav.jumps == 3
@@ -0,0 +1,81 @@
+import os
+import sys
+import logging
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.crawlers.components.rate_controller import RateController
+
+logger = logging.getLogger("test")
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def make(clock, **config):
+    base = {'initial_rate': 2.0, 'min_rate': 0.5, 'max_rate': 4.0, 'burst': 1,
+            'increase': 0.5, 'decrease': 0.5, 'healthy_latency': 1.0, 'cooldown': 5.0}
+    return RateController({**base, **config}, logger, clock=clock)
+
+def test_token_bucket_spaces_requests():
+    """토큰이 없으면 현재 속도 기준 간격만큼 기다려야 한다."""
+    # Given
+    clock = FakeClock()
+    rate = make(clock)
+
+    # When / Then: 첫 요청은 버스트, 이후는 1/rate초 간격
+    assert rate.reserve() == 0.0
+    assert rate.reserve() == 0.5
+    assert rate.reserve() == 1.0
+    clock.now = 10.0
+    assert rate.reserve() == 0.0
+
+def test_additive_increase_on_healthy_responses():
+    """빠른 성공은 속도를 올리고, 느린 성공은 유지하며, 상한을 넘지 않아야 한다."""
+    # Given
+    rate = make(FakeClock())
+
+    # When
+    rate.on_success(0.2)
+    increased = rate.rate
+    rate.on_success(2.0)
+
+    # Then
+    assert increased == 2.25
+    assert rate.rate == increased
+    assert rate.state == "hold"
+
+    for _ in range(1000):
+        rate.on_success(0.1)
+    assert rate.rate == 4.0
+
+def test_multiplicative_backoff_with_cooldown():
+    """장애 신호는 속도를 절반으로 줄이되, cooldown 안의 연속 장애는 한 번만 반영해야 한다."""
+    # Given
+    clock = FakeClock()
+    rate = make(clock)
+
+    # When
+    rate.on_response(429, 0.1)
+    rate.on_failure("timeout:detail")
+    after_burst = rate.rate
+    clock.now = 6.0
+    rate.on_response(503, 0.1)
+    clock.now = 12.0
+    rate.on_failure("dialog")
+
+    # Then
+    assert after_burst == 1.0
+    assert rate.rate == 0.5
+    s = rate.snapshot()
+    assert s['state'] == "backoff"
+    assert s['backoffs'] == 3
+    assert s['failures'] == 4
+    assert s['last_failure'] == "dialog"
+
+def test_disabled_controller_never_waits():
+    rate = RateController({'enabled': False}, logger)
+    assert all(rate.reserve() == 0.0 for _ in range(10))
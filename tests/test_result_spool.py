@@ -0,0 +1,114 @@
+import os
+import sys
+import logging
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.core.base_storage import BaseStorage
+from src.core.storage_sink import StorageSink
+from src.crawlers.components.result_spool import ResultSpool
+from src.models.bid_notice import BidNotice, BidAttachment
+
+logger = logging.getLogger("test")
+
+class ListStorage(BaseStorage):
+    def __init__(self):
+        self.batches = []
+    def connect(self): pass
+    def save(self, data): self.batches.append(list(data))
+    def get_last_checkpoint(self): return None
+    def close(self): pass
+
+def make_bid(code: str) -> BidNotice:
+    return BidNotice(notice_code=code, degree="000", title=f"공고 {code}", status="게시")
+
+def test_checkpoint_and_notices_survive_restart(tmp_path):
+    """체크포인트와 저장 전 공고는 재시작 후에도 남아 있어야 한다."""
+    # Given
+    path = str(tmp_path / "spool.db")
+    spool = ResultSpool(path, logger)
+    spool.save(3, 1, [make_bid("R1")])
+    spool.save(3, 2, [])
+    spool.save(3, 3, [make_bid("R2")])
+    spool.close()
+
+    # When
+    restarted = ResultSpool(path, logger)
+
+    # Then
+    assert restarted.load() == (3, 3)
+    assert [bid.notice_code for bid in restarted.pending()] == ["R1", "R2"]
+
+def test_saved_notices_are_removed_and_replayed_once(tmp_path):
+    """저장이 확인된 공고만 스풀에서 지워지고, 나머지만 재생되어야 한다."""
+    # Given
+    path = str(tmp_path / "spool.db")
+    spool = ResultSpool(path, logger)
+    bids = [make_bid(f"R{i}") for i in range(5)]
+    for i, bid in enumerate(bids):
+        spool.save(1, i + 1, [bid])
+    storage = ListStorage()
+    sink = StorageSink(storage, {"batch_size": 2, "flush_interval": 3600}, on_saved=spool.mark_flushed)
+
+    # When: 두 배치만 저장된 뒤 중단
+    for bid in bids[:4]:
+        sink.add(bid)
+    spool.close()
+    restarted = ResultSpool(path, logger)
+
+    # Then
+    assert [bid.notice_code for bid in restarted.pending()] == ["R4"]
+
+def test_clear_keeps_unsaved_notices_and_compact(tmp_path):
+    """정상 종료 시 체크포인트만 지우고, 모두 저장된 뒤 compact하면 스풀이 비어야 한다."""
+    # Given
+    spool = ResultSpool(str(tmp_path / "spool.db"), logger)
+    spool.save(2, 5, [make_bid("R1")])
+
+    # When
+    spool.clear()
+
+    # Then
+    assert spool.load() == (1, 0)
+    pending = spool.pending()
+    assert len(pending) == 1
+
+    spool.mark_flushed(pending)
+    spool.compact()
+    assert spool.count() == 0
+
+def test_flush_is_acknowledged_by_spool_seq_only(tmp_path):
+    """저장 확인은 save()가 반환한 행 번호로만 처리되고, 스풀에 없던 공고는 아무 행도 지우지 않아야 한다."""
+    # Given
+    spool = ResultSpool(str(tmp_path / "spool.db"), logger)
+    spooled = make_bid("R1")
+    seqs = spool.save(1, 1, [spooled])
+
+    # When: 스풀에 기록되지 않은 다른 공고의 저장 확인
+    spool.mark_flushed([make_bid("R2"), make_bid("R1")])
+
+    # Then
+    assert spooled.spool_seq == seqs[0]
+    assert spool.count() == 1
+    spool.mark_flushed([spooled])
+    assert spool.count() == 0
+
+def test_refresh_records_attachment_provenance(tmp_path):
+    """기록 후 채워진 첨부파일 정보는 refresh()로 스풀에 반영되어 재시작 시 함께 재생되어야 한다."""
+    # Given
+    path = str(tmp_path / "spool.db")
+    spool = ResultSpool(path, logger)
+    bid = make_bid("R1")
+    bid.attachments = [BidAttachment(file_name="a.pdf", download_url="http://x/a.pdf")]
+    spool.save(1, 1, [bid])
+
+    # When
+    bid.attachments[0].sha256 = "ab" * 32
+    spool.refresh([bid])
+    spool.close()
+
+    # Then
+    replayed = ResultSpool(path, logger).pending()
+    assert replayed[0].attachments[0].sha256 == "ab" * 32
+    assert "spool_seq" not in replayed[0].model_dump_json()
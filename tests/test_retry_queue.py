@@ -0,0 +1,100 @@
+import os
+import sys
+import logging
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.crawlers.components.retry_queue import RowRetryQueue
+from src.crawlers.components.crawl_state import CrawlStateStore
+from src.crawlers.components.result_spool import ResultSpool
+
+logger = logging.getLogger("test")
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def row(code: str):
+    return {'notice_code_full': code, 'title': code}
+
+def test_exponential_backoff_and_due():
+    """실패할 때마다 대기 시간이 두 배가 되고, 기한이 된 행만 꺼내야 한다."""
+    # Given
+    clock = FakeClock()
+    queue = RowRetryQueue(max_retries=3, backoff=1.0, backoff_max=3.0, logger=logger, clock=clock)
+
+    # When
+    queue.push(1, 4, row("A-000"))
+    queue.push(2, 0, row("B-000"))
+
+    # Then
+    assert queue.due() == []
+    clock.now = 1.0
+    assert [e.key for e in queue.due(page=1)] == ["A-000"]
+
+    queue.push(1, 4, row("A-000"))
+    assert queue.wait_time(queue.entries(1)) == 2.0
+    queue.push(1, 4, row("A-000"))
+    assert queue.wait_time(queue.entries(1)) == 3.0  # 상한
+    assert queue.pages() == [1, 2]
+
+def test_gives_up_after_max_retries():
+    """max_retries번 재시도해도 실패하면 대기열에서 빠지고 포기로 기록되어야 한다."""
+    # Given
+    queue = RowRetryQueue(max_retries=2, backoff=0, backoff_max=0, logger=logger, clock=FakeClock())
+
+    # When
+    results = [queue.push(1, 0, row("A-000")) for _ in range(3)]
+
+    # Then
+    assert results == [True, True, False]
+    assert len(queue) == 0
+    assert queue.summary() == {'recovered': 0, 'gave_up': 1, 'pending': 0}
+
+def test_resolve_counts_recovered_rows():
+    queue = RowRetryQueue(max_retries=3, backoff=0, backoff_max=0, logger=logger, clock=FakeClock())
+    queue.push(1, 0, row("A-000"))
+    queue.resolve("A-000")
+    queue.resolve("unknown")
+    assert queue.summary() == {'recovered': 1, 'gave_up': 0, 'pending': 0}
+
+@pytest.mark.parametrize("store_cls, file_name", [(CrawlStateStore, "state.json"), (ResultSpool, "spool.db")])
+def test_pending_retries_survive_restart(tmp_path, store_cls, file_name):
+    """재시도 대기 행은 체크포인트와 함께 기록되어 재시작 후 실패 횟수와 함께 복원되어야 한다."""
+    # Given: 두 행 실패 (A는 두 번)
+    path = str(tmp_path / file_name)
+    store = store_cls(path, logger)
+    queue = RowRetryQueue(max_retries=3, backoff=60.0, backoff_max=60.0, logger=logger)
+    queue.push(2, 4, row("A-000"), "timeout")
+    queue.push(2, 4, row("A-000"), "timeout")
+    queue.push(3, 1, row("B-000"))
+    store.save(3, 2, retries=queue.take_changes())
+    queue.resolve("B-000")
+    store.save(3, 3, retries=queue.take_changes())
+    # 대기열 변경이 없으면 기록된 행 유지
+    assert queue.take_changes() is None
+    store.save(4, 0, retries=queue.take_changes())
+    if hasattr(store, "close"):
+        store.close()
+
+    # When: 재시작
+    restarted = store_cls(path, logger)
+    restored = RowRetryQueue(max_retries=3, backoff=60.0, backoff_max=60.0, logger=logger)
+    assert restarted.load() == (4, 0)
+    restored.restore(restarted.load_retries())
+
+    # Then: 남은 행만 바로 재시도 대상, 실패 횟수 유지
+    [entry] = restored.due()
+    assert (entry.key, entry.page, entry.index, entry.failures, entry.error) == ("A-000", 2, 4, 2, "timeout")
+    assert entry.list_data == row("A-000")
+    assert restored.push(2, 4, row("A-000")) is True
+    assert restored.push(2, 4, row("A-000")) is False, "재시작 전 실패 횟수까지 합쳐 포기해야 한다."
+
+    # When / Then: 정상 종료 시 함께 삭제
+    restarted.clear()
+    assert restarted.load_retries() == []
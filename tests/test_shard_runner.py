@@ -0,0 +1,95 @@
+import os
+import sys
+import logging
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.core.shard_runner import plan_date_shards, ShardManifest
+
+def test_plan_day_and_week_shards():
+    """날짜 범위가 겹치지 않는 일/주 단위 구간으로 나뉘고 마지막 구간은 종료일에서 잘려야 한다."""
+    # When
+    days = plan_date_shards("20260201", "20260203", "day")
+    weeks = plan_date_shards("20260201", "20260210", "week")
+
+    # Then
+    assert [s['id'] for s in days] == ["20260201-20260201", "20260202-20260202", "20260203-20260203"]
+    assert [(s['start_date'], s['end_date']) for s in weeks] == [("20260201", "20260207"), ("20260208", "20260210")]
+
+def test_manifest_keeps_progress_for_same_range(tmp_path):
+    """같은 범위로 다시 열면 완료 구간 상태가 유지되고, 범위가 바뀌면 새로 시작해야 한다."""
+    # Given
+    path = str(tmp_path / "shards.json")
+    shards = plan_date_shards("20260201", "20260202", "day")
+    manifest = ShardManifest(path, logging.getLogger("test"))
+    manifest.load("20260201-20260202:day", shards)
+    manifest.mark("20260201-20260201", "done", count=3)
+    manifest.mark("20260202-20260202", "failed", error="timeout")
+
+    # When
+    resumed = ShardManifest(path, logging.getLogger("test"))
+    resumed.load("20260201-20260202:day", shards)
+    other = ShardManifest(path, logging.getLogger("test"))
+    other.load("20260201-20260202:week", shards)
+
+    # Then
+    assert resumed.status("20260201-20260201") == "done"
+    assert resumed.status("20260202-20260202") == "failed"
+    assert other.status("20260201-20260201") == "pending"
+
+class PagedCrawler:
+    """페이지마다 체크포인트를 남기고, 표시 파일이 없으면 2페이지 뒤에 한 번 실패하는 크롤러"""
+    def __init__(self, config):
+        from src.crawlers.components.crawl_state import CrawlStateStore
+        crawler = config['system']['crawler']
+        self.state = CrawlStateStore(crawler['state_file'], logging.getLogger("test"))
+        self.marker = crawler['fail_marker']
+    def set_known_index(self, known): pass
+    def run(self):
+        from src.models.bid_notice import BidNotice
+        from src.utils.metrics import METRICS
+        page, _ = self.state.load()
+        for p in range(page, 5):
+            METRICS.inc("rows.test")
+            yield BidNotice(notice_code=f"P{p}", degree="000", title=f"공고 {p}", status="게시")
+            self.state.save(p + 1, 0)
+            if p == 2 and not os.path.exists(self.marker):
+                open(self.marker, "w").close()
+                raise RuntimeError("browser crashed")
+
+def test_failed_shard_retry_collects_every_row(tmp_path, monkeypatch):
+    """구간이 중간에 실패하면 재시도는 처음부터 수집하여 앞 페이지 행도 저장해야 한다."""
+    from src.core.base_storage import BaseStorage
+    from src.core.container import AppContainer
+    from src.core.shard_runner import ShardRunner
+    from src.utils.metrics import METRICS
+
+    class ListStorage(BaseStorage):
+        def __init__(self): self.saved = []
+        def connect(self): pass
+        def save(self, data): self.saved.extend(data)
+        def get_last_checkpoint(self): return None
+        def close(self): pass
+
+    # Given: 구간 1개, 첫 시도는 2페이지까지 체크포인트를 남기고 실패
+    monkeypatch.setattr(AppContainer, "create_crawler", lambda self: PagedCrawler(self.config))
+    config = {
+        'search': {'date': {'mode': 'manual', 'start_date': '20260201', 'end_date': '20260201'}},
+        'system': {'playwright': {'max_retries': 2},
+                   'crawler': {'fail_marker': str(tmp_path / "failed"),
+                               'sharding': {'workers': 1, 'state_dir': str(tmp_path / "states"),
+                                            'manifest_file': str(tmp_path / "shards.json")}}},
+    }
+    storage = ListStorage()
+    METRICS.reset()
+
+    # When
+    saved = ShardRunner(config, logging.getLogger("test")).run(storage)
+
+    # Then: 재시도가 1페이지부터 다시 수집, 체크포인트 파일은 남지 않음
+    assert saved == 4
+    assert [b.notice_code for b in storage.saved] == ["P1", "P2", "P3", "P4"]
+    assert os.listdir(tmp_path / "states") == []
+    # 성공한 구간 프로세스의 계측이 부모 레지스트리에 합산됨
+    assert METRICS.summary()['counters']['rows.test'] == 4
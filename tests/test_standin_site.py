@@ -0,0 +1,82 @@
+import os
+import sys
+import json
+import logging
+import urllib.request
+
+import pytest
+import yaml
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from benchmarks.standin_site import StandInSite, LIST_PATH, DETAIL_PATH
+from src.crawlers.components.detail_replay import RecordedEndpoint, DetailReplayClient
+from src.crawlers.components.nuri_detail_extractor import NuriDetailExtractor
+from src.crawlers.components.nuri_navigator import PAGELIST_ID
+
+ROOT = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+
+
+@pytest.fixture
+def site():
+    with StandInSite(notices=25, latency_ms=0, jitter_ms=0) as s:
+        yield s
+
+
+def post(url: str, body: dict) -> dict:
+    req = urllib.request.Request(url, data=json.dumps(body).encode(), headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=5) as resp:
+        return json.loads(resp.read())
+
+
+def test_index_has_crawler_selectors(site):
+    # Given: 유사 사이트 시작 화면
+    with urllib.request.urlopen(site.url, timeout=5) as resp:
+        html = resp.read().decode("utf-8")
+
+    # Then: 크롤러가 의존하는 그리드/페이지 목록/헤더 구조 포함
+    assert "grdBidPbancList_body_table" in html
+    assert f"{PAGELIST_ID}_next_btn" in html
+    assert "mf_wfm_cntsHeader_spnHeaderTitle" in html
+    assert html.count("w2window_close") >= site.popups
+
+
+def test_list_api_pages(site):
+    # When: 10건씩 3페이지 조회
+    pages = [post(site.url + LIST_PATH, {"pageIndex": p, "recordCountPerPage": 10}) for p in (1, 2, 3)]
+
+    # Then: 전체 25건이 중복 없이 나뉘어 반환
+    codes = [row["bidPbancNo"] for page in pages for row in page["bidPbancList"]]
+    assert pages[0]["totalCount"] == 25
+    assert [len(p["bidPbancList"]) for p in pages] == [10, 10, 5]
+    assert len(set(codes)) == 25
+    assert site.counts["list"] == 3
+
+
+def test_replay_columns_match_detail_table(site):
+    # Given: system.yaml 기본 detail_replay 템플릿으로 재생
+    with open(os.path.join(ROOT, "config", "system.yaml"), encoding="utf-8") as f:
+        replay_config = yaml.safe_load(f)["crawler"]["detail_replay"]
+    replay_config.update(attachments_key="fileList", attachment_name="fileNm", attachment_url="fileUrl")
+    endpoint = RecordedEndpoint.from_request("POST", site.url + DETAIL_PATH, {"Content-Type": "application/json"},
+                                             json.dumps({"bidPbancNo": "R26BK00000003", "bidPbancOrd": "000"}),
+                                             "R26BK00000003", "000")
+    client = DetailReplayClient(endpoint, replay_config, logging.getLogger("test"))
+    list_data = {"title": "목록 제목", "notice_code_full": "R26BK00000007-000"}
+
+    try:
+        # When
+        raw = client.fetch(list_data)
+    finally:
+        client.close()
+
+    # Then: 화면 표를 라벨 매칭한 결과와 같은 값
+    rows = post(site.url + DETAIL_PATH, {"bidPbancNo": "R26BK00000007"})["dtlRows"]
+    from_table = NuriDetailExtractor.resolve_fields([(r["label"], r["value"]) for r in rows])
+    for key in replay_config["fields"]:
+        if key != "title":
+            assert raw[key] == from_table[key], key
+    assert raw["title"] == "[테스트] 승강기 교체 공사 7"
+    assert raw["attachment_names"] == ["첨부0_규격서_7.pdf", "첨부1_규격서_7.pdf"]
+    assert raw["attachment_urls"][0] == site.url + "/files/7/0.pdf"
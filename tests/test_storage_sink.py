@@ -0,0 +1,55 @@
+import os
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.core.base_storage import BaseStorage
+from src.core.storage_sink import StorageSink
+
+class ListStorage(BaseStorage):
+    """저장 호출을 배치 단위로 기록하는 메모리 저장소"""
+    def __init__(self):
+        self.batches = []
+    def connect(self): pass
+    def save(self, data): self.batches.append(list(data))
+    def get_last_checkpoint(self): return None
+    def close(self): pass
+
+def test_flush_by_batch_size_and_on_close():
+    """batch_size마다 저장하고, close()에서 남은 결과를 저장해야 한다."""
+    # Given
+    storage = ListStorage()
+    sink = StorageSink(storage, {"batch_size": 2, "flush_interval": 3600})
+
+    # When
+    for i in range(5):
+        sink.add(i)
+    sink.close()
+
+    # Then
+    assert storage.batches == [[0, 1], [2, 3], [4]]
+    assert sink.saved == 5
+
+def test_partial_results_saved_when_crawl_fails():
+    """수집 도중 예외가 나도 그때까지 yield된 결과는 저장되어야 한다."""
+    # Given
+    storage = ListStorage()
+    sink = StorageSink(storage, {"batch_size": 100})
+
+    def crawl():
+        yield "a"
+        yield "b"
+        raise RuntimeError("browser crashed")
+
+    # When
+    try:
+        for item in crawl():
+            sink.add(item)
+    except RuntimeError:
+        pass
+    finally:
+        sink.close()
+
+    # Then
+    assert storage.batches == [["a", "b"]]
@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+import threading
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.core.base_storage import BaseStorage
+from src.core.storage_writer import BackgroundStorageWriter
+
+class SlowStorage(BaseStorage):
+    """저장마다 지연이 있는 메모리 저장소 (fail=True면 저장 실패)"""
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.items = []
+        self.threads = set()
+    def connect(self): pass
+    def save(self, data):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("db down")
+        self.threads.add(threading.current_thread().name)
+        self.items.extend(data)
+    def get_last_checkpoint(self): return None
+    def close(self): pass
+
+def test_all_items_saved_off_the_caller_thread():
+    """close() 이후 모든 항목이 작업 스레드에서 저장되어 있어야 한다."""
+    # Given
+    storage = SlowStorage()
+    writer = BackgroundStorageWriter(storage, {"batch_size": 3, "queue_size": 2})
+
+    # When
+    for i in range(10):
+        writer.add(i)
+    writer.close()
+
+    # Then
+    assert sorted(storage.items) == list(range(10))
+    assert writer.saved == 10
+    assert threading.current_thread().name not in storage.threads
+
+def test_full_queue_blocks_producer():
+    """큐가 가득 차면 add()가 작업 스레드가 비울 때까지 대기해야 한다."""
+    # Given
+    storage = SlowStorage(delay=0.2)
+    writer = BackgroundStorageWriter(storage, {"batch_size": 1, "queue_size": 1})
+
+    # When
+    started = time.monotonic()
+    for i in range(4):
+        writer.add(i)
+    elapsed = time.monotonic() - started
+    writer.close()
+
+    # Then
+    assert elapsed >= 0.2
+    assert storage.items == [0, 1, 2, 3]
+
+def test_close_reports_save_error():
+    """저장 실패는 삼키지 않고 close()에서 다시 던져야 한다."""
+    # Given
+    writer = BackgroundStorageWriter(SlowStorage(fail=True), {"batch_size": 1})
+    writer.add("a")
+
+    # When / Then
+    with pytest.raises(RuntimeError):
+        writer.close()
+
+def test_add_fails_fast_and_failed_batch_is_retried():
+    """저장 오류 이후 add()는 바로 실패하고, 실패한 배치는 버리지 않고 close()에서 다시 저장해야 한다."""
+    # Given: 첫 저장이 실패하는 저장소
+    storage = SlowStorage(fail=True)
+    writer = BackgroundStorageWriter(storage, {"batch_size": 1, "flush_interval": 3600})
+    writer.add("a")
+    deadline = time.monotonic() + 5
+    while writer.error is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # When / Then: 오류 이후 추가는 거부
+    with pytest.raises(RuntimeError):
+        writer.add("b")
+
+    # When: 저장소 복구 후 종료
+    storage.fail = False
+    with pytest.raises(RuntimeError):
+        writer.close()
+
+    # Then: 실패했던 배치가 저장됨
+    assert storage.items == ["a"]
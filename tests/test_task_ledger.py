@@ -0,0 +1,143 @@
+import os
+import sys
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.core.shard_runner import plan_date_shards
+from src.storage.mysql_storage import MySqlStorage
+from src.storage.task_ledger import CrawlTaskLedger
+
+RUN_KEY = "20260201-20260203:day"
+
+@pytest.fixture
+def ledger(tmp_path):
+    """SQLite 파일 DB에 작업 원장 생성"""
+    storage = MySqlStorage(f"sqlite:///{tmp_path / 'ledger.db'}")
+    storage.connect()
+    ledger = CrawlTaskLedger(storage.engine, lease_seconds=60, max_attempts=2)
+    ledger.register(RUN_KEY, plan_date_shards("20260201", "20260203"))
+    yield ledger
+    storage.close()
+
+def expire(ledger, task_id):
+    """임대 만료 시뮬레이션"""
+    from datetime import timedelta
+    from sqlalchemy import update
+    from src.storage.task_ledger import TASK_TABLE
+    with ledger.engine.begin() as conn:
+        conn.execute(update(TASK_TABLE).where(TASK_TABLE.c.task_id == task_id)
+                     .values(lease_expires_at=ledger.db_now(conn) - timedelta(seconds=1)))
+
+def test_workers_claim_distinct_tasks(ledger):
+    """워커마다 서로 다른 구간을 가져가고, 다 가져가면 None이어야 한다."""
+    # When
+    claimed = [ledger.claim(RUN_KEY, f"w{i}") for i in range(4)]
+
+    # Then
+    ids = [task['task_id'] for task in claimed[:3]]
+    assert sorted(ids) == ["20260201-20260201", "20260202-20260202", "20260203-20260203"]
+    assert claimed[3] is None
+    assert ledger.progress(RUN_KEY) == {'running': 3}
+
+def test_register_is_idempotent(ledger):
+    """같은 범위를 다시 등록해도 진행 상태가 유지되어야 한다."""
+    # Given
+    task = ledger.claim(RUN_KEY, "w1")
+    ledger.complete(task['task_id'], "w1", 10)
+
+    # When
+    ledger.register(RUN_KEY, plan_date_shards("20260201", "20260203"))
+
+    # Then
+    assert ledger.progress(RUN_KEY) == {'done': 1, 'pending': 2}
+
+def test_expired_lease_is_reclaimed(ledger):
+    """임대가 만료된 작업은 다른 워커가 가져가고, 이전 소유자는 연장/완료할 수 없어야 한다."""
+    # Given
+    task = ledger.claim(RUN_KEY, "dead")
+    for i in range(2):
+        ledger.claim(RUN_KEY, f"w{i}")
+    assert ledger.claim(RUN_KEY, "w9") is None
+
+    # When
+    expire(ledger, task['task_id'])
+    reclaimed = ledger.claim(RUN_KEY, "w9")
+
+    # Then
+    assert reclaimed['task_id'] == task['task_id']
+    assert reclaimed['attempts'] == 2
+    assert not ledger.renew(task['task_id'], "dead")
+    assert not ledger.complete(task['task_id'], "dead")
+    assert ledger.renew(task['task_id'], "w9")
+    assert ledger.complete(task['task_id'], "w9", 5)
+
+def test_failed_task_retried_until_max_attempts(ledger):
+    """실패한 작업은 max_attempts까지만 다시 가져갈 수 있어야 한다."""
+    # Given: 첫 구간은 실패, 나머지는 완료
+    first, *others = [ledger.claim(RUN_KEY, "w1") for _ in range(3)]
+    ledger.fail(first['task_id'], "w1", "timeout")
+    for task in others:
+        ledger.complete(task['task_id'], "w1")
+
+    # When
+    retry = ledger.claim(RUN_KEY, "w2")
+    ledger.fail(retry['task_id'], "w2", "timeout")
+
+    # Then
+    assert retry['task_id'] == "20260201-20260201"
+    assert ledger.claim(RUN_KEY, "w3") is None
+    assert ledger.progress(RUN_KEY) == {'done': 2, 'failed': 1}
+
+def test_worker_stops_when_lease_is_lost(ledger, tmp_path, monkeypatch):
+    """수집 중 다른 워커가 임대를 가져가면 수집을 멈추고 저장/완료 기록을 하지 않아야 한다."""
+    import time
+    import logging
+    from sqlalchemy import update
+    from src.core.base_storage import BaseStorage
+    from src.core.container import AppContainer
+    from src.core.ledger_worker import LedgerWorker
+    from src.models.bid_notice import BidNotice
+    from src.storage.task_ledger import TASK_TABLE
+
+    class ListStorage(BaseStorage):
+        def __init__(self): self.saved = []
+        def connect(self): pass
+        def save(self, data): self.saved.extend(data)
+        def get_last_checkpoint(self): return None
+        def close(self): pass
+
+    class TakenOverCrawler:
+        """첫 행 뒤에 다른 워커가 임대를 가져감"""
+        def __init__(self, config): self.config = config
+        def set_known_index(self, known): pass
+        def run(self):
+            start = self.config['search']['date']['start_date']
+            for i in range(50):
+                yield BidNotice(notice_code=f"{start}-{i}", degree="000", title="공고", status="게시")
+                if i == 0:
+                    with ledger.engine.begin() as conn:
+                        conn.execute(update(TASK_TABLE).where(TASK_TABLE.c.status == 'running')
+                                     .values(owner="other"))
+                time.sleep(0.02)
+
+    # Given: 구간 1개짜리 범위
+    run_key = "20260210-20260210:day"
+    monkeypatch.setattr(AppContainer, "create_crawler", lambda self: TakenOverCrawler(self.config))
+    config = {
+        'search': {'date': {'mode': 'manual', 'start_date': '20260210', 'end_date': '20260210'}},
+        'system': {'crawler': {'sharding': {'state_dir': str(tmp_path / "states"),
+                                            'distributed': {'worker_id': "w1"}}}},
+    }
+    worker = LedgerWorker(config, ledger, logging.getLogger("test"))
+    worker.renew_interval = 0.05
+    storage = ListStorage()
+
+    # When
+    saved = worker.run(storage)
+
+    # Then: 저장 없음, 작업은 새 소유자가 계속 보유
+    assert saved == 0
+    assert storage.saved == []
+    assert ledger.progress(run_key) == {'running': 1}
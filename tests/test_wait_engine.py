@@ -0,0 +1,72 @@
+import os
+import sys
+import logging
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
+
+from src.crawlers.components.wait_engine import WaitEngine
+
+def make_engine(**config) -> WaitEngine:
+    return WaitEngine(config, logging.getLogger("test"))
+
+def test_timeout_uses_default_until_enough_samples():
+    """표본이 min_samples 미만이면 기본(또는 호출 측 지정) 타임아웃을 사용해야 한다."""
+    # Given
+    waits = make_engine(default_timeout=15000, min_samples=5)
+    for _ in range(4):
+        waits.stats.record("grid", 0.3)
+
+    # When / Then
+    assert waits.timeout_for("grid") == 15000
+    assert waits.timeout_for("grid", 5000) == 5000
+
+def test_timeout_adapts_to_observed_p95():
+    """표본이 충분하면 p95 × 배수를 min/max 범위 안에서 타임아웃으로 사용해야 한다."""
+    # Given
+    waits = make_engine(timeout_multiplier=3.0, min_timeout=2000, max_timeout=30000, min_samples=5)
+    for latency in [1.0] * 18 + [2.0] * 2:
+        waits.stats.record("page_change", latency)
+    for _ in range(5):
+        waits.stats.record("detail", 0.1)
+        waits.stats.record("search", 60.0)
+
+    # When / Then
+    assert waits.timeout_for("page_change") == 6000
+    assert waits.timeout_for("detail") == 2000
+    assert waits.timeout_for("search") == 30000
+
+def test_pacing_follows_p95_with_cap():
+    """페이싱 지연은 표본이 없으면 0, 있으면 p95 × 비율 (상한 pacing_max) 이어야 한다."""
+    # Given
+    waits = make_engine(pacing_ratio=0.5, pacing_max=2.0)
+
+    # When / Then
+    assert waits.pacing_for("page_change") == 0.0
+    waits.stats.record("page_change", 1.0)
+    assert waits.pacing_for("page_change") == 0.5
+    waits.stats.record("page_change", 10.0)
+    assert waits.pacing_for("page_change") == 2.0
+
+class TimeoutPage:
+    """wait_for_function이 항상 타임아웃되는 페이지"""
+    def wait_for_function(self, js, arg=None, timeout=None, polling=None):
+        raise TimeoutError("Timeout exceeded")
+
+def test_unpenalized_timeout_keeps_rate():
+    """결과가 없을 수도 있는 대기(같은 검색 결과)의 타임아웃은 요청 속도를 낮추지 않아야 한다."""
+    # Given
+    waits = make_engine(rate_control={'enabled': True, 'initial_rate': 2.0, 'cooldown': 0})
+    signature = (10, "R26BK0001")
+
+    # When: 검색 결과 변화 없음
+    changed = waits.grid_changed(TimeoutPage(), "tr", signature, name="search", penalize=False)
+
+    # Then: 타임아웃은 기록하되 속도는 유지
+    assert changed is False
+    assert waits.stats.summary()["search"]["timeouts"] == 1
+    assert waits.rate.rate == 2.0
+
+    # When / Then: 일반 대기의 타임아웃은 속도 감소
+    waits.grid_changed(TimeoutPage(), "tr", signature, name="page_change")
+    assert waits.rate.rate < 2.0